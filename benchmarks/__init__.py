@@ -0,0 +1 @@
+"""Microbenchmarks of the SDK's hot paths. Run them with `python -m benchmarks`."""
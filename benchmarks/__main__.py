@@ -0,0 +1,7 @@
+# Standard Library
+import sys
+
+# 1st Party Libraries
+from benchmarks.run import main
+
+sys.exit(main())
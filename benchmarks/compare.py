@@ -0,0 +1,79 @@
+"""
+Compare two runs of the benchmarks (see `python -m benchmarks`), e.g. of a base commit and of a change:
+
+    python -m benchmarks.compare base.json change.json [--threshold 0.1]
+
+Benchmarks are compared by their fastest run, which is the least sensitive to noise from other processes. Exits with
+status 1 if any benchmark is slower than the base by more than `threshold` (10% by default).
+"""
+
+# Standard Library
+import argparse
+import json
+import sys
+from typing import Dict, NamedTuple, Optional, Sequence
+
+# 1st Party Libraries
+from benchmarks.run import format_seconds
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description="Compare benchmark results.")
+    parser.add_argument("base", help="The results of the base commit.")
+    parser.add_argument("change", help="The results of the change.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="The slowdown ratio reported as a regression (default 0.1)."
+    )
+    args = parser.parse_args(argv)
+
+    base = _load(args.base)
+    change = _load(args.change)
+    for key in ("python", "implementation", "pydantic", "json_codec", "machine"):
+        base_value, change_value = base.metadata.get(key), change.metadata.get(key)
+        if base_value != change_value:
+            print(
+                f"warning: the runs differ in {key} ({base_value} vs {change_value}), their timings may not be "
+                "comparable",
+                file=sys.stderr,
+            )
+
+    base_times = base.min_times
+    change_times = change.min_times
+    regressions = []
+    print(f"{'benchmark':<48} {'base':>10} {'change':>10} {'ratio':>7}")
+    for name in sorted(base_times.keys() | change_times.keys()):
+        if name not in base_times or name not in change_times:
+            print(f"{name:<48} {'only in ' + ('change' if name in change_times else 'base'):>29}")
+            continue
+        ratio = change_times[name] / base_times[name]
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  slower"
+            regressions.append(name)
+        elif ratio < 1 / (1 + args.threshold):
+            flag = "  faster"
+        print(
+            f"{name:<48} {format_seconds(base_times[name]):>10} {format_seconds(change_times[name]):>10} "
+            f"{ratio:>6.2f}x{flag}"
+        )
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower by more than {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+class _Run(NamedTuple):
+    metadata: Dict[str, object]
+    # The fastest time of each benchmark, in seconds.
+    min_times: Dict[str, float]
+
+
+def _load(path: str) -> _Run:
+    with open(path, encoding="utf-8") as file:
+        results = json.load(file)
+    return _Run(results["metadata"], {name: benchmark["min"] for name, benchmark in results["benchmarks"].items()})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
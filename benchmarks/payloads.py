@@ -0,0 +1,178 @@
+"""Synthetic addresses and API results of realistic size, generated from a fixed seed so that every run is the same."""
+
+# Standard Library
+import copy
+import datetime
+import random
+from typing import Dict, List, Optional
+
+SEED = 0
+
+_STREETS = ("Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Pine St", "Elm St", "Washington Blvd", "Lake View Rd")
+_CITIES = (("Omaha", "NE", "681"), ("Phoenix", "AZ", "850"), ("Atlanta", "GA", "303"), ("Dallas", "TX", "752"))
+_STRUCTURE_TYPES = ("SINGLE_FAMILY", "TOWNHOUSE", "CONDO", "MULTI_FAMILY")
+_OWNERSHIP_PROFILES = ("<100", "100-1k", "1k-20k", "20k+")
+_LISTING_STATUSES = ("active", "removed", "closed")
+_RESPONSE_CODES = ("estimated_close_price", "estimated_close_date", "estimated_move_out_date")
+_EPOCH = datetime.date(2020, 1, 1)
+
+
+def addresses(num_addresses: int, *, duplicate_ratio: float = 0.0, seed: int = SEED) -> List[Dict[str, object]]:
+    """
+    Returns input addresses with unique tokens. A `duplicate_ratio` of them repeat an earlier address, with other
+    whitespace and case.
+    """
+    rng = random.Random(seed)
+    result: List[Dict[str, object]] = []
+    for index in range(num_addresses):
+        if result and rng.random() < duplicate_ratio:
+            address = dict(rng.choice(result))
+            address["street"] = f"  {str(address['street']).lower()} "
+        else:
+            address = _address(rng)
+        address["token"] = f"token-{index}"
+        result.append(address)
+    return result
+
+
+def property_details_results(num_results: int, *, seed: int = SEED) -> List[dict]:
+    rng = random.Random(seed)
+    return [{"token": f"token-{index}", "property_details": _property_details(rng)} for index in range(num_results)]
+
+
+def property_values_results(num_results: int, *, seed: int = SEED) -> List[dict]:
+    rng = random.Random(seed)
+    results = []
+    for index in range(num_results):
+        value = rng.randrange(80_000, 900_000)
+        results.append(
+            {
+                "token": f"token-{index}",
+                "property_value": {"value": value, "value_low": value * 9 // 10, "value_high": value * 11 // 10},
+            }
+        )
+    return results
+
+
+def rent_estimates_results(num_results: int, *, seed: int = SEED) -> List[dict]:
+    rng = random.Random(seed)
+    results = []
+    for index in range(num_results):
+        rent = rng.randrange(800, 4_000)
+        results.append(
+            {
+                "token": f"token-{index}",
+                "rent_estimate": {
+                    "estimated_rent": rent,
+                    "estimated_rent_low": rent * 9 // 10,
+                    "estimated_rent_high": rent * 11 // 10,
+                },
+            }
+        )
+    return results
+
+
+def rental_comps_results(
+    num_results: int, *, num_comps: int = 50, num_comp_properties: Optional[int] = None, seed: int = SEED
+) -> List[dict]:
+    """
+    Returns rental comps results with `num_comps` comps each, as returned by the API (dates are strings).
+
+    With `num_comp_properties`, the comps are properties drawn from a pool of that size, as in a dense neighborhood
+    where subjects share comps.
+    """
+    rng = random.Random(seed)
+    results: List[dict] = [
+        {
+            "token": f"token-{index}",
+            "api_code": 200,
+            "has_errors": False,
+            "subject_property_details": _property_details(rng),
+            "rental_comps": [_rental_comp(rng) for _ in range(num_comps)],
+        }
+        for index in range(num_results)
+    ]
+    if num_comp_properties is not None:
+        properties = [_property_details(rng) for _ in range(num_comp_properties)]
+        for result in results:
+            for comp in result["rental_comps"]:
+                # A copy, like each occurrence of the property in a decoded response.
+                comp["property_details"] = copy.deepcopy(rng.choice(properties))
+    return results
+
+
+def mixed_api_code_results(num_results: int, *, seed: int = SEED) -> List[dict]:
+    """Returns results with the mix of `api_code`s and legacy error messages seen in practice, without payloads."""
+    rng = random.Random(seed)
+    kinds = (
+        {"api_code": 200},
+        {"api_code": 204, "error_message": "No products found for address"},
+        {"error_message": None},
+        {"error_message": "No products found for address"},
+        {"error_message": "Could not generate similarity scores"},
+        {"error_message": "Cannot apply relative filtering on: bedrooms_total"},
+        {"error_message": "Internal error"},
+    )
+    weights = (70, 5, 10, 5, 4, 3, 3)
+    return [{"token": f"token-{index}", **rng.choices(kinds, weights)[0]} for index in range(num_results)]
+
+
+def _address(rng: random.Random) -> Dict[str, object]:
+    city, state, zip_prefix = rng.choice(_CITIES)
+    address: Dict[str, object] = {
+        "street": f"{rng.randrange(1, 20_000)} {rng.choice(_STREETS)}",
+        "city": city,
+        "state": state,
+        "postal_code": f"{zip_prefix}{rng.randrange(100):02d}",
+    }
+    if rng.random() < 0.1:
+        address["unit"] = f"Apt {rng.randrange(1, 400)}"
+    return address
+
+
+def _property_details(rng: random.Random) -> dict:
+    address = _address(rng)
+    living_area_sqft = rng.randrange(700, 4_500)
+    return {
+        **address,
+        "slug": f"{address['street']}-{address['city']}-{address['state']}".lower().replace(" ", "-"),
+        "above_grade_sqft": living_area_sqft,
+        "basement_sqft": rng.choice((None, 0, rng.randrange(300, 1_500))),
+        "bathrooms_full": rng.randrange(1, 5),
+        "bathrooms_half": rng.randrange(0, 3),
+        "bedrooms_total": rng.randrange(1, 7),
+        "garage_spaces": rng.randrange(0, 4),
+        "has_private_pool": rng.random() < 0.15,
+        "is_in_hoa": rng.random() < 0.3,
+        "latitude": round(rng.uniform(25.0, 48.0), 6),
+        "living_area_sqft": living_area_sqft,
+        "longitude": round(rng.uniform(-122.0, -71.0), 6),
+        "lot_size_sqft": rng.randrange(1_500, 40_000),
+        "num_exterior_stories": rng.randrange(1, 4),
+        "ownership_profile": rng.choice(_OWNERSHIP_PROFILES),
+        "structure_type": rng.choice(_STRUCTURE_TYPES),
+        "subdivision_name": rng.choice((None, "Lakeside", "Sunset Ridge", "Heritage Oaks")),
+        "year_built": rng.randrange(1900, 2024),
+    }
+
+
+def _rental_comp(rng: random.Random) -> dict:
+    close_price = rng.randrange(800, 4_000)
+    list_date = _EPOCH + datetime.timedelta(days=rng.randrange(1_500))
+    close_date = list_date + datetime.timedelta(days=rng.randrange(5, 90))
+    return {
+        "close_price": close_price,
+        "close_price_date": close_date.isoformat(),
+        "distance_miles": round(rng.uniform(0.05, 3.0), 3),
+        "dom": (close_date - list_date).days,
+        "initial_list_price": close_price + rng.randrange(0, 300),
+        "initial_list_price_date": list_date.isoformat(),
+        "last_event_date": close_date.isoformat(),
+        "last_list_price": close_price + rng.randrange(0, 100),
+        "listing_status": rng.choice(_LISTING_STATUSES),
+        "move_out_date": rng.choice((None, (close_date + datetime.timedelta(days=365)).isoformat())),
+        "ownership_profile": rng.choice(_OWNERSHIP_PROFILES),
+        "property_details": _property_details(rng),
+        "response_codes": rng.sample(_RESPONSE_CODES, rng.randrange(0, 3)),
+        "similarity_score": round(rng.random(), 4),
+    }
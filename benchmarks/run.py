@@ -0,0 +1,122 @@
+"""
+Runs the benchmarks and writes their results as JSON, to compare across commits with `python -m benchmarks.compare`.
+
+    python -m benchmarks -o results.json [-k PATTERN] [--src PATH]
+
+By default, the `open_exchange` package of this tree's `src` directory is benchmarked, so that each checkout measures
+its own code. Pass `--src` to benchmark another checkout's package with this suite, e.g. a `git worktree` of the base
+branch.
+"""
+
+# Standard Library
+import argparse
+import datetime
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional, Sequence
+
+_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the open_exchange benchmarks.")
+    parser.add_argument("-o", "--output", help="Write the results as JSON to this file.")
+    parser.add_argument("-k", "--filter", action="append", help="Only run benchmarks matching this glob pattern.")
+    parser.add_argument("--src", default=os.path.join(_REPO, "src"), help="The directory to import open_exchange from.")
+    parser.add_argument("--repeat", type=int, default=7, help="The number of timed runs of each benchmark.")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="The minimum number of seconds per timed run (default 0.2)."
+    )
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.abspath(args.src))
+    # 1st Party Libraries
+    from benchmarks.suite import benchmarks
+
+    results: Dict[str, Dict[str, object]] = {}
+    for benchmark in benchmarks():
+        if args.filter and not any(fnmatch.fnmatchcase(benchmark.name, pattern) for pattern in args.filter):
+            continue
+        times = _time(benchmark.fn, repeat=args.repeat, min_time=args.min_time)
+        results[benchmark.name] = {
+            "num_items": benchmark.num_items,
+            "times": times,
+            "min": min(times),
+            "median": statistics.median(times),
+        }
+        per_item = min(times) / benchmark.num_items
+        print(f"{benchmark.name:<48} {format_seconds(min(times)):>10} {format_seconds(per_item):>10}/item")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"metadata": _metadata(args.src), "benchmarks": results}, file, indent=2)
+            file.write("\n")
+    return 0
+
+
+def _time(fn: Callable[[], object], *, repeat: int, min_time: float) -> List[float]:
+    """Returns the seconds per call of `fn` in each of `repeat` runs of at least `min_time` seconds."""
+    # Keep the garbage collector enabled (unlike `timeit`'s default): parsing allocates many objects, and collecting
+    # them is part of its cost.
+    timer = timeit.Timer(fn, setup=gc.enable)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed * 10 < min_time else 2
+    return [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+
+
+def _metadata(src: str) -> Dict[str, object]:
+    # Third-Party Libraries
+    import pydantic
+
+    # 1st Party Libraries
+    import open_exchange
+    from open_exchange.codec import default_codec
+
+    return {
+        "commit": _git_commit(src),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "open_exchange": open_exchange.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pydantic": pydantic.VERSION,
+        "json_codec": type(default_codec()).__name__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _git_commit(src: str) -> Optional[str]:
+    """Returns the commit of the checkout containing `src` (with a `+` if it has uncommitted changes), if any."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=src, check=True, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ).stdout.decode()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no", "."],
+            cwd=src,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit.strip() + ("+" if status.strip() else "")
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
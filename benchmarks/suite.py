@@ -0,0 +1,241 @@
+"""The benchmarks: the SDK's CPU-bound hot paths, run on synthetic payloads (see `payloads`), and its import time."""
+
+# Standard Library
+import functools
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+# 1st Party Libraries
+from benchmarks import payloads
+
+if TYPE_CHECKING:
+    # 1st Party Libraries
+    from open_exchange.codec import JSONCodec
+
+
+class Benchmark(NamedTuple):
+    name: str
+    # The number of items (results, addresses, ...) processed by each call of `fn`.
+    num_items: int
+    fn: Callable[[], object]
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    """Yields the benchmarks. `open_exchange` is imported here, so that the runner can choose which one."""
+    yield from _parsing_benchmarks()
+    yield from _result_benchmarks()
+    yield from _request_benchmarks()
+    yield from _codec_benchmarks()
+    yield from _chunking_benchmarks()
+    yield from _import_benchmarks()
+
+
+def _parsing_benchmarks() -> Iterator[Benchmark]:
+    # 1st Party Libraries
+    from open_exchange import columnar
+    from open_exchange.parsing import parse_rental_comps_results, parse_results
+    from open_exchange.resources.data import rental_comps
+    from open_exchange.types.data import (
+        property_details_response,
+        property_values_response,
+        rent_estimates_response,
+        rental_comps_response,
+    )
+
+    # One response of each endpoint, of the default request size.
+    responses = (
+        ("property_details", property_details_response.Result, payloads.property_details_results(50)),
+        ("property_values", property_values_response.Result, payloads.property_values_results(50)),
+        ("rent_estimates", rent_estimates_response.Result, payloads.rent_estimates_results(50)),
+        ("rental_comps", rental_comps_response.Result, payloads.rental_comps_results(10, num_comps=50)),
+    )
+    for resource, model, result_dicts in responses:
+        yield Benchmark(
+            f"parse/{resource}/validate", len(result_dicts), functools.partial(parse_results, model, result_dicts)
+        )
+        yield Benchmark(
+            f"parse/{resource}/trusted",
+            len(result_dicts),
+            functools.partial(parse_results, model, result_dicts, validate=False),
+        )
+
+    rental_comps_dicts = responses[-1][2]
+
+    # Comps shared between subjects: 500 comps of 50 properties.
+    overlapping_dicts = payloads.rental_comps_results(10, num_comps=50, num_comp_properties=50)
+    yield Benchmark(
+        "parse/rental_comps/overlapping",
+        len(overlapping_dicts),
+        functools.partial(parse_rental_comps_results, overlapping_dicts, validate=True),
+    )
+    yield Benchmark(
+        "parse/rental_comps/interned",
+        len(overlapping_dicts),
+        lambda: rental_comps.CompPropertyInterner().parse_results(overlapping_dicts),
+    )
+
+    def build_rental_comps_columns() -> object:
+        results = columnar.TableBuilder(rental_comps._RESULT_COLUMNS, extra_columns=rental_comps._RESULT_EXTRA_COLUMNS)
+        comps = columnar.TableBuilder(rental_comps._COMP_COLUMNS, extra_columns=rental_comps._COMP_EXTRA_COLUMNS)
+        rental_comps._extend_columns(results, comps, rental_comps_dicts)
+        return comps
+
+    yield Benchmark("parse/rental_comps/columnar", len(rental_comps_dicts), build_rental_comps_columns)
+
+    def build_rental_comps_store() -> object:
+        store = rental_comps.RentalCompsStore()
+        store.extend(rental_comps_dicts)
+        return store
+
+    def read_rental_comps_store(store: rental_comps.RentalCompsStore) -> List[object]:
+        """Read a field of every comp and of its property details through the store's views."""
+        return [(comp.close_price, comp.property_details.structure_type) for comp in store.iter_comps()]
+
+    store = rental_comps.RentalCompsStore()
+    store.extend(rental_comps_dicts)
+    yield Benchmark("parse/rental_comps/compact", len(rental_comps_dicts), build_rental_comps_store)
+    yield Benchmark("read/rental_comps/compact", store.num_comps, functools.partial(read_rental_comps_store, store))
+
+
+def _result_benchmarks() -> Iterator[Benchmark]:
+    # 1st Party Libraries
+    from open_exchange.instrumentation import api_code_counts
+    from open_exchange.results import is_retryable_result, result_api_code
+
+    result_dicts = payloads.mixed_api_code_results(1_000)
+    fields = [(result_dict.get("api_code"), result_dict.get("error_message")) for result_dict in result_dicts]
+
+    def api_codes() -> List[int]:
+        return [result_api_code(api_code, error_message) for api_code, error_message in fields]
+
+    def retryable() -> List[bool]:
+        return [is_retryable_result(result_dict) for result_dict in result_dicts]
+
+    yield Benchmark("results/result_api_code", len(fields), api_codes)
+    yield Benchmark("results/is_retryable_result", len(result_dicts), retryable)
+    yield Benchmark("results/api_code_counts", len(result_dicts), lambda: api_code_counts(result_dicts))
+
+
+def _request_benchmarks() -> Iterator[Benchmark]:
+    # 1st Party Libraries
+    from open_exchange.addresses import address_key, normalize_address
+    from open_exchange.pipeline import ChunkPlanner
+
+    addresses = payloads.addresses(50)
+
+    def request_body() -> object:
+        """Plan one request of 50 addresses and build its body, as `fetch()` does."""
+        planner: ChunkPlanner[dict] = ChunkPlanner(
+            "/data/rental-comps", params={"num_comps": 50}, max_addresses_per_request=len(addresses)
+        )
+        for address in addresses:
+            chunk = planner.add(address)
+        assert chunk is not None
+        batch = planner.first_batch(chunk)
+        assert batch is not None
+        return planner.request_body(batch)
+
+    yield Benchmark("request/body", len(addresses), request_body)
+    yield Benchmark("request/normalize_address", len(addresses), lambda: [normalize_address(a) for a in addresses])
+    yield Benchmark("request/address_key", len(addresses), lambda: [address_key(a) for a in addresses])
+
+
+def _codec_benchmarks() -> Iterator[Benchmark]:
+    # 1st Party Libraries
+    from open_exchange import codec
+
+    addresses = payloads.addresses(50)
+    request_body = {"num_comps": 50, "addresses": addresses}
+    result_dicts = payloads.rental_comps_results(10, num_comps=50)
+    response = {"results": result_dicts}
+
+    codecs: List[Tuple[str, codec.JSONCodec]] = [("json", codec.StdlibJSONCodec())]
+    for name, codec_class in (("orjson", codec.OrjsonCodec), ("msgspec", codec.MsgspecCodec)):
+        json_codec = codec._try_codec(codec_class)
+        if json_codec is not None:
+            codecs.append((name, json_codec))
+
+    for name, json_codec in codecs:
+        yield Benchmark(
+            f"codec/{name}/encode_request", len(addresses), functools.partial(json_codec.encode, request_body)
+        )
+        yield Benchmark(
+            f"codec/{name}/decode_rental_comps",
+            len(result_dicts),
+            functools.partial(json_codec.decode, json_codec.encode(response)),
+        )
+        yield Benchmark(
+            f"codec/{name}/stream_rental_comps",
+            len(result_dicts),
+            functools.partial(_stream_decode, json_codec, json_codec.encode(response)),
+        )
+
+
+def _stream_decode(json_codec: "JSONCodec", data: bytes) -> List[object]:
+    """Decode the results of a response in network-sized pieces, as `RentalComps.stream()` does."""
+    # 1st Party Libraries
+    from open_exchange.codec import JSONArrayItemsDecoder
+    from open_exchange.contants import STREAMED_RESPONSE_CHUNK_SIZE
+
+    decoder = JSONArrayItemsDecoder("results", json_codec)
+    items: List[object] = []
+    for start in range(0, len(data), STREAMED_RESPONSE_CHUNK_SIZE):
+        items.extend(decoder.feed(data[start : start + STREAMED_RESPONSE_CHUNK_SIZE]))
+    decoder.close()
+    return items
+
+
+def _chunking_benchmarks() -> Iterator[Benchmark]:
+    # 1st Party Libraries
+    from open_exchange.pipeline import ChunkPlanner
+
+    addresses = payloads.addresses(10_000, duplicate_ratio=0.05)
+
+    def plan(deduplicate: bool) -> int:
+        """Group the input into chunks (and requests), as `fetch()` does before sending them."""
+        planner: ChunkPlanner[dict] = ChunkPlanner(
+            "/data/property-details", params={}, max_addresses_per_request=50, deduplicate=deduplicate
+        )
+        num_batches = 0
+        for address in addresses:
+            chunk = planner.add(address)
+            if chunk is not None and planner.first_batch(chunk) is not None:
+                num_batches += 1
+        return num_batches
+
+    yield Benchmark("chunking/plan", len(addresses), lambda: plan(deduplicate=True))
+    yield Benchmark("chunking/plan_without_deduplication", len(addresses), lambda: plan(deduplicate=False))
+
+
+# What a program does on a cold start, e.g. a serverless worker that only fetches property values.
+_IMPORTS = (
+    ("python", "pass"),
+    ("open_exchange", "import open_exchange"),
+    ("client", "import open_exchange; open_exchange.OpenExchangeClient(api_key='benchmark')"),
+    (
+        "property_values",
+        "import open_exchange; open_exchange.OpenExchangeClient(api_key='benchmark').data.property_values",
+    ),
+    (
+        "rental_comps",
+        "import open_exchange; open_exchange.OpenExchangeClient(api_key='benchmark').data.rental_comps",
+    ),
+)
+
+
+def _import_benchmarks() -> Iterator[Benchmark]:
+    # 1st Party Libraries
+    import open_exchange
+
+    # The new interpreters import the benchmarked package, from the directory the runner imported it from.
+    src = os.path.dirname(os.path.dirname(os.path.abspath(open_exchange.__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])))
+    for name, code in _IMPORTS:
+        yield Benchmark(f"import/{name}", 1, functools.partial(_run_python, code, env))
+
+
+def _run_python(code: str, env: Dict[str, str]) -> None:
+    """Run `code` in a new interpreter, whose startup is included in the time (see `import/python`)."""
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
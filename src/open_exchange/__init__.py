@@ -2,9 +2,36 @@
 
 __version__ = "0.1.8"
 
-# 1st Party Libraries
-from open_exchange.client import OpenExchangeClient
+# Standard Library
+import importlib
+import sys
+from typing import TYPE_CHECKING, List
 
 __all__ = [
+    "AsyncOpenExchangeClient",
     "OpenExchangeClient",
 ]
+
+# The clients are imported on first use, with their transport (`requests` or `httpx`), so that importing the package
+# stays cheap for programs that only need part of it.
+_LAZY_ATTRIBUTES = {
+    "AsyncOpenExchangeClient": "open_exchange.client",
+    "OpenExchangeClient": "open_exchange.client",
+}
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # Python 3.6 doesn't support module `__getattr__` (PEP 562).
+    # 1st Party Libraries
+    from open_exchange.client import AsyncOpenExchangeClient, OpenExchangeClient
+else:
+
+    def __getattr__(name: str) -> object:
+        module_name = _LAZY_ATTRIBUTES.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted([*globals(), *_LAZY_ATTRIBUTES])
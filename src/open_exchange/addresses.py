@@ -0,0 +1,53 @@
+# Standard Library
+import re
+from typing import Mapping, TypeVar
+
+__all__ = [
+    "address_key",
+    "normalize_address",
+]
+
+T = TypeVar("T", bound=Mapping[str, object])
+
+_ADDRESS_FIELDS = ("street", "unit", "city", "state", "postal_code")
+_WHITESPACE_FIELDS = ("street", "unit", "city")
+_ZIP_PLUS_FOUR = re.compile(r"^(\d{5})-?\d{4}$")
+
+
+def normalize_address(address: T) -> T:
+    """
+    Returns a copy of the address without cosmetic differences that don't change the property it refers to.
+
+    Leading, trailing and repeated whitespace is removed, the state is upper-cased, ZIP+4 postal codes are shortened
+    to their 5 digit ZIP code and an empty `unit` is dropped. The `token` is kept as is.
+    """
+    normalized = dict(address)
+    for field in _WHITESPACE_FIELDS:
+        value = normalized.get(field)
+        if isinstance(value, str):
+            normalized[field] = " ".join(value.split())
+
+    state = normalized.get("state")
+    if isinstance(state, str):
+        normalized["state"] = state.strip().upper()
+
+    postal_code = normalized.get("postal_code")
+    if isinstance(postal_code, str):
+        postal_code = postal_code.strip()
+        match = _ZIP_PLUS_FOUR.match(postal_code)
+        normalized["postal_code"] = match.group(1) if match else postal_code
+
+    if "unit" in normalized and not normalized["unit"]:
+        del normalized["unit"]
+
+    return normalized  # type: ignore[return-value]  # A copy of a TypedDict with the same keys.
+
+
+def address_key(address: Mapping[str, object]) -> str:
+    """
+    Returns a key identifying the property of an address: addresses with the same key refer to the same property.
+
+    The key ignores case, whitespace and the address's `token`.
+    """
+    normalized = normalize_address(address)
+    return "|".join(str(normalized.get(field) or "").upper() for field in _ADDRESS_FIELDS)
@@ -0,0 +1,81 @@
+# Standard Library
+import logging
+from typing import Optional
+
+# 1st Party Libraries
+from open_exchange.contants import (
+    ADAPTIVE_BATCH_SIZE_DECREASE_FACTOR,
+    ADAPTIVE_BATCH_SIZE_MAX_FAILURE_RATE,
+    ADAPTIVE_BATCH_SIZE_TARGET_LATENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveBatchSize:
+    """
+    The number of addresses to send per request, adapted to the observed latency and error rate of requests.
+
+    The size follows AIMD (additive increase, multiplicative decrease), like TCP congestion control: every healthy
+    request grows it by `increase` addresses, up to `maximum`; a request that is slower than `target_latency`, in
+    which more than `max_failure_rate` of the addresses failed with a retryable error or that failed as a whole (e.g.
+    with a 503 status code or a timeout) shrinks it by `decrease_factor`, down to `minimum`.
+
+    Requests that were sized before the last decrease can't shrink it again, so a burst of slow requests that were
+    in flight at the same time only counts once.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        *,
+        minimum: int = 1,
+        target_latency: float = ADAPTIVE_BATCH_SIZE_TARGET_LATENCY,
+        max_failure_rate: float = ADAPTIVE_BATCH_SIZE_MAX_FAILURE_RATE,
+        increase: int = 1,
+        decrease_factor: float = ADAPTIVE_BATCH_SIZE_DECREASE_FACTOR,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError("The batch size bounds must satisfy 1 <= minimum <= maximum")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_failure_rate = max_failure_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+
+        self.size = maximum
+        # Incremented on every decrease, to tell requests sized before the last decrease apart.
+        self.generation = 0
+
+    def record(self, generation: int, num_addresses: int, latency: Optional[float], num_failed: int) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+          generation: The `generation` of the batch size when the request was sized.
+
+          num_addresses: The number of addresses in the request.
+
+          latency: The number of seconds the request took, or None if it failed without a response.
+
+          num_failed: The number of addresses in the request that failed with a retryable error.
+        """
+        is_fast = latency is not None and latency <= self.target_latency
+        is_healthy = is_fast and num_failed <= num_addresses * self.max_failure_rate
+        if is_healthy:
+            self.size = min(self.maximum, self.size + self.increase)
+            return
+
+        if generation < self.generation:
+            return
+        self.size = max(self.minimum, int(self.size * self.decrease_factor))
+        self.generation += 1
+        logger.debug(
+            "Decreased batch size to %d after a request of %d addresses %s with %d failures",
+            self.size,
+            num_addresses,
+            "failed" if latency is None else f"took {latency:.2f}s",
+            num_failed,
+        )
@@ -0,0 +1,189 @@
+# Standard Library
+import abc
+import collections
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+# 1st Party Libraries
+from open_exchange.addresses import address_key
+from open_exchange.contants import DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTL
+
+__all__ = [
+    "ResponseCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "cache_key",
+]
+
+
+def cache_key(endpoint: str, address: Mapping[str, object], params: Mapping[str, object]) -> str:
+    """
+    Returns the cache key for the result of `address` from `endpoint` when requested with `params`.
+
+    The address is normalized with `open_exchange.addresses.address_key`, so its `token` is not part of the key.
+    """
+    address_part = address_key(address)
+    params_part = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(f"{endpoint}\n{params_part}\n{address_part}".encode()).hexdigest()
+
+
+class ResponseCache(abc.ABC):
+    """
+    A cache of per-address results, shared by the data resources of a client.
+
+    Only results without errors are cached. Entries expire after the TTL of their endpoint and the least recently
+    used entries are evicted once the cache holds more than `max_entries`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_per_endpoint: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Args:
+          ttl: The number of seconds results are cached for.
+
+          ttl_per_endpoint: An _optional_ mapping of endpoint path (e.g. `"/data/rental-comps"`) to the number of
+              seconds results of that endpoint are cached for, overriding `ttl`.
+
+          max_entries: The maximum number of results to keep in the cache.
+        """
+        self.ttl = ttl
+        self.ttl_per_endpoint: Dict[str, float] = dict(ttl_per_endpoint or {})
+        self.max_entries = max_entries
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttl_per_endpoint.get(endpoint, self.ttl)
+
+    @abc.abstractmethod
+    def get(self, endpoint: str, key: str) -> Optional[dict]:
+        """Returns the cached result for `key`, or `None` if it isn't cached or has expired."""
+
+    @abc.abstractmethod
+    def set_many(self, endpoint: str, results: Mapping[str, dict]) -> None:
+        """Cache results of `endpoint` by their key."""
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCache(ResponseCache):
+    """An in-process LRU cache."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_per_endpoint: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(ttl=ttl, ttl_per_endpoint=ttl_per_endpoint, max_entries=max_entries)
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[str, Tuple[float, dict]]" = collections.OrderedDict()
+
+    def get(self, endpoint: str, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def set_many(self, endpoint: str, results: Mapping[str, dict]) -> None:
+        expires_at = time.time() + self.ttl_for(endpoint)
+        with self._lock:
+            for key, result in results.items():
+                self._entries[key] = (expires_at, result)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCache(ResponseCache):
+    """An LRU cache persisted in a SQLite database, so cached results survive restarts."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        ttl_per_endpoint: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Args:
+          path: The path of the SQLite database file. It is created if it doesn't exist.
+        """
+        super().__init__(ttl=ttl, ttl_per_endpoint=ttl_per_endpoint, max_entries=max_entries)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at)")
+        self._connection.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),))
+        (self._num_entries,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+
+    def get(self, endpoint: str, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM results WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at <= now:
+                self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._num_entries -= 1
+                return None
+            self._connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+
+    def set_many(self, endpoint: str, results: Mapping[str, dict]) -> None:
+        now = time.time()
+        expires_at = now + self.ttl_for(endpoint)
+        rows = [(key, endpoint, json.dumps(result), expires_at, now) for key, result in results.items()]
+        if not rows:
+            return
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                (num_existing,) = self._connection.execute(
+                    f"SELECT COUNT(*) FROM results WHERE key IN ({', '.join('?' * len(rows))})",
+                    [key for key, *_ in rows],
+                ).fetchone()
+                self._connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", rows)
+                self._num_entries += len(rows) - num_existing
+                if self._num_entries > self.max_entries:
+                    self._connection.execute(
+                        "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                        (self._num_entries - self.max_entries,),
+                    )
+                    self._num_entries = self.max_entries
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,403 @@
+# Standard Library
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import types
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Type
+
+# 1st Party Libraries
+from open_exchange import columnar
+from open_exchange.cache import SQLiteCache
+from open_exchange.client import OpenExchangeClient
+from open_exchange.codec import JSONCodec
+from open_exchange.contants import DEFAULT_MAX_ADDRESS_RETRIES, MAX_CONCURRENT_REQUESTS
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.journal import FetchJournal
+from open_exchange.resource import EndpointResource
+from open_exchange.resources.data.property_details import PropertyDetails
+from open_exchange.resources.data.property_values import PropertyValues
+from open_exchange.resources.data.rent_estimates import RentEstimates
+from open_exchange.resources.data.rental_comps import RentalComps
+from open_exchange.results import result_dict_api_code
+from open_exchange.types.data import (
+    property_details_response,
+    property_values_response,
+    rent_estimates_response,
+    rental_comps_response,
+)
+
+__all__ = [
+    "main",
+]
+
+INPUT_FORMATS = ("csv", "jsonl", "parquet")
+OUTPUT_FORMATS = ("jsonl", "csv")
+
+# The fields of an address read from each input record; other fields are ignored.
+ADDRESS_FIELDS = ("street", "unit", "city", "state", "postal_code", "token")
+REQUIRED_ADDRESS_FIELDS = ("street", "city", "state", "postal_code")
+
+# The number of records read from a Parquet file at a time.
+PARQUET_BATCH_SIZE = 10_000
+
+DEFAULT_PROGRESS_INTERVAL = 5.0  # seconds
+
+_SUCCESSFUL_API_CODES = (200, 204)
+
+
+class _ResourceSpec(NamedTuple):
+    resource: Type[EndpointResource]
+    result_model: type
+
+    @property
+    def max_addresses_per_request(self) -> int:
+        return self.resource.max_addresses_per_request
+
+
+RESOURCES: Dict[str, _ResourceSpec] = {
+    "property-details": _ResourceSpec(PropertyDetails, property_details_response.Result),
+    "property-values": _ResourceSpec(PropertyValues, property_values_response.Result),
+    "rent-estimates": _ResourceSpec(RentEstimates, rent_estimates_response.Result),
+    "rental-comps": _ResourceSpec(RentalComps, rental_comps_response.Result),
+}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Fetch results for a file of addresses, e.g.:
+
+        python -m open_exchange rental-comps addresses.csv -o comps.jsonl --num-comps 20
+
+    Returns the exit status.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        run(args)
+    except BrokenPipeError:
+        # The output was closed early, e.g. piped to `head`. Keep the interpreter from failing to flush it at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OpenExchangeError, OSError, ValueError) as e:
+        print(f"open_exchange: error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the command parsed from the arguments of `main()`."""
+    spec = RESOURCES[args.resource]
+    input_format = args.input_format or _format_from_path(args.input, INPUT_FORMATS, "--input-format")
+    output_format = args.output_format or _format_from_path(args.output, OUTPUT_FORMATS, "--output-format", "jsonl")
+    body = _request_body(args)
+
+    journal = FetchJournal(args.journal) if args.journal else None
+    # A resumed run appends the results of the rest of the input to the output of the previous runs.
+    num_completed = journal.num_completed if journal is not None else 0
+    resume = num_completed > 0
+    if resume and not args.quiet:
+        print(f"open_exchange: resuming, skipping {num_completed:,} completed addresses", file=sys.stderr)
+
+    cache = SQLiteCache(args.cache) if args.cache else None
+    client = OpenExchangeClient(
+        api_key=args.api_key,
+        base_url=args.base_url,
+        max_concurrent_requests=args.max_concurrent_requests,
+        cache=cache,
+        max_requests_per_second=args.max_requests_per_second,
+        max_addresses_per_second=args.max_addresses_per_second,
+    )
+    progress = _Progress(args.progress_interval, quiet=args.quiet)
+    try:
+        with _open_output(args.output, output_format, append=resume) as output:
+            write = _writer(output, output_format, spec, args.resource, client.json_codec, header=not resume)
+            for result_dicts in spec.resource(client).fetch_raw(
+                read_addresses(args.input, input_format),
+                body=body,
+                max_addresses_per_request=args.max_addresses_per_request,
+                max_chunks_in_flight=args.max_chunks_in_flight,
+                ordered=not args.unordered,
+                deduplicate=args.deduplicate,
+                adaptive_batching=args.adaptive_batching,
+                max_retries=args.max_retries,
+                journal=journal,
+            ):
+                write(result_dicts)
+                output.flush()
+                progress.update(result_dicts)
+    finally:
+        client.close()
+        if cache is not None:
+            cache.close()
+        if journal is not None:
+            journal.close()
+        progress.done()
+
+
+def read_addresses(path: str, format: str) -> Iterator[Dict[str, object]]:
+    """
+    Yields the addresses of a CSV, JSON Lines or Parquet file (`"-"` for standard input), one at a time.
+
+    Each record must have `street`, `city`, `state` and `postal_code` fields, and may have `unit` and `token` fields.
+    Other fields are ignored, and empty optional fields are left out.
+    """
+    if format == "parquet":
+        yield from _read_parquet(path)
+        return
+
+    with _open_input(path) as file:
+        if format == "csv":
+            records: Iterable[Mapping[str, object]] = csv.DictReader(file)
+        else:
+            records = (json.loads(line) for line in file if line.strip())
+        for line_number, record in enumerate(records, 1):
+            yield _address(record, f"{path}:{line_number}")
+
+
+def _read_parquet(path: str) -> Iterator[Dict[str, object]]:
+    if path == "-":
+        raise ValueError("Parquet files can't be read from standard input, which isn't seekable")
+    parquet = _import_pyarrow_parquet()
+    parquet_file = parquet.ParquetFile(path)
+    columns = [name for name in ADDRESS_FIELDS if name in parquet_file.schema_arrow.names]
+    row_number = 0
+    for batch in parquet_file.iter_batches(batch_size=PARQUET_BATCH_SIZE, columns=columns):
+        for record in batch.to_pylist():
+            row_number += 1
+            yield _address(record, f"{path}: row {row_number}")
+
+
+def _address(record: Mapping[str, object], location: str) -> Dict[str, object]:
+    if not isinstance(record, Mapping):
+        raise ValueError(f"{location}: expected an object, got {type(record).__name__}")
+    address: Dict[str, object] = {}
+    for name in ADDRESS_FIELDS:
+        value = record.get(name)
+        if value is None or value == "":
+            if name in REQUIRED_ADDRESS_FIELDS:
+                raise ValueError(f"{location}: missing {name!r}")
+            continue
+        address[name] = value if isinstance(value, str) else str(value)
+    return address
+
+
+def _writer(
+    output: IO[str], format: str, spec: _ResourceSpec, resource: str, codec: JSONCodec, *, header: bool
+) -> Callable[[List[dict]], None]:
+    if format == "jsonl":
+
+        def write_jsonl(result_dicts: List[dict]) -> None:
+            output.write("".join(codec.encode(result_dict).decode() + "\n" for result_dict in result_dicts))
+
+        return write_jsonl
+
+    # One row per result, with nested objects flattened into columns named after their path. Rental comps are written
+    # one row per comp, after the columns of their result.
+    result_columns = columnar.model_columns(spec.result_model)
+    comp_columns: List[columnar.ColumnSpec] = []
+    if resource == "rental-comps":
+        comp_columns = columnar.model_columns(rental_comps_response.ResultRentalComp, prefix="rental_comps.")
+    writer = csv.writer(output)
+    if header:
+        writer.writerow([name for name, _, _ in result_columns + comp_columns])
+
+    def write_csv(result_dicts: List[dict]) -> None:
+        for result_dict in result_dicts:
+            row = [_csv_value(result_dict, path) for _, path, _ in result_columns]
+            comp_dicts = result_dict.get("rental_comps") if comp_columns else None
+            if not comp_dicts:
+                writer.writerow(row + [""] * len(comp_columns))
+                continue
+            for comp_dict in comp_dicts:
+                writer.writerow(row + [_csv_value(comp_dict, path) for _, path, _ in comp_columns])
+
+    return write_csv
+
+
+def _csv_value(row: Mapping[str, object], path: Tuple[str, ...]) -> object:
+    value: object = row
+    for key in path:
+        value = value.get(key) if isinstance(value, Mapping) else None
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+class _Progress:
+    """Reports the number of results written and the throughput on standard error."""
+
+    def __init__(self, interval: float, *, quiet: bool) -> None:
+        self.interval = interval
+        self.quiet = quiet
+        self.started_at = time.monotonic()
+        self.reported_at = self.started_at
+        self.num_results = 0
+        self.num_failed = 0
+
+    def update(self, result_dicts: List[dict]) -> None:
+        self.num_results += len(result_dicts)
+        self.num_failed += sum(1 for result_dict in result_dicts if not _is_successful(result_dict))
+        now = time.monotonic()
+        if now - self.reported_at >= self.interval:
+            self.reported_at = now
+            self._report(now)
+
+    def done(self) -> None:
+        self._report(time.monotonic(), final=True)
+
+    def _report(self, now: float, *, final: bool = False) -> None:
+        if self.quiet:
+            return
+        elapsed = now - self.started_at
+        rate = self.num_results / elapsed if elapsed > 0 else 0.0
+        print(
+            f"open_exchange: {'done, ' if final else ''}{self.num_results:,} results ({self.num_failed:,} failed) in "
+            f"{elapsed:.1f}s, {rate:,.1f} results/s",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+def _is_successful(result_dict: Mapping[str, object]) -> bool:
+    return result_dict_api_code(result_dict) in _SUCCESSFUL_API_CODES
+
+
+def _request_body(args: argparse.Namespace) -> Dict[str, object]:
+    if args.resource != "rental-comps":
+        return {}
+    filters = None
+    if args.filters:
+        text = args.filters
+        if text.startswith("@"):
+            with open(text[1:]) as file:
+                text = file.read()
+        try:
+            filters = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"--filters is not valid JSON: {e}") from e
+    return {"filters": filters, "num_comps": args.num_comps}
+
+
+def _format_from_path(path: str, formats: Sequence[str], option: str, default: Optional[str] = None) -> str:
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    extension = {"ndjson": "jsonl", "pq": "parquet"}.get(extension, extension)
+    if extension in formats:
+        return extension
+    if default is not None:
+        return default
+    raise ValueError(f"Can't tell the format of {path!r} from its extension, pass {option}")
+
+
+def _open_input(path: str) -> IO[str]:
+    # Standard input is read through a new file object, so that it is decoded as UTF-8 whatever the locale.
+    return open(sys.stdin.fileno() if path == "-" else path, encoding="utf-8-sig", newline="", closefd=path != "-")
+
+
+def _open_output(path: str, format: str, *, append: bool) -> IO[str]:
+    return open(
+        sys.stdout.fileno() if path == "-" else path,
+        "a" if append else "w",
+        encoding="utf-8",
+        newline="" if format == "csv" else None,
+        closefd=path != "-",
+    )
+
+
+def _import_pyarrow_parquet() -> types.ModuleType:
+    try:
+        # Third-Party Libraries
+        import pyarrow.parquet
+    except ImportError as e:
+        raise OpenExchangeError(
+            'The "pyarrow" package is required to read Parquet files. '
+            'Install it with "pip install open-exchange[arrow]".'
+        ) from e
+    return pyarrow.parquet
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m open_exchange",
+        description="Fetch results for a file of addresses, streaming them from the input to the output.",
+    )
+    subparsers = parser.add_subparsers(dest="resource", metavar="RESOURCE")
+    subparsers.required = True
+    for resource in RESOURCES:
+        subparser = subparsers.add_parser(resource, help=f"Fetch {resource.replace('-', ' ')}.")
+        _add_arguments(subparser, resource)
+    return parser
+
+
+def _add_arguments(parser: argparse.ArgumentParser, resource: str) -> None:
+    parser.add_argument(
+        "input",
+        help="A CSV, JSON Lines or Parquet file of addresses, or - for standard input. Records need street, city, "
+        "state and postal_code fields, and may have unit and token fields.",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="The JSON Lines or CSV file to write results to (default: standard output)."
+    )
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, help="Default: from the input's extension.")
+    parser.add_argument(
+        "--output-format", choices=OUTPUT_FORMATS, help="Default: from the output's extension, or else jsonl."
+    )
+    if resource == "rental-comps":
+        parser.add_argument(
+            "--filters", help="The rental comps filters as a JSON object, or @FILE to read them from a JSON file."
+        )
+        parser.add_argument("--num-comps", type=int, default=10, help="The number of comps per address (default: 10).")
+
+    group = parser.add_argument_group("client")
+    group.add_argument("--api-key", help="Default: the OPEN_EXCHANGE_API_KEY environment variable.")
+    group.add_argument("--base-url", help="The base URL of the API.")
+    group.add_argument(
+        "--max-concurrent-requests",
+        type=int,
+        default=MAX_CONCURRENT_REQUESTS,
+        help=f"The maximum number of requests in flight at once (default: {MAX_CONCURRENT_REQUESTS}).",
+    )
+    group.add_argument("--max-requests-per-second", type=float, help="A client-side limit on the request rate.")
+    group.add_argument("--max-addresses-per-second", type=float, help="A client-side limit on the address rate.")
+    group.add_argument("--cache", metavar="PATH", help="An SQLite cache of results, reused across runs.")
+    group.add_argument(
+        "--journal",
+        metavar="PATH",
+        help="A journal of the completed parts of the input. If the run is interrupted, run it again with the same "
+        "input, output and journal to fetch only the rest of the input and append its results to the output.",
+    )
+
+    group = parser.add_argument_group("fetch")
+    group.add_argument(
+        "--max-addresses-per-request",
+        type=int,
+        help=f"Default: {RESOURCES[resource].max_addresses_per_request}.",
+    )
+    group.add_argument("--max-chunks-in-flight", type=int, help="Default: twice --max-concurrent-requests.")
+    group.add_argument(
+        "--unordered", action="store_true", help="Write results as soon as they arrive, not in input order."
+    )
+    group.add_argument("--deduplicate", action="store_true", help="Request each property only once.")
+    group.add_argument("--adaptive-batching", action="store_true", help="Adapt the number of addresses per request.")
+    group.add_argument(
+        "--max-retries",
+        type=int,
+        default=DEFAULT_MAX_ADDRESS_RETRIES,
+        help=f"Retries of addresses that failed with a retryable error (default: {DEFAULT_MAX_ADDRESS_RETRIES}).",
+    )
+
+    group = parser.add_argument_group("progress")
+    group.add_argument(
+        "--progress-interval",
+        type=float,
+        default=DEFAULT_PROGRESS_INTERVAL,
+        help=f"Seconds between throughput reports on standard error (default: {DEFAULT_PROGRESS_INTERVAL:g}).",
+    )
+    group.add_argument("-q", "--quiet", action="store_true", help="Don't report throughput.")
@@ -1,20 +1,40 @@
 # Standard Library
+import abc
 import logging
 import os
 import platform
-from typing import Optional
-
-# Third-Party Libraries
-import requests
-import requests.adapters
-import urllib3.util.retry
+import time
+from http import HTTPStatus
+from types import TracebackType
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Generic, Iterator, Mapping, Optional, Tuple, Type, TypeVar, cast
 
 # 1st Party Libraries
 import open_exchange
 from open_exchange import resources
+from open_exchange.cache import ResponseCache
+from open_exchange.codec import JSONArrayItemsDecoder, JSONCodec, default_codec
 from open_exchange.compat import cached_property
-from open_exchange.contants import DEFAULT_MAX_RETRIES, DEFAULT_RETRY_BACKOFF_FACTOR, DEFAULT_RETRYABLE_STATUS_CODES
+from open_exchange.contants import (
+    DEFAULT_MAX_RATE_LIMITED_RETRIES,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRYABLE_STATUS_CODES,
+    MAX_CONCURRENT_REQUESTS,
+    STREAMED_RESPONSE_CHUNK_SIZE,
+)
 from open_exchange.exceptions import OpenExchangeError
+from open_exchange.instrumentation import Instrumentation, RequestEvent
+from open_exchange.rate_limit import RateLimiter, parse_retry_after
+from open_exchange.scheduler import RequestScheduler
+
+if TYPE_CHECKING:
+    # Standard Library
+    import asyncio
+
+    # Third-Party Libraries
+    import httpx
+    import requests
+    import urllib3.util.retry
 
 logger = logging.getLogger(__name__)
 
@@ -22,53 +42,584 @@ PYTHON_VERSION = platform.python_version()
 SDK_VERSION = open_exchange.__version__
 
 
-class OpenExchangeClient:
-    data: resources.Data
+DEFAULT_BASE_URL = "https://directaccess.opendoor.com/api/v2"
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    if api_key is None:
+        api_key = os.getenv("OPEN_EXCHANGE_API_KEY")
+    if api_key is None:
+        raise OpenExchangeError(
+            'API key is required. Pass it in the "api_key" argument or set the "OPEN_EXCHANGE_API_KEY" '
+            "environment variable."
+        )
+    return api_key
+
+
+class _BaseClient(abc.ABC):
+    """The options and setup shared by `OpenExchangeClient` and `AsyncOpenExchangeClient`."""
 
     def __init__(
         self,
         *,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        max_concurrent_requests_per_endpoint: Optional[Mapping[str, int]] = None,
+        max_connections: Optional[int] = None,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        max_requests_per_second: Optional[float] = None,
+        max_addresses_per_second: Optional[float] = None,
+        validate_responses: bool = True,
+        json_codec: Optional[JSONCodec] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> None:
-        if api_key is None:
-            api_key = os.getenv("OPEN_EXCHANGE_API_KEY")
-        if api_key is None:
-            raise OpenExchangeError(
-                'API key is required. Pass it in the "api_key" argument or set the "OPEN_EXCHANGE_API_KEY" '
-                "environment variable."
-            )
-        self.api_key = api_key
+        """
+        Args:
+          api_key: The Open Exchange API key. Defaults to the `OPEN_EXCHANGE_API_KEY` environment variable.
+
+          base_url: The base URL of the Open Exchange API.
+
+          max_concurrent_requests: The maximum number of requests in flight at once across all resources.
+
+          max_concurrent_requests_per_endpoint: An _optional_ mapping of endpoint path (e.g. `"/data/rental-comps"`)
+              to the maximum number of requests in flight at once to that endpoint.
+
+          max_connections: The maximum number of pooled connections kept open to the API. Defaults to
+              `max_concurrent_requests`.
+
+          timeout: An _optional_ number of seconds to wait for the API to respond to each attempt of a request. By
+              default, requests never time out. `fetch()` retries the addresses of requests that time out, like those
+              of requests that fail with a retryable status code, and with `adaptive_batching` sends fewer addresses
+              per request after a timeout.
+
+          cache: An _optional_ cache of per-address results (e.g. `open_exchange.cache.SQLiteCache`). Only addresses
+              that aren't cached are sent to the API. The cache is not closed with the client.
+
+          max_requests_per_second: An _optional_ limit on the number of requests sent per second across all
+              resources.
+
+          max_addresses_per_second: An _optional_ limit on the number of addresses sent per second across all
+              resources.
+
+              Regardless of these limits, requests that the API rate limits (429 Too Many Requests) are retried after
+              the response's `Retry-After`, and the request rate is lowered to what the API sustains.
+
+          rate_limiter: An _optional_ `open_exchange.rate_limit.RateLimiter` shared with other clients, e.g. in other
+              processes, so that the rate limits hold across all of them. Overrides `max_requests_per_second` and
+              `max_addresses_per_second`.
+
+          validate_responses: Whether to validate the results returned by the API against the response models. If
+              false, the results are trusted to be well-formed and are parsed without validation (or, with pydantic
+              v2, validated all at once), which is faster for large results such as rental comps.
+
+          json_codec: The codec used to encode requests and decode responses (see `open_exchange.codec`). Defaults to
+              `orjson` or `msgspec` if either is installed, or else the standard library's `json`.
+
+          instrumentation: _Optional_ hooks that report what the client is doing, e.g. request latencies and result
+              `api_code`s (see `open_exchange.instrumentation`).
+        """
+        self.api_key = _resolve_api_key(api_key)
 
         if base_url is None:
-            base_url = "https://directaccess.opendoor.com/api/v2"
+            base_url = DEFAULT_BASE_URL
         self.base_url = base_url
 
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_concurrent_requests_per_endpoint: Dict[str, int] = dict(max_concurrent_requests_per_endpoint or {})
+        if max_connections is None:
+            max_connections = max_concurrent_requests
+        self.timeout = timeout
+
+        self.cache = cache
+        self.validate_responses = validate_responses
+        self.json_codec = json_codec if json_codec is not None else default_codec()
+        self.instrumentation = instrumentation
+
+        # Shared by every resource, so the rate limits hold across all of them.
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                max_requests_per_second=max_requests_per_second,
+                max_addresses_per_second=max_addresses_per_second,
+            )
+        self._rate_limiter = rate_limiter
+
+        self._connect(max_connections)
+
+    @abc.abstractmethod
+    def _connect(self, max_connections: int) -> None:
+        """Create the client's transport, with at most `max_connections` pooled connections, and its resources."""
+
+    @abc.abstractmethod
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """
+        Whether a request that raised `error` failed in a way that may not happen again: the API responded with a
+        retryable status code or timed out, even after the transport's retries.
+        """
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "AUTHORIZATION": self.api_key,
+            "X-PYTHON-VERSION": PYTHON_VERSION,
+            "X-SDK-VERSION": SDK_VERSION,
+        }
+
+
+class OpenExchangeClient(_BaseClient):
+    data: resources.Data
+
+    def _connect(self, max_connections: int) -> None:
+        # Every resource shares one scheduler, so the concurrency limits hold across all of them.
+        self._scheduler = RequestScheduler(
+            max_concurrent_requests=self.max_concurrent_requests,
+            max_concurrent_requests_per_endpoint=self.max_concurrent_requests_per_endpoint,
+        )
+
+        # `requests` is imported here rather than with the module, like `httpx` by `AsyncOpenExchangeClient`, so that
+        # importing the SDK doesn't pay for a transport until a client is created.
+        # Third-Party Libraries
+        import requests.adapters
+
+        # A single session is shared by every resource (and every worker thread) for the lifetime of the client, so
+        # connections are kept alive and reused instead of paying for a new TCP + TLS handshake on every request.
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,  # We only ever talk to one host.
+            pool_maxsize=max_connections,
+            max_retries=self._retry_config,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         self.data = resources.Data(self)
 
+    def close(self) -> None:
+        """
+        Cancel requests that have not started yet, wait for running requests to finish and close the client's
+        pooled connections. The client can not be used after it has been closed.
+        """
+        self._scheduler.shutdown()
+        self._session.close()
+
+    def __enter__(self) -> "OpenExchangeClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
     def _request(self, method: str, path: str, body: Optional[dict] = None) -> dict:
-        session = requests.Session()
-        session.mount("https://", requests.adapters.HTTPAdapter(max_retries=self._retry_config))
-
-        response = session.request(
-            method=method,
-            url=f"{self.base_url}{path}",
-            headers={
-                "AUTHORIZATION": self.api_key,
-                "X-PYTHON-VERSION": PYTHON_VERSION,
-                "X-SDK-VERSION": SDK_VERSION,
-            },
-            json=body,
-        )
+        _, response_dict = self._timed_request(method, path, body)
+        return response_dict
+
+    def _timed_request(
+        self, method: str, path: str, body: Optional[dict] = None, *, submitted_at: Optional[float] = None
+    ) -> Tuple[float, dict]:
+        """
+        Like `_request`, but also returns the number of seconds the request took, not counting the time spent waiting
+        for the rate limits.
+
+        `submitted_at` is the `time.monotonic()` at which the request was submitted to the client's scheduler, if it
+        was, which is reported to the client's instrumentation.
+        """
+        called_at = time.monotonic()
+        num_addresses = _num_addresses(body)
+        data = None if body is None else self.json_codec.encode(body)
+        sent = self._send(method, path, data, num_addresses)
+        response = sent.response
+        if self.instrumentation is not None:
+            self.instrumentation.on_request(
+                sent.event(
+                    path,
+                    num_addresses=num_addresses,
+                    latency=sent.latency,
+                    queue_wait=0.0 if submitted_at is None else called_at - submitted_at,
+                    bytes_sent=len(data or b""),
+                    bytes_received=len(response.content),
+                )
+            )
+
         response.raise_for_status()  # Raise custom exception for HTTP errors here?
-        return response.json()
+        return sent.latency, cast(dict, self.json_codec.decode(response.content))
+
+    def _stream_request(
+        self, method: str, path: str, body: Optional[dict] = None, *, key: str = "results"
+    ) -> Iterator[dict]:
+        """
+        Like `_request`, but yields the items of the response's `key` array as soon as each has been received, instead
+        of waiting for the whole response. The response body is never held in memory whole.
+        """
+        num_addresses = _num_addresses(body)
+        data = None if body is None else self.json_codec.encode(body)
+        sent = self._send(method, path, data, num_addresses, stream=True)
+        response = sent.response
+        bytes_received = 0
+        try:
+            if not response.ok:
+                bytes_received = len(response.content)
+                response.raise_for_status()  # Raise custom exception for HTTP errors here?
+            decoder = JSONArrayItemsDecoder(key, self.json_codec)
+            for content in response.iter_content(STREAMED_RESPONSE_CHUNK_SIZE):
+                bytes_received += len(content)
+                for item in decoder.feed(content):
+                    yield cast(dict, item)
+            decoder.close()
+        finally:
+            response.close()
+            if self.instrumentation is not None:
+                self.instrumentation.on_request(
+                    sent.event(
+                        path,
+                        num_addresses=num_addresses,
+                        # Until the last byte of the response, rather than its headers.
+                        latency=time.monotonic() - sent.started_at,
+                        queue_wait=0.0,
+                        bytes_sent=len(data or b""),
+                        bytes_received=bytes_received,
+                    )
+                )
+
+    def _send(
+        self, method: str, path: str, data: Optional[bytes], num_addresses: int, *, stream: bool = False
+    ) -> "_SentRequest[requests.Response]":
+        """
+        Sends a request once the rate limits allow it, retrying it while the API rate limits it, and returns its final
+        response. With `stream`, the body of the response is left to be read.
+        """
+        rate_limit_wait = 0.0
+        for retry in range(DEFAULT_MAX_RATE_LIMITED_RETRIES + 1):
+            waiting_since = time.monotonic()
+            self._rate_limiter.acquire(num_addresses)
+            start = time.monotonic()
+            rate_limit_wait += start - waiting_since
+            response = self._session.request(
+                method=method,
+                url=f"{self.base_url}{path}",
+                data=data,
+                headers=None if data is None else _JSON_CONTENT_TYPE,
+                stream=stream,
+                timeout=self.timeout,
+            )
+            latency = time.monotonic() - start
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+                self._rate_limiter.record_success()
+                break
+            self._rate_limiter.record_rate_limited(start, parse_retry_after(response.headers.get("Retry-After")))
+            if retry == DEFAULT_MAX_RATE_LIMITED_RETRIES:
+                break
+            response.close()
+            logger.debug("Retrying %s %s after a 429 response", method, path)
+
+        urllib3_retries = getattr(response.raw, "retries", None)
+        return _SentRequest(
+            response=response,
+            started_at=start,
+            latency=latency,
+            rate_limit_wait=rate_limit_wait,
+            retries=0 if urllib3_retries is None else len(urllib3_retries.history),
+            rate_limited_retries=retry,
+        )
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        # Third-Party Libraries
+        import requests
+        import urllib3.exceptions
+
+        # urllib3 gave up retrying a retryable status code.
+        if isinstance(error, (requests.exceptions.RetryError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code in DEFAULT_RETRYABLE_STATUS_CODES
+        # Read timeouts that urllib3 gave up retrying are raised as connection errors.
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(error, requests.ConnectionError) and isinstance(reason, urllib3.exceptions.ReadTimeoutError)
 
     @cached_property
-    def _retry_config(self) -> urllib3.util.retry.Retry:
+    def _retry_config(self) -> "urllib3.util.retry.Retry":
+        # Third-Party Libraries
+        import urllib3.util.retry
+
         return urllib3.util.retry.Retry(
             total=DEFAULT_MAX_RETRIES,
             backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
             status_forcelist=DEFAULT_RETRYABLE_STATUS_CODES,
             # POST is not in the default set of allowed methods. Override the default to include it.
             allowed_methods=urllib3.util.retry.Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            # 429 responses are retried by `_timed_request`, which slows down the rate limiter before retrying.
+            respect_retry_after_header=False,
+        )
+
+
+class AsyncOpenExchangeClient(_BaseClient):
+    """
+    An asyncio counterpart of `OpenExchangeClient`, backed by `httpx`.
+
+    Install it with `pip install open-exchange[async]`.
+    """
+
+    data: resources.AsyncData
+
+    def _connect(self, max_connections: int) -> None:
+        try:
+            # Third-Party Libraries
+            import httpx
+        except ImportError as e:
+            raise OpenExchangeError(
+                'The "httpx" package is required to use AsyncOpenExchangeClient. Install it with '
+                '"pip install open-exchange[async]".'
+            ) from e
+
+        self._http_client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            # Only connection errors are retried by the transport, retryable status codes are handled in `_request`.
+            transport=httpx.AsyncHTTPTransport(retries=DEFAULT_MAX_RETRIES),
+            timeout=self.timeout,
+        )
+
+        self.data = resources.AsyncData(self)
+
+    async def close(self) -> None:
+        """Close the client's pooled connections. The client can not be used after it has been closed."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncOpenExchangeClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def _request(self, method: str, path: str, body: Optional[dict] = None) -> dict:
+        _, response_dict = await self._timed_request(method, path, body)
+        return response_dict
+
+    async def _timed_request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[float, dict]:
+        """
+        Like `_request`, but also returns the number of seconds the request took, not counting the time spent waiting
+        for the concurrency and rate limits.
+        """
+        num_addresses = _num_addresses(body)
+        content = None if body is None else self.json_codec.encode(body)
+        called_at = time.monotonic()
+        # Wait for the endpoint's limit first so that waiting requests don't hold on to one of the global slots.
+        async with self._endpoint_semaphores.get(path, _NO_LIMIT), self._semaphore:
+            queue_wait = time.monotonic() - called_at
+            sent = await self._send(method, path, content, num_addresses)
+        response = sent.response
+
+        if self.instrumentation is not None:
+            self.instrumentation.on_request(
+                sent.event(
+                    path,
+                    num_addresses=num_addresses,
+                    latency=sent.latency,
+                    queue_wait=queue_wait,
+                    bytes_sent=len(content or b""),
+                    bytes_received=len(response.content),
+                )
+            )
+
+        response.raise_for_status()  # Raise custom exception for HTTP errors here?
+        return sent.latency, cast(dict, self.json_codec.decode(response.content))
+
+    async def _stream_request(
+        self, method: str, path: str, body: Optional[dict] = None, *, key: str = "results"
+    ) -> AsyncIterator[dict]:
+        """
+        Like `_request`, but yields the items of the response's `key` array as soon as each has been received, instead
+        of waiting for the whole response. The response body is never held in memory whole.
+
+        The request holds on to its concurrency slot until its response has been read to the end.
+        """
+        num_addresses = _num_addresses(body)
+        content = None if body is None else self.json_codec.encode(body)
+        called_at = time.monotonic()
+        async with self._endpoint_semaphores.get(path, _NO_LIMIT), self._semaphore:
+            queue_wait = time.monotonic() - called_at
+            sent = await self._send(method, path, content, num_addresses, stream=True)
+            response = sent.response
+            bytes_received = 0
+            try:
+                if response.is_error:
+                    bytes_received = len(await response.aread())
+                    response.raise_for_status()  # Raise custom exception for HTTP errors here?
+                decoder = JSONArrayItemsDecoder(key, self.json_codec)
+                async for data in response.aiter_bytes(STREAMED_RESPONSE_CHUNK_SIZE):
+                    bytes_received += len(data)
+                    for item in decoder.feed(data):
+                        yield cast(dict, item)
+                decoder.close()
+            finally:
+                await response.aclose()
+                if self.instrumentation is not None:
+                    self.instrumentation.on_request(
+                        sent.event(
+                            path,
+                            num_addresses=num_addresses,
+                            # Until the last byte of the response, rather than its headers.
+                            latency=time.monotonic() - sent.started_at,
+                            queue_wait=queue_wait,
+                            bytes_sent=len(content or b""),
+                            bytes_received=bytes_received,
+                        )
+                    )
+
+    async def _send(
+        self, method: str, path: str, content: Optional[bytes], num_addresses: int, *, stream: bool = False
+    ) -> "_SentRequest[httpx.Response]":
+        """
+        Sends a request once the rate limits allow it, retrying it after a retryable status code and while the API
+        rate limits it, and returns its final response. With `stream`, the body of the response is left to be read.
+        """
+        # Standard Library
+        import asyncio
+
+        rate_limit_wait = 0.0
+        for rate_limited_retry in range(DEFAULT_MAX_RATE_LIMITED_RETRIES + 1):
+            delay = self._rate_limiter.reserve(num_addresses)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                rate_limit_wait += delay
+            start = time.monotonic()
+            for retry in range(DEFAULT_MAX_RETRIES + 1):
+                request = self._http_client.build_request(
+                    method=method,
+                    url=path,
+                    content=content,
+                    headers=None if content is None else _JSON_CONTENT_TYPE,
+                )
+                response = await self._http_client.send(request, stream=stream)
+                if response.status_code not in DEFAULT_RETRYABLE_STATUS_CODES or retry == DEFAULT_MAX_RETRIES:
+                    break
+                await response.aclose()
+                logger.debug("Retrying %s %s after a %s response", method, path, response.status_code)
+                await asyncio.sleep(DEFAULT_RETRY_BACKOFF_FACTOR * (2**retry))
+            latency = time.monotonic() - start
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+                self._rate_limiter.record_success()
+                break
+            self._rate_limiter.record_rate_limited(start, parse_retry_after(response.headers.get("Retry-After")))
+            if rate_limited_retry == DEFAULT_MAX_RATE_LIMITED_RETRIES:
+                break
+            await response.aclose()
+            logger.debug("Retrying %s %s after a 429 response", method, path)
+
+        return _SentRequest(
+            response=response,
+            started_at=start,
+            latency=latency,
+            rate_limit_wait=rate_limit_wait,
+            retries=retry,
+            rate_limited_retries=rate_limited_retry,
+        )
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        # Third-Party Libraries
+        import httpx
+
+        if isinstance(error, httpx.TimeoutException):
+            return True
+        return isinstance(error, httpx.HTTPStatusError) and error.response.status_code in DEFAULT_RETRYABLE_STATUS_CODES
+
+    @cached_property
+    def _semaphore(self) -> "asyncio.Semaphore":
+        # Created lazily so that the semaphore is bound to the running event loop on Python < 3.10.
+        # Standard Library
+        import asyncio
+
+        return asyncio.Semaphore(self.max_concurrent_requests)
+
+    @cached_property
+    def _endpoint_semaphores(self) -> Dict[str, "asyncio.Semaphore"]:
+        # Standard Library
+        import asyncio
+
+        return {path: asyncio.Semaphore(limit) for path, limit in self.max_concurrent_requests_per_endpoint.items()}
+
+
+ResponseT = TypeVar("ResponseT", "requests.Response", "httpx.Response")
+
+
+class _SentRequest(Generic[ResponseT]):
+    """The final response to a request, see `_send()`, and what it took to get it. Durations are in seconds."""
+
+    __slots__ = ("response", "started_at", "latency", "rate_limit_wait", "retries", "rate_limited_retries")
+
+    def __init__(
+        self,
+        *,
+        response: ResponseT,
+        started_at: float,
+        latency: float,
+        rate_limit_wait: float,
+        retries: int,
+        rate_limited_retries: int,
+    ) -> None:
+        self.response: ResponseT = response
+        # The `time.monotonic()` at which the final attempt was sent, and how long until its response's headers.
+        self.started_at = started_at
+        self.latency = latency
+        self.rate_limit_wait = rate_limit_wait
+        self.retries = retries
+        self.rate_limited_retries = rate_limited_retries
+
+    def event(
+        self,
+        endpoint: str,
+        *,
+        num_addresses: int,
+        latency: float,
+        queue_wait: float,
+        bytes_sent: int,
+        bytes_received: int,
+    ) -> RequestEvent:
+        return RequestEvent(
+            endpoint=endpoint,
+            status_code=self.response.status_code,
+            num_addresses=num_addresses,
+            latency=latency,
+            queue_wait=queue_wait,
+            rate_limit_wait=self.rate_limit_wait,
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            retries=self.retries,
+            rate_limited_retries=self.rate_limited_retries,
         )
+
+
+def _num_addresses(body: Optional[dict]) -> int:
+    if not body:
+        return 0
+    return len(body.get("addresses", ()))
+
+
+class _NoLimit:
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+
+_NO_LIMIT = _NoLimit()
@@ -0,0 +1,191 @@
+# Standard Library
+import abc
+import datetime
+import json
+import re
+from typing import List, Optional
+
+__all__ = [
+    "JSONArrayItemsDecoder",
+    "JSONCodec",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "StdlibJSONCodec",
+    "default_codec",
+]
+
+
+class JSONCodec(abc.ABC):
+    """Encodes request bodies to and decodes response bodies from JSON bytes."""
+
+    @abc.abstractmethod
+    def encode(self, obj: object) -> bytes:
+        """Returns the JSON encoding of `obj`. Dates are encoded as ISO 8601 strings."""
+
+    @abc.abstractmethod
+    def decode(self, data: bytes) -> object:
+        """Returns the object encoded in the JSON bytes `data`."""
+
+
+class StdlibJSONCodec(JSONCodec):
+    """A codec backed by the standard library's `json` module."""
+
+    def encode(self, obj: object) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False, default=_encode_default).encode()
+
+    def decode(self, data: bytes) -> object:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """A codec backed by `orjson`, which encodes and decodes several times faster than `json`."""
+
+    def __init__(self) -> None:
+        # Third-Party Libraries
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, obj: object) -> bytes:
+        return self._dumps(obj)
+
+    def decode(self, data: bytes) -> object:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """A codec backed by `msgspec`, which encodes and decodes several times faster than `json`."""
+
+    def __init__(self) -> None:
+        # Third-Party Libraries
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: object) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes) -> object:
+        return self._decoder.decode(data)
+
+
+def default_codec() -> JSONCodec:
+    """Returns the fastest codec available: `orjson` or `msgspec` if either is installed, or else `json`."""
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        codec = _try_codec(codec_class)
+        if codec is not None:
+            return codec
+    return StdlibJSONCodec()
+
+
+class JSONArrayItemsDecoder:
+    """
+    Incrementally decodes the objects in the array under a key of a JSON object, e.g. the `results` of a response, as
+    the bytes of the document arrive:
+
+    ```python
+    decoder = JSONArrayItemsDecoder("results", codec)
+    for data in response.iter_content(65536):
+        yield from decoder.feed(data)
+    decoder.close()
+    ```
+
+    Each item is decoded with `codec` as soon as its closing brace has been fed, so only the bytes of the current item
+    are buffered rather than the whole document. The items of the array must be objects or arrays, and other keys of
+    the document are skipped.
+    """
+
+    def __init__(self, key: str, codec: JSONCodec) -> None:
+        self.key = key
+        self._key_pattern = re.compile(rb'"%s"\s*:\s*\Z' % re.escape(key.encode()))
+        self._decode = codec.decode
+        self._buffer = bytearray()
+        # Where to resume scanning the buffer, and where the last bracket at the top level of the document was.
+        self._position = 0
+        self._top_level_position = 0
+        # The nesting depth at `_position`: 1 inside the document, 2 inside the array, and 3 or more inside an item.
+        self._depth = 0
+        self._item_start = 0
+        self._is_in_array = False
+        self._is_done = False
+
+    def feed(self, data: bytes) -> List[object]:
+        """Returns the items completed by `data`, the next bytes of the document."""
+        if self._is_done:
+            return []
+        buffer = self._buffer
+        buffer += data
+        items: List[object] = []
+        position = self._position
+        depth = self._depth
+        next_bracket = _NEXT_BRACKET.match
+        while True:
+            match = next_bracket(buffer, position)
+            if match is None:
+                break
+            bracket_position = match.end() - 1
+            position = match.end()
+            if buffer[bracket_position] in _OPENING_BRACKETS:
+                depth += 1
+                if depth == 3 and self._is_in_array:
+                    self._item_start = bracket_position
+                elif depth == 2 and not self._is_in_array:
+                    # An array or object at the top level of the document: the array of items if it is under the key.
+                    self._is_in_array = buffer[bracket_position] == _OPENING_SQUARE_BRACKET and bool(
+                        self._key_pattern.search(buffer, self._top_level_position, bracket_position)
+                    )
+            else:
+                depth -= 1
+                if depth == 2 and self._is_in_array:
+                    items.append(self._decode(bytes(buffer[self._item_start : position])))
+                elif depth == 1:
+                    if self._is_in_array:
+                        self._is_done = True
+                        self._depth = depth
+                        del buffer[:]
+                        return items
+                    self._top_level_position = position
+                elif depth < 1:
+                    raise ValueError(f"The JSON document has no {self.key!r} array")
+
+        # Drop the bytes that are no longer needed: everything before the current item, or before the current key.
+        if depth >= 3 and self._is_in_array:
+            keep_from = self._item_start
+        elif depth >= 2:
+            keep_from = position
+        else:
+            keep_from = self._top_level_position
+        if keep_from:
+            del buffer[:keep_from]
+            position -= keep_from
+            self._item_start -= keep_from
+            self._top_level_position = max(self._top_level_position - keep_from, 0)
+        self._position = position
+        self._depth = depth
+        return items
+
+    def close(self) -> None:
+        """Checks that the whole array has been fed, e.g. that the connection was not closed early."""
+        if not self._is_done:
+            raise ValueError(f"The JSON document ended before the end of its {self.key!r} array")
+
+
+# Skips to the next bracket outside of a string.
+_NEXT_BRACKET = re.compile(rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}])', re.DOTALL)
+_OPENING_BRACKETS = frozenset(b"[{")
+_OPENING_SQUARE_BRACKET = ord("[")
+
+
+def _try_codec(codec_class: type) -> Optional[JSONCodec]:
+    try:
+        return codec_class()
+    except ImportError:
+        return None
+
+
+def _encode_default(obj: object) -> object:
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
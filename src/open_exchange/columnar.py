@@ -0,0 +1,477 @@
+# Standard Library
+import array
+import datetime
+import types
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_type_hints,
+)
+
+# Third-Party Libraries
+import pydantic
+
+# 1st Party Libraries
+from open_exchange.compat import date_from_iso_format
+from open_exchange.exceptions import OpenExchangeError
+
+if TYPE_CHECKING:
+    # Third-Party Libraries
+    import numpy
+    import pyarrow
+
+__all__ = [
+    "ColumnBuffer",
+    "RowView",
+    "Table",
+    "TableBuilder",
+    "check_format",
+    "model_columns",
+]
+
+# Kinds of columns: how values are stored and converted.
+STR = "str"
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+DATE = "date"
+STR_LIST = "str_list"
+# Strings or lists of strings with few distinct values, stored as integer codes into a list of the distinct values.
+CATEGORY = "category"
+
+FORMATS = ("arrow", "numpy")
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_NAN = float("nan")
+_ONES = b"\x01" * 4096
+_EMPTY_ROW: Mapping[str, object] = {}
+
+# (column name, path of keys to the value in a result, kind).
+ColumnSpec = Tuple[str, Tuple[str, ...], str]
+
+# A table as returned by `TableBuilder.build()`: a `pyarrow.Table`, or a dict of `numpy.ndarray`s keyed by column name.
+Table = Union["pyarrow.Table", Dict[str, "numpy.ndarray"]]
+
+
+class ColumnBuffer:
+    """
+    An append-only column of values of one kind.
+
+    Numbers, booleans and dates (as days since the epoch) are stored in typed arrays, with a separate validity array
+    for missing values, so a column of a million rows takes a few megabytes instead of a million Python objects.
+    Categories are dictionary-encoded: each distinct value is kept once, and rows store its index in a typed array.
+    Other strings and lists are kept as Python objects.
+    """
+
+    __slots__ = ("name", "kind", "data", "valid", "num_missing", "categories", "category_codes")
+
+    def __init__(self, name: str, kind: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.data: Union[array.array, List[object]]
+        if kind == INT:
+            self.data = array.array("q")
+        elif kind == FLOAT:
+            self.data = array.array("d")
+        elif kind == BOOL:
+            self.data = array.array("b")
+        elif kind in (DATE, CATEGORY):
+            self.data = array.array("i")
+        else:
+            self.data = []
+        self.valid = bytearray()
+        self.num_missing = 0
+        # The distinct values of a category column (lists as tuples), and the code of each.
+        self.categories: List[object] = []
+        self.category_codes: Dict[object, int] = {}
+
+    def __getitem__(self, index: int) -> object:
+        """Returns the value of the row at `index`, or None if it is missing."""
+        if not self.valid[index]:
+            return None
+        value = self.data[index]
+        if self.kind == DATE:
+            return datetime.date.fromordinal(value + _EPOCH_ORDINAL)  # type: ignore[operator]  # An int.
+        if self.kind == BOOL:
+            return bool(value)
+        if self.kind == CATEGORY:
+            value = self.categories[value]  # type: ignore[index]  # An int.
+            return list(value) if isinstance(value, tuple) else value
+        return value
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def extend(self, values: List[object]) -> None:
+        """Append values, with None for missing values."""
+        num_missing = values.count(None)
+        if num_missing:
+            self.valid.extend(0 if value is None else 1 for value in values)
+            self.num_missing += num_missing
+        else:
+            self.valid.extend(_ONES[: len(values)] if len(values) <= len(_ONES) else b"\x01" * len(values))
+
+        if isinstance(self.data, list):
+            self.data.extend(values)
+            return
+
+        if self.kind == DATE:
+            values = [None if value is None else _days_since_epoch(value) for value in values]
+        elif self.kind == CATEGORY:
+            values = self._encode_categories(values)
+        if num_missing:
+            missing = _NAN if self.kind == FLOAT else 0
+            values = [missing if value is None else value for value in values]
+        typecode: str = self.data.typecode
+        try:
+            typed = array.array(typecode, values)  # type: ignore[type-var]
+        except TypeError:
+            # E.g. a float in an integer column.
+            convert: Callable[[Any], object] = float if self.kind == FLOAT else int
+            typed = array.array(typecode, [convert(value) for value in values])  # type: ignore[type-var]
+        self.data.extend(typed)
+
+    def _encode_categories(self, values: List[object]) -> List[object]:
+        categories = self.categories
+        category_codes = self.category_codes
+        codes: List[object] = []
+        for value in values:
+            if value is None:
+                codes.append(None)
+                continue
+            if isinstance(value, list):
+                value = tuple(value)
+            code = category_codes.get(value)
+            if code is None:
+                code = category_codes[value] = len(categories)
+                categories.append(value)
+            codes.append(code)
+        return codes
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """
+        Returns the column as a NumPy array.
+
+        Missing values are NaN in float columns, NaT in date columns and None in string and category columns. Integer
+        columns with missing values are converted to floats, and boolean columns with missing values to objects.
+        """
+        np = _import_numpy()
+        if isinstance(self.data, list):
+            values = np.empty(len(self.data), dtype=object)
+            values[:] = self.data
+            return values
+        if self.kind == CATEGORY:
+            # The last category is None, for missing values.
+            categories = np.empty(len(self.categories) + 1, dtype=object)
+            for code, category in enumerate(self.categories):
+                categories[code] = list(category) if isinstance(category, tuple) else category
+            codes = np.frombuffer(self.data, dtype=np.int32).copy()
+            if self.num_missing:
+                codes[np.frombuffer(self.valid, dtype=np.bool_) == 0] = len(self.categories)
+            return categories[codes]
+
+        if self.kind == DATE:
+            values = np.frombuffer(self.data, dtype=np.int32).astype("datetime64[D]")
+        else:
+            values = np.array(self.data, dtype={INT: np.int64, FLOAT: np.float64, BOOL: np.bool_}[self.kind])
+        if not self.num_missing:
+            return values
+
+        missing = np.frombuffer(self.valid, dtype=np.bool_) == 0
+        if self.kind == INT:
+            values = values.astype(np.float64)
+        elif self.kind == BOOL:
+            values = values.astype(object)
+        values[missing] = {INT: _NAN, FLOAT: _NAN, BOOL: None, DATE: np.datetime64("NaT")}[self.kind]
+        return values
+
+    def to_arrow(self) -> "pyarrow.Array":
+        """Returns the column as an Arrow array, with nulls for missing values."""
+        pa = _import_pyarrow()
+        if self.kind == STR:
+            return pa.array(self.data, type=pa.string())
+        if self.kind == STR_LIST:
+            return pa.array(self.data, type=pa.list_(pa.string()))
+
+        np = _import_numpy()
+        mask = np.frombuffer(self.valid, dtype=np.bool_) == 0 if self.num_missing else None
+        if self.kind == CATEGORY:
+            categories = [list(category) if isinstance(category, tuple) else category for category in self.categories]
+            return pa.DictionaryArray.from_arrays(
+                pa.array(np.frombuffer(self.data, dtype=np.int32), type=pa.int32(), mask=mask), pa.array(categories)
+            )
+
+        arrow_type = {INT: pa.int64(), FLOAT: pa.float64(), BOOL: pa.bool_(), DATE: pa.date32()}[self.kind]
+        values = np.frombuffer(
+            self.data, dtype={INT: np.int64, FLOAT: np.float64, BOOL: np.int8, DATE: np.int32}[self.kind]
+        )
+        if self.kind == BOOL:
+            values = values.astype(np.bool_)
+        return pa.array(values, type=arrow_type, mask=mask)
+
+
+class TableBuilder:
+    """
+    Builds a table by appending result dicts (as returned by the API) straight into column buffers, without creating
+    a model object per row.
+    """
+
+    def __init__(self, columns: Sequence[ColumnSpec], *, extra_columns: Sequence[Tuple[str, str]] = ()) -> None:
+        """
+        Args:
+          columns: The columns read from each row, see `model_columns()`.
+
+          extra_columns: The name and kind of columns whose values are passed to `extend()` alongside the rows. They
+              come first in the table.
+        """
+        self.extra_buffers = [ColumnBuffer(name, kind) for name, kind in extra_columns]
+        self.paths = [path for _, path, _ in columns]
+        self.column_buffers = [ColumnBuffer(name, kind) for name, _, kind in columns]
+        self.buffers = self.extra_buffers + self.column_buffers
+        self.num_rows = 0
+
+        # For `RowView`: the column of each name, the columns under each nested object (e.g. `"property_details"`),
+        # and the fields of the top level (`""`) and of each nested object.
+        self.buffers_by_name = {buffer.name: buffer for buffer in self.buffers}
+        self.nested_buffers: Dict[str, List[ColumnBuffer]] = {}
+        self.fields: Dict[str, List[str]] = {"": []}
+        for buffer in self.buffers:
+            parts = buffer.name.split(".")
+            for depth in range(1, len(parts) + 1):
+                parent = ".".join(parts[: depth - 1])
+                if parts[depth - 1] not in self.fields[parent]:
+                    self.fields[parent].append(parts[depth - 1])
+                if depth < len(parts):
+                    path = ".".join(parts[:depth])
+                    self.nested_buffers.setdefault(path, []).append(buffer)
+                    self.fields.setdefault(path, [])
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def row(self, index: int) -> "RowView":
+        """Returns a view of the row at `index`, which reads its values from the columns when they are accessed."""
+        if index < 0:
+            index += self.num_rows
+        if not 0 <= index < self.num_rows:
+            raise IndexError(f"row index {index} out of range for a table of {self.num_rows} rows")
+        return RowView(self, index)
+
+    def extend(self, rows: Sequence[Mapping[str, object]], *extra_values: List[object]) -> None:
+        """
+        Append rows, with the values of the extra columns: one list per extra column, with one value per row.
+
+        The table is filled a column at a time, which is several times faster than a row at a time in Python.
+        """
+        for values, buffer in zip(extra_values, self.extra_buffers):
+            buffer.extend(values)
+
+        # Rows of the nested objects, by path, e.g. the `property_details` of each row.
+        nested_rows: Dict[Tuple[str, ...], Sequence[Mapping[str, object]]] = {(): rows}
+        for path, buffer in zip(self.paths, self.column_buffers):
+            parent = path[:-1]
+            parent_rows = nested_rows.get(parent)
+            if parent_rows is None:
+                parent_rows = nested_rows[parent] = _nested_rows(nested_rows, parent)
+            key = path[-1]
+            buffer.extend([row.get(key) for row in parent_rows])
+        self.num_rows += len(rows)
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        return {buffer.name: buffer.to_numpy() for buffer in self.buffers}
+
+    def to_arrow(self) -> "pyarrow.Table":
+        pa = _import_pyarrow()
+        return pa.table({buffer.name: buffer.to_arrow() for buffer in self.buffers})
+
+    def build(self, format: str) -> Table:
+        """Returns the table as an Arrow table (`format="arrow"`) or as a dict of NumPy arrays (`format="numpy"`)."""
+        if format == "arrow":
+            return self.to_arrow()
+        if format == "numpy":
+            return self.to_numpy()
+        raise ValueError(f"Unknown columnar format {format!r}, expected one of {FORMATS}")
+
+
+class RowView:
+    """
+    A row of a `TableBuilder`, without a copy of its values: each field is read from its column when it is accessed,
+    e.g. `row.close_price` or `row.property_details.latitude`. A nested object is None if all of its fields are
+    missing.
+    """
+
+    __slots__ = ("_table", "_index", "_prefix")
+
+    # Columns of the table that are not fields of the row, e.g. those tying it to the row of another table.
+    hidden_columns: FrozenSet[str] = frozenset()
+
+    def __init__(self, table: TableBuilder, index: int, prefix: str = "") -> None:
+        self._table = table
+        self._index = index
+        # The path of the nested object viewed, e.g. `"property_details."`, or "" for the row itself.
+        self._prefix = prefix
+
+    # Fields are typed `Any` rather than `object`, so that they can be used like the fields of the model they view,
+    # e.g. `row.property_details.latitude`.
+    def __getattr__(self, name: str) -> Any:
+        key = self._prefix + name
+        if key in self.hidden_columns:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        buffer = self._table.buffers_by_name.get(key)
+        if buffer is not None:
+            return buffer[self._index]
+        nested_buffers = self._table.nested_buffers.get(key)
+        if nested_buffers is not None:
+            if not any(buffer.valid[self._index] for buffer in nested_buffers):
+                return None
+            return RowView(self._table, self._index, f"{key}.")
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __dir__(self) -> List[str]:
+        return sorted({*super().__dir__(), *self._field_names()})
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._field_names())
+        return f"{type(self).__name__}({values})"
+
+    def to_dict(self) -> Dict[str, object]:
+        """Returns the values of the row, with a dict for each nested object."""
+        values: Dict[str, object] = {}
+        for name in self._field_names():
+            value = getattr(self, name)
+            values[name] = value.to_dict() if isinstance(value, RowView) else value
+        return values
+
+    def _field_names(self) -> List[str]:
+        fields = self._table.fields[self._prefix[:-1]]
+        if not self.hidden_columns:
+            return fields
+        return [name for name in fields if self._prefix + name not in self.hidden_columns]
+
+
+def model_columns(
+    model: type, *, prefix: str = "", path: Tuple[str, ...] = (), categories: Collection[str] = ()
+) -> List[ColumnSpec]:
+    """
+    Returns the columns of a table of `model`s: one per scalar field, with nested models flattened into columns named
+    `"<field>.<nested field>"`. Lists of models are left out; they belong in a table of their own.
+
+    Fields named in `categories`, at any depth, are dictionary-encoded (see `CATEGORY`).
+    """
+    columns: List[ColumnSpec] = []
+    for name, annotation in get_type_hints(model).items():
+        if name not in _field_names(model):
+            continue
+
+        annotation = _without_optional(annotation)
+        column_name = f"{prefix}{name}"
+        column_path = path + (name,)
+        if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+            columns.extend(model_columns(annotation, prefix=f"{column_name}.", path=column_path, categories=categories))
+            continue
+
+        kind = _kind(annotation)
+        if kind in (STR, STR_LIST) and name in categories:
+            kind = CATEGORY
+        if kind is not None:
+            columns.append((column_name, column_path, kind))
+    return columns
+
+
+def check_format(format: str) -> None:
+    """Raise early (before any request is sent) if `format` isn't supported or its library isn't installed."""
+    if format == "arrow":
+        _import_pyarrow()
+    elif format == "numpy":
+        _import_numpy()
+    else:
+        raise ValueError(f"Unknown columnar format {format!r}, expected one of {FORMATS}")
+
+
+def _nested_rows(
+    nested_rows: Dict[Tuple[str, ...], Sequence[Mapping[str, object]]], path: Tuple[str, ...]
+) -> Sequence[Mapping[str, object]]:
+    parent_rows = nested_rows.get(path[:-1])
+    if parent_rows is None:
+        parent_rows = nested_rows[path[:-1]] = _nested_rows(nested_rows, path[:-1])
+    key = path[-1]
+    rows = []
+    for row in parent_rows:
+        value = row.get(key)
+        rows.append(value if isinstance(value, Mapping) else _EMPTY_ROW)
+    return rows
+
+
+def _days_since_epoch(value: object) -> int:
+    if isinstance(value, str):
+        value = date_from_iso_format(value)
+    return value.toordinal() - _EPOCH_ORDINAL  # type: ignore[attr-defined]  # A date.
+
+
+def _field_names(model: type) -> Sequence[str]:
+    fields = getattr(model, "model_fields", None)
+    if fields is None:
+        fields = model.__fields__  # type: ignore[attr-defined]
+    return list(fields)
+
+
+def _without_optional(annotation: object) -> object:
+    if getattr(annotation, "__origin__", None) is Union:
+        args = [arg for arg in annotation.__args__ if arg is not type(None)]  # type: ignore[attr-defined]  # noqa: E721
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _kind(annotation: object) -> Optional[str]:
+    if annotation is bool:
+        return BOOL
+    if annotation is int:
+        return INT
+    if annotation is float:
+        return FLOAT
+    if annotation is str:
+        return STR
+    if annotation is datetime.date:
+        return DATE
+
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", None) or ()
+    if origin in (list, List) and args == (str,):
+        return STR_LIST
+    if all(isinstance(arg, str) for arg in args) and args:
+        # A `Literal` of strings.
+        return STR
+    return None
+
+
+def _import_numpy() -> types.ModuleType:
+    try:
+        # Third-Party Libraries
+        import numpy
+    except ImportError as e:
+        raise OpenExchangeError(
+            'The "numpy" package is required for columnar results. Install it with "pip install open-exchange[numpy]".'
+        ) from e
+    return numpy
+
+
+def _import_pyarrow() -> types.ModuleType:
+    try:
+        # Third-Party Libraries
+        import pyarrow
+    except ImportError as e:
+        raise OpenExchangeError(
+            'The "pyarrow" package is required for Arrow results. Install it with "pip install open-exchange[arrow]".'
+        ) from e
+    return pyarrow
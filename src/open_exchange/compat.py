@@ -1,3 +1,6 @@
+# Standard Library
+import datetime
+
 try:
     # Standard Library
     from functools import cached_property  # type: ignore
@@ -5,6 +8,15 @@ except ImportError:
     # Third-Party Libraries
     from cached_property import cached_property
 
+try:
+    date_from_iso_format = datetime.date.fromisoformat
+except AttributeError:  # Python < 3.7
+
+    def date_from_iso_format(value: str) -> datetime.date:
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
 __all__ = [
     "cached_property",
+    "date_from_iso_format",
 ]
@@ -11,7 +11,53 @@ DEFAULT_RETRYABLE_STATUS_CODES = {
 
 MAX_CONCURRENT_REQUESTS = 4
 
+# By default, keep this many chunks in flight per concurrent request so that the workers stay busy while the
+# consumer handles results.
+CHUNKS_IN_FLIGHT_PER_CONCURRENT_REQUEST = 2
+
 MAX_ADDRESSES_PER_PROPERTY_DETAILS_REQUEST = 50
 MAX_ADDRESSES_PER_PROPERTY_VALUES_REQUEST = 50
 MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST = 10
 MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST = 50
+
+# Addresses that are not sent to the API (e.g. cache hits) do not count toward the size of a request. Chunks are capped
+# at this many times the number of addresses per request, so that long runs of them are still returned promptly.
+MAX_CHUNK_SIZE_PER_REQUEST_SIZE = 10
+
+# AIMD parameters of adaptive batching, see `open_exchange.batching.AdaptiveBatchSize`.
+ADAPTIVE_BATCH_SIZE_TARGET_LATENCY = 10.0  # seconds
+ADAPTIVE_BATCH_SIZE_MAX_FAILURE_RATE = 0.1
+ADAPTIVE_BATCH_SIZE_DECREASE_FACTOR = 0.5
+
+# Addresses whose result failed with a retryable error are retried up to this many times, after an exponential backoff
+# of this many seconds times 2 ** (attempt - 1).
+DEFAULT_MAX_ADDRESS_RETRIES = 2
+ADDRESS_RETRY_BACKOFF_FACTOR = 0.5
+# Retries wait for the failures of other requests to fill a request for at most this many seconds after their backoff.
+ADDRESS_RETRY_MAX_BATCHING_WAIT = 0.25
+# Retries are capped at this ratio of the addresses requested in a fetch (plus a minimum), so that retries can't
+# multiply the load on the API while it is failing for most addresses.
+ADDRESS_RETRY_BUDGET_RATIO = 0.5
+ADDRESS_RETRY_BUDGET_MIN = 10
+
+# `open_exchange.sharding.ShardedRunner` hands out addresses to its worker processes in shards of this many addresses,
+# and keeps this many shards in flight per worker so that workers don't wait for the consumer.
+DEFAULT_SHARD_SIZE = 500
+SHARDS_IN_FLIGHT_PER_PROCESS = 2
+
+# The number of distinct addresses remembered to deduplicate the input of a fetch.
+DEDUPLICATION_WINDOW = 10_000
+
+# Streamed responses (e.g. `RentalComps.stream()`) are read off the connection this many bytes at a time.
+STREAMED_RESPONSE_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_CACHE_TTL = 24 * 60 * 60  # 1 day, in seconds
+DEFAULT_CACHE_MAX_ENTRIES = 1_000_000
+
+# The maximum number of times a request that the API rate limited (429 Too Many Requests) is retried.
+DEFAULT_MAX_RATE_LIMITED_RETRIES = 10
+# The number of seconds to wait after a 429 response without a valid `Retry-After` header.
+DEFAULT_RATE_LIMITED_RETRY_AFTER = 1.0
+# On a 429 response, the request rate is multiplied by this factor, but kept above `MIN_REQUESTS_PER_SECOND`.
+RATE_LIMITED_DECREASE_FACTOR = 0.5
+MIN_REQUESTS_PER_SECOND = 0.1
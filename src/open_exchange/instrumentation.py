@@ -0,0 +1,275 @@
+# Standard Library
+import collections
+import threading
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, cast
+
+# 1st Party Libraries
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.results import result_dict_api_code
+
+__all__ = [
+    "Instrumentation",
+    "MetricsRegistry",
+    "PrometheusInstrumentation",
+    "RequestEvent",
+    "Summary",
+    "api_code_counts",
+]
+
+
+class RequestEvent(NamedTuple):
+    """A request sent to the API, as reported to `Instrumentation.on_request()`. Durations are in seconds."""
+
+    # The endpoint path, e.g. "/data/rental-comps".
+    endpoint: str
+    # The HTTP status code of the final response.
+    status_code: int
+    # The number of addresses in the request.
+    num_addresses: int
+    # From sending the request to receiving the final response, including transport retries.
+    latency: float
+    # Waiting for a worker thread (or, in the async client, a concurrency slot) before the request was started.
+    queue_wait: float
+    # Waiting for the client's rate limits, including the backoff before retrying a 429 response.
+    rate_limit_wait: float
+    # The size of the encoded request body and of the final response body.
+    bytes_sent: int
+    bytes_received: int
+    # The number of times the request was retried after a connection error or a retryable status code.
+    retries: int
+    # The number of times the request was retried after a 429 Too Many Requests response.
+    rate_limited_retries: int
+
+
+class Instrumentation:
+    """
+    Hooks called by a client as it fetches results, e.g. to record metrics or traces. Pass an instance to the client as
+    `instrumentation=`.
+
+    The hooks do nothing by default: override the ones you need. They are called on the thread that does the work,
+    which for `on_request()` with an `OpenExchangeClient` is one of the client's worker threads, so they must be
+    thread-safe and fast. Exceptions raised by hooks propagate to the caller of `fetch()`.
+
+    Without instrumentation, the client skips the bookkeeping for these hooks altogether.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called when the final response of a request has been received, before its status code is checked."""
+
+    def on_chunk(self, endpoint: str, *, num_addresses: int, num_requested: int) -> None:
+        """
+        Called when a chunk of `num_addresses` input addresses is planned, of which `num_requested` are sent to the
+        API (the others are duplicates or cached).
+        """
+
+    def on_address_retries(self, endpoint: str, num_addresses: int) -> None:
+        """Called when a request retrying `num_addresses` addresses whose results failed is sent."""
+
+    def on_results(self, endpoint: str, api_codes: Mapping[int, int]) -> None:
+        """Called with the number of results of each `api_code` in a response."""
+
+    def on_parse(self, endpoint: str, *, num_results: int, duration: float) -> None:
+        """Called when `num_results` results have been parsed (into models or columns), which took `duration`."""
+
+
+class Summary:
+    """The count, total, minimum and maximum of a series of observations."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> Dict[str, float]:
+        if not self.count:
+            return {"count": 0, "total": 0.0, "mean": 0.0, "min": 0.0, "max": 0.0}
+        return {"count": self.count, "total": self.total, "mean": self.mean, "min": self.min, "max": self.max}
+
+
+class _EndpointMetrics:
+    __slots__ = ("counters", "summaries", "status_codes", "api_codes")
+
+    def __init__(self) -> None:
+        self.counters: Dict[str, int] = collections.Counter()
+        self.summaries: Dict[str, Summary] = collections.defaultdict(Summary)
+        self.status_codes: Dict[int, int] = collections.Counter()
+        self.api_codes: Dict[int, int] = collections.Counter()
+
+
+class MetricsRegistry(Instrumentation):
+    """
+    Instrumentation that aggregates metrics per endpoint in memory. Read them with `snapshot()`, e.g. to log them
+    periodically:
+
+    ```python
+    metrics = MetricsRegistry()
+    client = OpenExchangeClient(instrumentation=metrics)
+    ...
+    print(metrics.snapshot()["/data/rental-comps"]["latency"]["mean"])
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointMetrics] = collections.defaultdict(_EndpointMetrics)
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._endpoints[event.endpoint]
+            counters = metrics.counters
+            counters["requests"] += 1
+            counters["addresses_requested"] += event.num_addresses
+            counters["bytes_sent"] += event.bytes_sent
+            counters["bytes_received"] += event.bytes_received
+            counters["retries"] += event.retries
+            counters["rate_limited_retries"] += event.rate_limited_retries
+            metrics.status_codes[event.status_code] += 1
+            metrics.summaries["latency"].observe(event.latency)
+            metrics.summaries["queue_wait"].observe(event.queue_wait)
+            metrics.summaries["rate_limit_wait"].observe(event.rate_limit_wait)
+
+    def on_chunk(self, endpoint: str, *, num_addresses: int, num_requested: int) -> None:
+        with self._lock:
+            metrics = self._endpoints[endpoint]
+            metrics.counters["addresses"] += num_addresses
+            metrics.summaries["chunk_size"].observe(num_addresses)
+            metrics.summaries["chunk_requested"].observe(num_requested)
+
+    def on_address_retries(self, endpoint: str, num_addresses: int) -> None:
+        with self._lock:
+            self._endpoints[endpoint].counters["address_retries"] += num_addresses
+
+    def on_results(self, endpoint: str, api_codes: Mapping[int, int]) -> None:
+        with self._lock:
+            metrics_api_codes = self._endpoints[endpoint].api_codes
+            for api_code, count in api_codes.items():
+                metrics_api_codes[api_code] += count
+
+    def on_parse(self, endpoint: str, *, num_results: int, duration: float) -> None:
+        with self._lock:
+            metrics = self._endpoints[endpoint]
+            metrics.counters["results_parsed"] += num_results
+            metrics.summaries["parse_time"].observe(duration)
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Returns the metrics of each endpoint: its counters (`requests`, `addresses`, `addresses_requested`,
+        `bytes_sent`, `bytes_received`, `retries`, `rate_limited_retries`, `address_retries` and `results_parsed`),
+        `status_codes` and `api_codes` counts, and summaries of `latency`, `queue_wait`, `rate_limit_wait`,
+        `chunk_size`, `chunk_requested` and `parse_time`.
+        """
+        with self._lock:
+            snapshot: Dict[str, Dict[str, object]] = {}
+            for endpoint, metrics in self._endpoints.items():
+                endpoint_snapshot: Dict[str, object] = dict(metrics.counters)
+                endpoint_snapshot["status_codes"] = dict(metrics.status_codes)
+                endpoint_snapshot["api_codes"] = dict(metrics.api_codes)
+                for name, summary in metrics.summaries.items():
+                    endpoint_snapshot[name] = summary.to_dict()
+                snapshot[endpoint] = endpoint_snapshot
+            return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+_CHUNK_SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Instrumentation that records metrics with `prometheus_client`, labeled by endpoint.
+
+    Install it with `pip install open-exchange[prometheus]`.
+    """
+
+    def __init__(self, *, namespace: str = "open_exchange", registry: Optional[object] = None) -> None:
+        """
+        Args:
+          namespace: The prefix of the metric names.
+
+          registry: The `prometheus_client.CollectorRegistry` to register the metrics in. Defaults to the global
+              registry.
+        """
+        try:
+            # Third-Party Libraries
+            import prometheus_client
+        except ImportError as e:
+            raise OpenExchangeError(
+                'The "prometheus_client" package is required to use PrometheusInstrumentation. Install it with '
+                '"pip install open-exchange[prometheus]".'
+            ) from e
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        collector_registry = cast("prometheus_client.CollectorRegistry", registry)
+
+        def counter(name: str, documentation: str, *labels: str) -> "prometheus_client.Counter":
+            return prometheus_client.Counter(
+                name, documentation, ("endpoint",) + labels, namespace=namespace, registry=collector_registry
+            )
+
+        def histogram(
+            name: str, documentation: str, buckets: Sequence[float] = prometheus_client.Histogram.DEFAULT_BUCKETS
+        ) -> "prometheus_client.Histogram":
+            return prometheus_client.Histogram(
+                name, documentation, ("endpoint",), namespace=namespace, registry=collector_registry, buckets=buckets
+            )
+
+        self._requests = counter("requests", "Requests sent, by final status code", "status_code")
+        self._latency = histogram("request_latency_seconds", "Latency of requests")
+        self._queue_wait = histogram("request_queue_wait_seconds", "Time requests waited for a worker")
+        self._rate_limit_wait = histogram("request_rate_limit_wait_seconds", "Time requests waited for rate limits")
+        self._bytes_sent = counter("request_bytes", "Bytes of request bodies")
+        self._bytes_received = counter("response_bytes", "Bytes of response bodies")
+        self._retries = counter("retries", "Retried requests and addresses", "reason")
+        self._chunk_size = histogram("chunk_addresses", "Input addresses per chunk", _CHUNK_SIZE_BUCKETS)
+        self._results = counter("results", "Results, by api_code", "api_code")
+        self._parse_time = histogram("parse_seconds", "Time spent parsing results")
+
+    def on_request(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint
+        self._requests.labels(endpoint, str(event.status_code)).inc()
+        self._latency.labels(endpoint).observe(event.latency)
+        self._queue_wait.labels(endpoint).observe(event.queue_wait)
+        self._rate_limit_wait.labels(endpoint).observe(event.rate_limit_wait)
+        self._bytes_sent.labels(endpoint).inc(event.bytes_sent)
+        self._bytes_received.labels(endpoint).inc(event.bytes_received)
+        if event.retries:
+            self._retries.labels(endpoint, "transport").inc(event.retries)
+        if event.rate_limited_retries:
+            self._retries.labels(endpoint, "rate_limited").inc(event.rate_limited_retries)
+
+    def on_chunk(self, endpoint: str, *, num_addresses: int, num_requested: int) -> None:
+        self._chunk_size.labels(endpoint).observe(num_addresses)
+
+    def on_address_retries(self, endpoint: str, num_addresses: int) -> None:
+        self._retries.labels(endpoint, "address").inc(num_addresses)
+
+    def on_results(self, endpoint: str, api_codes: Mapping[int, int]) -> None:
+        for api_code, count in api_codes.items():
+            self._results.labels(endpoint, str(api_code)).inc(count)
+
+    def on_parse(self, endpoint: str, *, num_results: int, duration: float) -> None:
+        self._parse_time.labels(endpoint).observe(duration)
+
+
+def api_code_counts(result_dicts: List[dict]) -> Dict[int, int]:
+    """Returns the number of results (as returned by the API) of each `api_code`, see `result_api_code()`."""
+    return collections.Counter(result_dict_api_code(result_dict) for result_dict in result_dicts)
@@ -0,0 +1,143 @@
+# Standard Library
+import hashlib
+import json
+import os
+from typing import IO, List, Mapping, Optional, Tuple
+
+# 1st Party Libraries
+from open_exchange.exceptions import OpenExchangeError
+
+__all__ = [
+    "FetchJournal",
+]
+
+
+class FetchJournal:
+    """
+    A durable record of the parts of a fetch's input whose results have been returned, so that a fetch that is
+    interrupted (e.g. by a crash) can be resumed instead of started over.
+
+    Pass the journal to `fetch()` as `journal=`. Addresses are identified by their position in the input, so a
+    resumed fetch must be given the same input (and the same endpoint and parameters, which is checked). It only
+    requests the addresses the journal doesn't cover, and returns only their results.
+
+    A range of the input is recorded once its results have been returned and the consumer asked for the next ones, so
+    results are returned at least once: a crash while the consumer handles a chunk of results returns that chunk
+    again when resuming.
+
+    The journal is a small append-only file with one line per chunk of results, written through to the operating
+    system (and, if `fsync` is true, to disk) as each chunk completes. It is compacted when opened.
+    """
+
+    def __init__(self, path: str, *, fsync: bool = False) -> None:
+        """
+        Args:
+          path: The path of the journal file. It is created if it doesn't exist.
+
+          fsync: Whether to flush each record to disk, so that the journal also survives a power loss or an operating
+              system crash. Slower on most file systems.
+        """
+        self.path = path
+        self.fsync = fsync
+
+        self._fetch_key: Optional[str] = None
+        self._completed: List[Tuple[int, int]] = []
+        if os.path.exists(path):
+            self._load()
+        self._file: IO[str] = self._rewrite()
+
+    @property
+    def completed(self) -> List[Tuple[int, int]]:
+        """The sorted, non-overlapping `[start, end)` ranges of input positions whose results have been returned."""
+        self._completed = _merged(self._completed)
+        return list(self._completed)
+
+    @property
+    def num_completed(self) -> int:
+        """The number of input addresses whose results have been returned."""
+        return sum(end - start for start, end in self.completed)
+
+    def begin(self, endpoint: str, params: Mapping[str, object]) -> None:
+        """
+        Start (or resume) a fetch from `endpoint` with request parameters `params`.
+
+        Raises:
+          OpenExchangeError: If the journal was written by a fetch from another endpoint or with other parameters.
+        """
+        fetch_key = _fetch_key(endpoint, params)
+        if self._fetch_key is None:
+            self._fetch_key = fetch_key
+            self._write(json.dumps({"fetch": fetch_key}))
+        elif self._fetch_key != fetch_key:
+            raise OpenExchangeError(
+                f"The journal {self.path!r} belongs to a fetch from another endpoint or with other parameters"
+            )
+
+    def record(self, start: int, end: int) -> None:
+        """Record that the results of the input positions `[start, end)` have been returned."""
+        if start < end:
+            self._completed.append((start, end))
+            self._write(f"[{start},{end}]")
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "FetchJournal":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        for line_number, line in enumerate(lines, 1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if line_number == len(lines):
+                    # A record cut short by a crash.
+                    break
+                raise OpenExchangeError(f"{self.path}:{line_number}: invalid journal record {line!r}") from None
+            if isinstance(record, dict):
+                self._fetch_key = record.get("fetch")
+            else:
+                start, end = record
+                self._completed.append((start, end))
+
+    def _rewrite(self) -> IO[str]:
+        """Compact the journal's records into one per range, and return it opened for appending."""
+        lines = []
+        if self._fetch_key is not None:
+            lines.append(json.dumps({"fetch": self._fetch_key}))
+        lines.extend(f"[{start},{end}]" for start, end in self.completed)
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write("".join(f"{line}\n" for line in lines))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)
+        return open(self.path, "a", encoding="utf-8")
+
+    def _write(self, line: str) -> None:
+        self._file.write(f"{line}\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+def _fetch_key(endpoint: str, params: Mapping[str, object]) -> str:
+    params_part = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(f"{endpoint}\n{params_part}".encode()).hexdigest()
+
+
+def _merged(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,184 @@
+# Standard Library
+import datetime
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union, get_type_hints
+
+# Third-Party Libraries
+import pydantic
+
+# 1st Party Libraries
+from open_exchange.compat import date_from_iso_format
+from open_exchange.results import result_api_code
+
+if TYPE_CHECKING:
+    # 1st Party Libraries
+    from open_exchange.types.data import rental_comps_response
+
+__all__ = [
+    "parse_results",
+    "parse_rental_comps_results",
+]
+
+M = TypeVar("M", bound=pydantic.BaseModel)
+
+PYDANTIC_V2 = pydantic.VERSION.startswith("2.")
+
+_Converter = Callable[[object], object]
+
+
+def parse_results(model: Type[M], result_dicts: List[dict], *, validate: bool = True) -> List[M]:
+    """
+    Returns the results of a response as `model`s.
+
+    If `validate` is false, the results are trusted to match `model`:
+
+    * With pydantic v1, they are built without validation: nested models and dates are converted, but nothing else is
+      checked or coerced. Results that can't be built this way (e.g. a date in an unexpected format) are validated as
+      usual.
+    * With pydantic v2, all results of the response are validated at once by a compiled validator, which is faster
+      than building them without validation in Python.
+    """
+    if validate:
+        return [model.parse_obj(result_dict) for result_dict in result_dicts]
+
+    if PYDANTIC_V2:
+        return _list_validator(model)(result_dicts)  # type: ignore[return-value]
+
+    build = _trusted_builder(model)
+    results: List[M] = []
+    for result_dict in result_dicts:
+        try:
+            results.append(build(result_dict))  # type: ignore[arg-type]  # Builds a `model`.
+        except (TypeError, ValueError):
+            results.append(model.parse_obj(result_dict))
+    return results
+
+
+def parse_rental_comps_results(
+    result_dicts: List[dict], *, validate: bool = True
+) -> List["rental_comps_response.Result"]:
+    """
+    Returns the results of a rental comps response as models, like `parse_results()`, with the `api_code` of each
+    result filled in from its `error_message` where the API left it out (see `open_exchange.results.result_api_code`).
+    """
+    # Imported here, since every resource imports this module and the rental comps models are the largest.
+    # 1st Party Libraries
+    from open_exchange.types.data import rental_comps_response
+
+    results = parse_results(rental_comps_response.Result, result_dicts, validate=validate)
+    for result in results:
+        result.api_code = result_api_code(result.api_code, result.error_message)
+    return results
+
+
+# Model -> the validator of lists of it (pydantic v2) or the function that builds it from trusted data (pydantic v1).
+_LIST_VALIDATORS: Dict[Type[pydantic.BaseModel], Callable[[List[dict]], List[object]]] = {}
+_TRUSTED_BUILDERS: Dict[Type[pydantic.BaseModel], _Converter] = {}
+
+
+def _list_validator(model: Type[pydantic.BaseModel]) -> Callable[[List[dict]], List[object]]:
+    validator = _LIST_VALIDATORS.get(model)
+    if validator is None:
+        adapter = pydantic.TypeAdapter(List[model])  # type: ignore[attr-defined,valid-type]
+        validator = _LIST_VALIDATORS[model] = adapter.validate_python
+    return validator
+
+
+def _trusted_builder(model: Type[pydantic.BaseModel]) -> _Converter:
+    builder = _TRUSTED_BUILDERS.get(model)
+    if builder is None:
+        builder = _TRUSTED_BUILDERS[model] = _TrustedBuilder(model)
+    return builder
+
+
+class _TrustedBuilder:
+    """
+    Builds a pydantic v1 model from trusted data, with converters precomputed for the fields that need one.
+
+    Like `BaseModel.construct()`, but it converts nested models and dates, ignores unknown fields and doesn't copy
+    immutable defaults.
+    """
+
+    def __init__(self, model: Type[pydantic.BaseModel]) -> None:
+        self.model = model
+        # Register before resolving the fields, so that recursive models find this builder.
+        _TRUSTED_BUILDERS[model] = self
+
+        hints = get_type_hints(model)
+        # (name, alias, converter, field) of each field. The field is only kept if its default must be copied.
+        self.fields: List[Tuple[str, str, Optional[_Converter], object]] = []
+        for name, field in model.__fields__.items():
+            if field.required:
+                default = _REQUIRED
+            elif field.default_factory is None and isinstance(field.default, _IMMUTABLE_TYPES):
+                default = field.default
+            else:
+                default = field
+            self.fields.append((name, field.alias, _converter(hints[name]), default))
+        self.has_private_attributes = bool(model.__private_attributes__)
+
+    def __call__(self, data: object) -> object:
+        if not isinstance(data, Mapping):
+            raise TypeError(f"Expected a mapping to build {self.model.__name__}, got {type(data).__name__}")
+
+        values = {}
+        fields_set = set()
+        for name, alias, convert, default in self.fields:
+            value = data.get(alias, _REQUIRED)
+            if value is _REQUIRED:
+                if default is _REQUIRED:
+                    raise ValueError(f"{self.model.__name__}.{name} is required")
+                values[name] = default.get_default() if isinstance(default, pydantic.fields.ModelField) else default
+                continue
+            if convert is not None and value is not None:
+                value = convert(value)
+            values[name] = value
+            fields_set.add(name)
+
+        instance = self.model.__new__(self.model)
+        object.__setattr__(instance, "__dict__", values)
+        object.__setattr__(instance, "__fields_set__", fields_set)
+        if self.has_private_attributes:
+            instance._init_private_attributes()
+        return instance
+
+
+_REQUIRED = object()
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+
+def _converter(annotation: object) -> Optional[_Converter]:
+    """Returns the function that converts trusted JSON data to `annotation`, or None if it is used as is."""
+    origin = getattr(annotation, "__origin__", None)
+    args: Tuple[object, ...] = getattr(annotation, "__args__", None) or ()
+
+    if origin is Union:
+        not_none = [arg for arg in args if arg is not type(None)]  # noqa: E721
+        return _converter(not_none[0]) if len(not_none) == 1 else None
+
+    if origin in (list, List) and args:
+        convert_item = _converter(args[0])
+        if convert_item is None:
+            return None
+
+        def convert_list(value: object) -> object:
+            if not isinstance(value, list):
+                raise TypeError(f"Expected a list, got {type(value).__name__}")
+            return [convert_item(item) for item in value]
+
+        return convert_list
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, pydantic.BaseModel):
+            return _trusted_builder(annotation)
+        if annotation is datetime.date:
+            return _parse_date
+
+    return None
+
+
+def _parse_date(value: object) -> datetime.date:
+    if isinstance(value, datetime.date):
+        return value
+    if not isinstance(value, str):
+        raise TypeError(f"Expected a date string, got {type(value).__name__}")
+    return date_from_iso_format(value)
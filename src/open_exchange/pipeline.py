@@ -0,0 +1,394 @@
+# Standard Library
+import collections
+import heapq
+import itertools
+import time
+from typing import Dict, Generic, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
+
+# 1st Party Libraries
+from open_exchange.addresses import address_key
+from open_exchange.batching import AdaptiveBatchSize
+from open_exchange.cache import ResponseCache, cache_key
+from open_exchange.contants import (
+    ADDRESS_RETRY_BACKOFF_FACTOR,
+    ADDRESS_RETRY_BUDGET_MIN,
+    ADDRESS_RETRY_BUDGET_RATIO,
+    ADDRESS_RETRY_MAX_BATCHING_WAIT,
+    DEDUPLICATION_WINDOW,
+    DEFAULT_MAX_ADDRESS_RETRIES,
+    MAX_CHUNK_SIZE_PER_REQUEST_SIZE,
+)
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.results import is_retryable_result
+
+T = TypeVar("T", bound=Mapping[str, object])
+
+
+class Chunk(Generic[T]):
+    """
+    A contiguous run of input addresses and their results.
+
+    Only the addresses at `request_positions` are sent to the API. The results of the others are either known when
+    the chunk is created (e.g. from the cache) or are copied from the result of a duplicate address once it arrives.
+    """
+
+    __slots__ = (
+        "start",
+        "addresses",
+        "results",
+        "request_positions",
+        "request_keys",
+        "request_cache_keys",
+        "dependents",
+        "num_pending",
+        "num_retrying",
+    )
+
+    def __init__(self, start: int) -> None:
+        # The position of the chunk's first address in the input.
+        self.start = start
+        self.addresses: List[T] = []
+        self.results: List[Optional[dict]] = []
+        self.request_positions: List[int] = []
+        self.request_keys: List[str] = []
+        self.request_cache_keys: List[Optional[str]] = []
+        # Duplicates of this chunk's requested addresses, by position in this chunk: (chunk, position in that chunk).
+        self.dependents: Dict[int, List[Tuple[Chunk[T], int]]] = {}
+        # The number of addresses whose result isn't known yet, and how many of them are waiting to be retried.
+        self.num_pending = 0
+        self.num_retrying = 0
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the results of all of the chunk's addresses are known."""
+        return self.num_pending == 0
+
+
+class Batch(Generic[T]):
+    """
+    The addresses sent in one request: the requested addresses of a chunk or retries of failed addresses, which may
+    come from any number of chunks.
+    """
+
+    __slots__ = ("entries", "is_retry", "batch_size_generation")
+
+    def __init__(self, entries: List[Tuple[Chunk[T], int, int]], *, is_retry: bool, batch_size_generation: int) -> None:
+        # (chunk, index in the chunk's `request_positions`, attempt number).
+        self.entries = entries
+        self.is_retry = is_retry
+        self.batch_size_generation = batch_size_generation
+
+
+class ChunkPlanner(Generic[T]):
+    """
+    Groups a stream of addresses into chunks and merges the responses of their requests back into them.
+
+    The planner doesn't send requests itself, so the same planning is shared by the thread pool and asyncio
+    resources: feed it addresses with `add()` (and `flush()` at the end of the input), send the batch of each chunk
+    returned by `first_batch()` as well as the batches returned by `retry_batch()`, and hand the response of each
+    batch's request to `complete()`, or the batch to `fail()` if its request failed as a whole. A chunk can be returned
+    once it `is_ready`.
+
+    Addresses are requested as given. If `deduplicate` is true, an address that refers to the same property as one of
+    the last `DEDUPLICATION_WINDOW` distinct addresses (see `open_exchange.addresses.address_key`) is not requested
+    again; it gets a copy of that address's result, with its own token.
+
+    Addresses whose result failed with a retryable error are retried up to `max_retries` times, after an exponential
+    backoff. Rather than being sent on their own, retries are batched together with the failed addresses of other
+    chunks for up to `ADDRESS_RETRY_MAX_BATCHING_WAIT` seconds, and the total number of retries is capped by a budget
+    that grows with the number of addresses requested.
+
+    If `batch_size` is given, requests hold its current size (capped at `max_addresses_per_request`) instead of
+    `max_addresses_per_request` addresses, and the latency passed to `complete()` adapts it.
+
+    Addresses at the input positions of the `[start, end)` ranges of `completed` (e.g. those recorded by a
+    `FetchJournal`) are skipped: they are neither requested nor returned in a chunk. A chunk never spans a skipped
+    address, so each chunk covers the contiguous range of input positions `[chunk.start, chunk.start +
+    len(chunk.addresses))`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        params: Mapping[str, object],
+        max_addresses_per_request: int,
+        cache: Optional[ResponseCache] = None,
+        deduplicate: bool = False,
+        batch_size: Optional[AdaptiveBatchSize] = None,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        completed: Sequence[Tuple[int, int]] = (),
+    ) -> None:
+        self.path = path
+        self.params = params
+        self.max_addresses_per_request = max_addresses_per_request
+        self.cache = cache
+        self.deduplicate = deduplicate
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+
+        self._max_chunk_size = max_addresses_per_request * MAX_CHUNK_SIZE_PER_REQUEST_SIZE
+        self._chunk: Chunk[T] = Chunk(0)
+        # The input position of the next address, and the completed ranges of input positions from the next one on.
+        self._position = 0
+        self._completed: Iterator[Tuple[float, float]] = iter(sorted(completed))
+        self._skip_start, self._skip_end = next(self._completed, _NO_RANGE)
+        # Address key -> its result, or the chunk and position it will be returned in.
+        self._seen: "collections.OrderedDict[str, Union[dict, Tuple[Chunk[T], int]]]" = collections.OrderedDict()
+        # Addresses waiting to be retried: (time to retry at, tie breaker, chunk, index, attempt number).
+        self._retries: List[Tuple[float, int, Chunk[T], int, int]] = []
+        self._retry_counter = itertools.count()
+        self._retry_budget: float = ADDRESS_RETRY_BUDGET_MIN
+
+    def add(self, address: T) -> Optional[Chunk[T]]:
+        """Add the next address of the input. Returns a chunk if the address completed one."""
+        self._position += 1
+        if self._position > self._skip_start:
+            while self._position > self._skip_end:
+                self._skip_start, self._skip_end = next(self._completed, _NO_RANGE)
+            if self._position > self._skip_start:
+                return self._skip()
+
+        chunk = self._chunk
+        position = len(chunk.addresses)
+        chunk.addresses.append(address)
+        chunk.results.append(None)
+
+        key = address_key(address)
+        if self.deduplicate and self._add_duplicate(chunk, position, key):
+            return self._close_chunk() if position + 1 >= self._max_chunk_size else None
+
+        cache_key_ = None
+        if self.cache is not None:
+            cache_key_ = cache_key(self.path, address, self.params)
+            cached = self.cache.get(self.path, cache_key_)
+            if cached is not None:
+                chunk.results[position] = _with_token(cached, address)
+                self._remember(key, cached)
+                return self._close_chunk() if position + 1 >= self._max_chunk_size else None
+
+        chunk.request_positions.append(position)
+        chunk.request_keys.append(key)
+        chunk.request_cache_keys.append(cache_key_)
+        chunk.num_pending += 1
+        self._remember(key, (chunk, position))
+        if len(chunk.request_positions) >= self._request_size or position + 1 >= self._max_chunk_size:
+            return self._close_chunk()
+        return None
+
+    @property
+    def _request_size(self) -> int:
+        if self.batch_size is None:
+            return self.max_addresses_per_request
+        return min(self.batch_size.size, self.max_addresses_per_request)
+
+    @property
+    def _batch_size_generation(self) -> int:
+        return 0 if self.batch_size is None else self.batch_size.generation
+
+    def flush(self) -> Optional[Chunk[T]]:
+        """Returns the last, partial chunk at the end of the input, if any."""
+        if not self._chunk.addresses:
+            return None
+        return self._close_chunk()
+
+    def first_batch(self, chunk: Chunk[T]) -> Optional[Batch[T]]:
+        """Returns the batch of the chunk's requested addresses, if it has any."""
+        if not chunk.request_positions:
+            return None
+        self._retry_budget += len(chunk.request_positions) * ADDRESS_RETRY_BUDGET_RATIO
+        return Batch(
+            [(chunk, idx, 0) for idx in range(len(chunk.request_positions))],
+            is_retry=False,
+            batch_size_generation=self._batch_size_generation,
+        )
+
+    def retry_batch(self, *, flush: bool) -> Optional[Batch[T]]:
+        """
+        Returns a batch of addresses to retry whose backoff has passed, once there are enough to fill a request or
+        the first of them has waited `ADDRESS_RETRY_MAX_BATCHING_WAIT` seconds for others.
+
+        If `flush` is true, the addresses to retry are returned as a partial batch as soon as a backoff has passed.
+        Pass it when waiting for more failed addresses would hold up the fetch, e.g. when no other request that could
+        add them to the batch is in flight.
+        """
+        now = time.monotonic()
+        retry_at = self.next_retry_at(flush=flush)
+        if retry_at is None or retry_at > now:
+            return None
+
+        entries: List[Tuple[Chunk[T], int, int]] = []
+        while self._retries and self._retries[0][0] <= now and len(entries) < self._request_size:
+            _, _, chunk, idx, attempt = heapq.heappop(self._retries)
+            chunk.num_retrying -= 1
+            entries.append((chunk, idx, attempt))
+        return Batch(entries, is_retry=True, batch_size_generation=self._batch_size_generation)
+
+    def retry_now(self, chunk: Chunk[T]) -> None:
+        """Make the chunk's addresses that are waiting to be retried due now, skipping the rest of their backoff."""
+        now = time.monotonic()
+        self._retries = [
+            (min(retry_at, now) if retry_chunk is chunk else retry_at, counter, retry_chunk, idx, attempt)
+            for retry_at, counter, retry_chunk, idx, attempt in self._retries
+        ]
+        heapq.heapify(self._retries)
+
+    def next_retry_at(self, *, flush: bool) -> Optional[float]:
+        """Returns the `time.monotonic()` at which `retry_batch()` will return the next batch, if it will."""
+        if not self._retries:
+            return None
+        retry_at = self._retries[0][0] + (0.0 if flush else ADDRESS_RETRY_MAX_BATCHING_WAIT)
+        if len(self._retries) >= self._request_size:
+            retry_at = min(retry_at, heapq.nsmallest(self._request_size, self._retries)[-1][0])
+        return retry_at
+
+    def request_body(self, batch: Batch[T]) -> dict:
+        return {
+            **self.params,
+            "addresses": [chunk.addresses[chunk.request_positions[idx]] for chunk, idx, _ in batch.entries],
+        }
+
+    def complete(self, batch: Batch[T], response: dict, *, latency: Optional[float] = None) -> None:
+        """
+        Merge the response of the batch's request, which took `latency` seconds, into its chunks.
+
+        Addresses that failed with a retryable error are queued to be retried, if they have retries left.
+
+        Raises:
+          OpenExchangeError: If the response doesn't have exactly one result per address of the batch.
+        """
+        result_dicts: List[dict] = response["results"]
+        if len(result_dicts) != len(batch.entries):
+            # The results can't be matched to their addresses, and the chunks missing one would never be ready.
+            raise OpenExchangeError(
+                f"The API returned {len(result_dicts)} results for a request of {len(batch.entries)} addresses to "
+                f"{self.path}"
+            )
+
+        if self.batch_size is not None and latency is not None and batch.entries:
+            self.batch_size.record(
+                batch.batch_size_generation,
+                num_addresses=len(batch.entries),
+                latency=latency,
+                num_failed=sum(1 for result_dict in result_dicts if is_retryable_result(result_dict)),
+            )
+
+        now = time.monotonic()
+        cacheable: Dict[str, dict] = {}
+        for (chunk, idx, attempt), result_dict in zip(batch.entries, result_dicts):
+            if attempt < self.max_retries and self._retry_budget >= 1 and is_retryable_result(result_dict):
+                self._queue_retry(chunk, idx, attempt, now)
+                continue
+
+            position = chunk.request_positions[idx]
+            key = chunk.request_keys[idx]
+            seen = self._seen.get(key)
+            if isinstance(seen, tuple) and seen[0] is chunk and seen[1] == position:
+                # Keep the result instead of the whole chunk for later duplicates, unless it failed: then give
+                # later duplicates another chance.
+                if _is_successful(result_dict):
+                    self._seen[key] = result_dict
+                else:
+                    del self._seen[key]
+
+            cache_key_ = chunk.request_cache_keys[idx]
+            if cache_key_ is not None and _is_successful(result_dict):
+                cacheable[cache_key_] = result_dict
+
+            _resolve(chunk, position, result_dict)
+            for dependent, dependent_position in chunk.dependents.pop(position, ()):
+                _resolve(
+                    dependent, dependent_position, _with_token(result_dict, dependent.addresses[dependent_position])
+                )
+
+        if self.cache is not None and cacheable:
+            self.cache.set_many(self.path, cacheable)
+
+    def fail(self, batch: Batch[T]) -> bool:
+        """
+        Record that the batch's request failed as a whole with a retryable error (e.g. a 503 status code or a timeout,
+        once the transport gave up retrying it) and queue its addresses to be retried.
+
+        Like the addresses of any other retry, they are batched up to the current request size, so with a `batch_size`
+        the retries are split into the smaller requests that the failure shrinks it to.
+
+        Returns false, without queueing any of them, if not all of the addresses have a retry left: the chunks waiting
+        for them could never be returned.
+        """
+        if self._retry_budget < len(batch.entries) or any(
+            attempt >= self.max_retries for _, _, attempt in batch.entries
+        ):
+            return False
+
+        if self.batch_size is not None and batch.entries:
+            self.batch_size.record(
+                batch.batch_size_generation,
+                num_addresses=len(batch.entries),
+                latency=None,
+                num_failed=len(batch.entries),
+            )
+
+        now = time.monotonic()
+        for chunk, idx, attempt in batch.entries:
+            self._queue_retry(chunk, idx, attempt, now)
+        return True
+
+    def _queue_retry(self, chunk: Chunk[T], idx: int, attempt: int, now: float) -> None:
+        self._retry_budget -= 1
+        retry_at = now + ADDRESS_RETRY_BACKOFF_FACTOR * 2**attempt
+        heapq.heappush(self._retries, (retry_at, next(self._retry_counter), chunk, idx, attempt + 1))
+        chunk.num_retrying += 1
+
+    def _add_duplicate(self, chunk: Chunk[T], position: int, key: str) -> bool:
+        """Fill in the result of the address at `position` from a duplicate seen before, if any."""
+        seen = self._seen.get(key)
+        if seen is None:
+            return False
+
+        self._seen.move_to_end(key)
+        if isinstance(seen, dict):
+            chunk.results[position] = _with_token(seen, chunk.addresses[position])
+            return True
+
+        source, source_position = seen
+        source.dependents.setdefault(source_position, []).append((chunk, position))
+        chunk.num_pending += 1
+        return True
+
+    def _remember(self, key: str, value: Union[dict, Tuple[Chunk[T], int]]) -> None:
+        if not self.deduplicate:
+            return
+        self._seen[key] = value
+        if len(self._seen) > DEDUPLICATION_WINDOW:
+            self._seen.popitem(last=False)
+
+    def _skip(self) -> Optional[Chunk[T]]:
+        """Skip the address before `self._position`. Returns the current chunk, if any, so that it stays contiguous."""
+        chunk = self._close_chunk() if self._chunk.addresses else None
+        self._chunk.start = self._position
+        return chunk
+
+    def _close_chunk(self) -> Chunk[T]:
+        chunk = self._chunk
+        self._chunk = Chunk(self._position)
+        return chunk
+
+
+_NO_RANGE: Tuple[float, float] = (float("inf"), float("inf"))
+
+
+def _resolve(chunk: Chunk[T], position: int, result_dict: dict) -> None:
+    chunk.results[position] = result_dict
+    chunk.num_pending -= 1
+
+
+def _with_token(result_dict: dict, address: Mapping[str, object]) -> dict:
+    """Returns a copy of the result with the token of the address it is returned for."""
+    return {**result_dict, "token": address.get("token")}
+
+
+def _is_successful(result_dict: dict) -> bool:
+    if result_dict.get("error_message"):
+        return False
+    api_code = result_dict.get("api_code")
+    return api_code is None or api_code == 200
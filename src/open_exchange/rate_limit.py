@@ -0,0 +1,186 @@
+# Standard Library
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, ContextManager, MutableSequence, Optional
+
+# 1st Party Libraries
+from open_exchange.contants import (
+    DEFAULT_RATE_LIMITED_RETRY_AFTER,
+    MIN_REQUESTS_PER_SECOND,
+    RATE_LIMITED_DECREASE_FACTOR,
+)
+
+if TYPE_CHECKING:
+    # Standard Library
+    import multiprocessing.context
+
+logger = logging.getLogger(__name__)
+
+# The number of recent requests used to measure the rate at which requests are sent.
+_RECENT_REQUESTS = 100
+
+# The limiter's state is a flat array of floats, so that it can live in shared memory.
+_PAUSED_UNTIL = 0
+_DECREASED_AT = 1
+# Token buckets: rate (0 if there is no limit), tokens, updated at.
+_REQUESTS = 2
+_ADDRESSES = 5
+_RATE = 0
+_TOKENS = 1
+_UPDATED_AT = 2
+# A ring buffer of the times of the recent requests: number of requests in it, index of the next one, times.
+_NUM_RECENT = 8
+_NEXT_RECENT = 9
+_RECENT = 10
+_STATE_SIZE = _RECENT + _RECENT_REQUESTS
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests and addresses sent to the API by all resources of a client.
+
+    `max_requests_per_second` and `max_addresses_per_second` are optional client-side limits. On top of them, the
+    limiter backs off when the API responds with 429 Too Many Requests: every request waits for the response's
+    `Retry-After`, and the request rate is cut to `RATE_LIMITED_DECREASE_FACTOR` of the rate at the time. After that,
+    each successful request raises the rate again by about one request per second per second, until the next 429.
+    The rate thus settles just below the highest rate the API sustains, instead of oscillating between bursts and
+    failures.
+
+    If `mp_context` is given, the limiter's state is kept in shared memory, so that clients in several processes
+    started from that `multiprocessing` context can share it (see `open_exchange.sharding.ShardedRunner`). The limiter
+    must then be passed to the processes when they are started, e.g. in the `initargs` of a pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_requests_per_second: Optional[float] = None,
+        max_addresses_per_second: Optional[float] = None,
+        mp_context: Optional["multiprocessing.context.BaseContext"] = None,
+    ) -> None:
+        self.max_requests_per_second = max_requests_per_second
+        self.max_addresses_per_second = max_addresses_per_second
+
+        self._lock: ContextManager[object]
+        self._state: MutableSequence[float]
+        if mp_context is None:
+            self._lock = threading.Lock()
+            self._state = [0.0] * _STATE_SIZE
+        else:
+            self._lock = mp_context.Lock()
+            self._state = mp_context.RawArray("d", _STATE_SIZE)
+
+        now = time.monotonic()
+        for offset, rate in ((_REQUESTS, max_requests_per_second), (_ADDRESSES, max_addresses_per_second)):
+            self._state[offset + _RATE] = rate or 0.0
+            # Don't let tokens pile up while idle: requests are spaced evenly rather than sent in bursts, which the
+            # API may count against a window shorter than a second.
+            self._state[offset + _TOKENS] = 1.0
+            self._state[offset + _UPDATED_AT] = now
+
+    def reserve(self, num_addresses: int) -> float:
+        """Reserve capacity for a request and return the number of seconds to wait before sending it."""
+        with self._lock:
+            state = self._state
+            now = time.monotonic()
+            delay = max(0.0, state[_PAUSED_UNTIL] - now)
+            delay = max(delay, self._reserve_tokens(_REQUESTS, now, 1))
+            delay = max(delay, self._reserve_tokens(_ADDRESSES, now, num_addresses))
+
+            next_recent = int(state[_NEXT_RECENT])
+            state[_RECENT + next_recent] = now + delay
+            state[_NEXT_RECENT] = (next_recent + 1) % _RECENT_REQUESTS
+            state[_NUM_RECENT] = min(state[_NUM_RECENT] + 1, _RECENT_REQUESTS)
+            return delay
+
+    def acquire(self, num_addresses: int) -> None:
+        """Block until a request with `num_addresses` addresses may be sent."""
+        delay = self.reserve(num_addresses)
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_success(self) -> None:
+        """Record a request that wasn't rate limited."""
+        with self._lock:
+            rate = self._state[_REQUESTS + _RATE]
+            if not rate or rate == self.max_requests_per_second:
+                return
+            rate += 1 / rate
+            if self.max_requests_per_second is not None and rate >= self.max_requests_per_second:
+                rate = self.max_requests_per_second
+            self._state[_REQUESTS + _RATE] = rate
+
+    def record_rate_limited(self, sent_at: float, retry_after: Optional[float]) -> None:
+        """
+        Record a request that was rate limited.
+
+        Args:
+          sent_at: The `time.monotonic()` at which the request was sent.
+
+          retry_after: The number of seconds the API asked us to wait, if any.
+        """
+        if retry_after is None:
+            retry_after = DEFAULT_RATE_LIMITED_RETRY_AFTER
+        with self._lock:
+            state = self._state
+            now = time.monotonic()
+            state[_PAUSED_UNTIL] = max(state[_PAUSED_UNTIL], now + retry_after)
+
+            # Requests that were sent before the last decrease can't lower the rate again, so a burst of requests that
+            # were in flight at the same time only counts once.
+            if sent_at < state[_DECREASED_AT]:
+                return
+            state[_DECREASED_AT] = now
+
+            rate = state[_REQUESTS + _RATE]
+            if not rate:
+                rate = self._recent_request_rate(now)
+                state[_REQUESTS + _UPDATED_AT] = now
+            rate = max(MIN_REQUESTS_PER_SECOND, rate * RATE_LIMITED_DECREASE_FACTOR)
+            state[_REQUESTS + _RATE] = rate
+            state[_REQUESTS + _TOKENS] = min(state[_REQUESTS + _TOKENS], 0.0)
+            logger.info(
+                "Rate limited by the API, pausing for %.2fs and lowering the request rate to %.2f/s", retry_after, rate
+            )
+
+    def _reserve_tokens(self, offset: int, now: float, tokens: float) -> float:
+        """
+        Take `tokens` from the token bucket at `offset` in the state and return the number of seconds to wait before
+        they are available.
+        """
+        state = self._state
+        rate = state[offset + _RATE]
+        if not rate:
+            return 0.0
+        available = min(1.0, state[offset + _TOKENS] + (now - state[offset + _UPDATED_AT]) * rate) - tokens
+        state[offset + _TOKENS] = available
+        state[offset + _UPDATED_AT] = now
+        return 0.0 if available >= 0 else -available / rate
+
+    def _recent_request_rate(self, now: float) -> float:
+        state = self._state
+        num_recent = int(state[_NUM_RECENT])
+        if num_recent < 2:
+            return MIN_REQUESTS_PER_SECOND
+        oldest = state[_RECENT + (int(state[_NEXT_RECENT]) if num_recent == _RECENT_REQUESTS else 0)]
+        elapsed = max(now - oldest, 1e-3)
+        return num_recent / elapsed
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the number of seconds to wait from a `Retry-After` header (delay-seconds or HTTP-date), if valid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # Standard Library
+    import email.utils
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
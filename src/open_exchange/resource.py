@@ -1,9 +1,41 @@
 # Standard Library
-from typing import TYPE_CHECKING
+import collections
+import concurrent.futures
+import functools
+import time
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+# 1st Party Libraries
+from open_exchange.batching import AdaptiveBatchSize
+from open_exchange.contants import CHUNKS_IN_FLIGHT_PER_CONCURRENT_REQUEST, DEFAULT_MAX_ADDRESS_RETRIES
+from open_exchange.instrumentation import Instrumentation, api_code_counts
+from open_exchange.journal import FetchJournal
+from open_exchange.pipeline import Batch, Chunk, ChunkPlanner
 
 if TYPE_CHECKING:
     # 1st Party Libraries
-    from open_exchange.client import OpenExchangeClient
+    from open_exchange.client import AsyncOpenExchangeClient, OpenExchangeClient
+
+T = TypeVar("T", bound=Mapping[str, object])
+R = TypeVar("R")
+# The future of a submitted request: a `concurrent.futures.Future` or an `asyncio.Future`.
+F = TypeVar("F", bound=Hashable)
 
 
 class APIResource:
@@ -12,3 +44,579 @@ class APIResource:
     def __init__(self, client: "OpenExchangeClient") -> None:
         self.client = client
         self.request = client._request
+
+    def _parse(self, path: str, parse: Callable[[List[dict]], R], result_dicts: List[dict]) -> R:
+        """Returns `parse(result_dicts)`, reporting how long it took to the client's instrumentation."""
+        return _timed_parse(self.client.instrumentation, path, parse, result_dicts)
+
+    def _stream_results(
+        self, path: str, body: Mapping[str, object], parse: Callable[[List[dict]], List[R]]
+    ) -> Iterator[R]:
+        """
+        Sends a single request and yields the parsed results of its response one at a time, as soon as each has been
+        received (see `OpenExchangeClient._stream_request`).
+        """
+        instrumentation = self.client.instrumentation
+        for result_dict in self.client._stream_request("POST", path, dict(body)):
+            if instrumentation is not None:
+                instrumentation.on_results(path, api_code_counts([result_dict]))
+            yield from self._parse(path, parse, [result_dict])
+
+    def _fetch_chunks(
+        self,
+        path: str,
+        addresses: Iterable[T],
+        *,
+        body: Mapping[str, object],
+        max_addresses_per_request: int,
+        max_chunks_in_flight: Optional[int],
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> Iterator[Tuple[List[T], List[dict]]]:
+        """
+        Submit one request per chunk of addresses and yield each chunk with the results of its addresses, in
+        submission order or, if `ordered` is false, as soon as each response arrives.
+
+        Addresses are pulled from the input lazily: at most `max_chunks_in_flight` chunks are submitted but not yet
+        yielded at any time, so memory stays flat regardless of the size of the input. Duplicate addresses (if
+        `deduplicate` is true) and, if the client has a cache, cached addresses are not requested.
+
+        If `adaptive_batching` is true, the number of addresses per request adapts to the latency and error rate of
+        the requests, between 1 and `max_addresses_per_request`.
+
+        Addresses whose result failed with a retryable error, or whose request failed as a whole with one (e.g. a 503
+        status code or a timeout), are retried up to `max_retries` times in the background, batched together with the
+        failures of other chunks; a chunk is yielded once all of its results are final.
+
+        If a `journal` is given, the input positions it records as completed are skipped, and the positions of each
+        chunk are recorded in it once the consumer is done with the chunk (i.e. asks for the next one).
+        """
+        state: _FetchState[T, concurrent.futures.Future] = _FetchState(
+            self.client,
+            path,
+            body=body,
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        )
+        chunks = _planned_chunks(state.planner, addresses)
+
+        def submit(batch: Batch[T]) -> None:
+            future = self.client._scheduler.submit(
+                path,
+                functools.partial(
+                    self.client._timed_request,
+                    method="POST",
+                    path=path,
+                    body=state.planner.request_body(batch),
+                    submitted_at=time.monotonic(),
+                ),
+            )
+            state.submitted(future, batch)
+
+        try:
+            while True:
+                while state.wants_chunk():
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        state.end_of_input()
+                        break
+                    batch = state.add_chunk(chunk)
+                    if batch is not None:
+                        submit(batch)
+
+                for batch in state.retry_batches():
+                    submit(batch)
+
+                ready_chunks = state.pop_ready()
+                if ready_chunks:
+                    for chunk in ready_chunks:
+                        yield chunk.addresses, chunk.results  # type: ignore[misc]  # All results are known.
+                        state.chunk_done(chunk)
+                    continue
+
+                if state.is_done:
+                    return
+
+                timeout = state.timeout()
+                if not state.in_flight:
+                    # Only retries are left, waiting for their backoff.
+                    time.sleep(timeout or 0.0)
+                    continue
+
+                done, _ = concurrent.futures.wait(
+                    state.in_flight, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    try:
+                        latency, response = future.result()
+                    except Exception as error:
+                        if not self.client._is_retryable_error(error) or not state.fail(future):
+                            raise
+                        continue
+                    state.complete(future, response, latency=latency)
+        finally:
+            # The consumer stopped early (or a request failed), don't send requests nobody is waiting for.
+            for future in state.in_flight:
+                future.cancel()
+
+
+class EndpointResource(APIResource):
+    """A resource whose `fetch()` sends addresses to a single bulk endpoint."""
+
+    # The endpoint, and the most addresses it accepts per request.
+    path: str
+    max_addresses_per_request: int
+
+    def fetch_raw(
+        self,
+        addresses: Iterable[T],
+        *,
+        body: Optional[Mapping[str, object]] = None,
+        max_addresses_per_request: Optional[int] = None,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Fetch the results of addresses as returned by the API, without parsing them into models.
+
+        The resource's `fetch()` and its variants are built on this: it yields the result dicts of consecutive runs of
+        addresses, in input order unless `ordered` is false. Where the resource's models fill in a field the API
+        leaves out (the `api_code` of rental comps), so do these results. The options are shared with `fetch()`.
+
+        Args:
+          addresses: An iterable of address objects, each specifying a property location.
+
+          body: The parameters of the requests besides the addresses, as sent to the API (e.g. the `filters` and
+              `num_comps` of rental comps).
+
+          max_addresses_per_request: The maximum number of addresses to include in each request. Defaults to the
+              endpoint's maximum.
+
+          max_chunks_in_flight: The maximum number of requests submitted whose results have not been returned yet.
+              Addresses are read from `addresses` only as this window frees up, so memory use does not grow with
+              the size of the input. Defaults to twice the client's concurrency limit.
+
+          ordered: Whether to return results in the same order as `addresses`. If false, the results of each
+              request are returned as soon as it completes, so one slow request doesn't hold back the others. Use
+              the `token` of each address to match it with its result.
+
+          deduplicate: Whether to request each property only once when `addresses` contains it more than once
+              (ignoring case, whitespace and tokens). Every duplicate still gets its own result, with its own token.
+
+          adaptive_batching: Whether to adapt the number of addresses per request to the latency and error rate of
+              the requests, between 1 and `max_addresses_per_request`: smaller requests while the API struggles,
+              larger ones while it is healthy.
+
+          max_retries: The maximum number of times to retry an address whose result failed with a retryable error
+              (e.g. a 503 `api_code`), or whose request still failed with one after the client's own retries (e.g. a
+              503 status code or a timeout). Failed addresses are retried in the background after an exponential
+              backoff, batched together with the failures of other requests. A request that fails as a whole once its
+              addresses have no retries left raises its error.
+
+          journal: An _optional_ `open_exchange.journal.FetchJournal` of the parts of the input whose results have
+              been returned. Addresses it covers are skipped, and results are recorded in it once consumed, so a
+              fetch that was interrupted resumes where it stopped when run again with the same input and journal.
+
+        Returns:
+          An iterator of lists of result dicts.
+        """
+        for _, result_dicts in self._fetch_chunks(
+            self.path,
+            addresses,
+            body=body or {},
+            max_addresses_per_request=max_addresses_per_request or self.max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            yield self._raw_results(result_dicts)
+
+    def _raw_results(self, result_dicts: List[dict]) -> List[dict]:
+        """Returns the result dicts of `fetch_raw()`, overridden by the resources whose models change them."""
+        return result_dicts
+
+
+class AsyncAPIResource:
+    client: "AsyncOpenExchangeClient"
+
+    def __init__(self, client: "AsyncOpenExchangeClient") -> None:
+        self.client = client
+        self.request = client._request
+
+    def _parse(self, path: str, parse: Callable[[List[dict]], R], result_dicts: List[dict]) -> R:
+        """Returns `parse(result_dicts)`, reporting how long it took to the client's instrumentation."""
+        return _timed_parse(self.client.instrumentation, path, parse, result_dicts)
+
+    async def _stream_results(
+        self, path: str, body: Mapping[str, object], parse: Callable[[List[dict]], List[R]]
+    ) -> AsyncIterator[R]:
+        """
+        Sends a single request and yields the parsed results of its response one at a time, as soon as each has been
+        received (see `AsyncOpenExchangeClient._stream_request`).
+        """
+        instrumentation = self.client.instrumentation
+        async for result_dict in self.client._stream_request("POST", path, dict(body)):
+            if instrumentation is not None:
+                instrumentation.on_results(path, api_code_counts([result_dict]))
+            for result in self._parse(path, parse, [result_dict]):
+                yield result
+
+    async def _fetch_chunks(
+        self,
+        path: str,
+        addresses: Union[Iterable[T], AsyncIterable[T]],
+        *,
+        body: Mapping[str, object],
+        max_addresses_per_request: int,
+        max_chunks_in_flight: Optional[int],
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> AsyncIterator[Tuple[List[T], List[dict]]]:
+        """
+        Schedule one request per chunk of addresses and yield each chunk with the results of its addresses, in
+        submission order or, if `ordered` is false, as soon as each response arrives.
+
+        Addresses are pulled from the input lazily: at most `max_chunks_in_flight` chunks are scheduled but not yet
+        yielded at any time. The client's semaphore additionally bounds how many requests are in flight at once.
+        Duplicate addresses (if `deduplicate` is true) and, if the client has a cache, cached addresses are not
+        requested.
+
+        If `adaptive_batching` is true, the number of addresses per request adapts to the latency and error rate of
+        the requests, between 1 and `max_addresses_per_request`.
+
+        Addresses whose result failed with a retryable error, or whose request failed as a whole with one (e.g. a 503
+        status code or a timeout), are retried up to `max_retries` times in the background, batched together with the
+        failures of other chunks; a chunk is yielded once all of its results are final.
+
+        If a `journal` is given, the input positions it records as completed are skipped, and the positions of each
+        chunk are recorded in it once the consumer is done with the chunk (i.e. asks for the next one).
+        """
+        # Imported here so that the synchronous client doesn't pay for importing `asyncio`.
+        # Standard Library
+        import asyncio
+
+        state: _FetchState[T, "asyncio.Future[Tuple[float, dict]]"] = _FetchState(
+            self.client,
+            path,
+            body=body,
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        )
+        chunks = _aplanned_chunks(state.planner, addresses).__aiter__()
+
+        def schedule(batch: Batch[T]) -> None:
+            task = asyncio.ensure_future(
+                self.client._timed_request(method="POST", path=path, body=state.planner.request_body(batch))
+            )
+            state.submitted(task, batch)
+
+        try:
+            while True:
+                while state.wants_chunk():
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        state.end_of_input()
+                        break
+                    batch = state.add_chunk(chunk)
+                    if batch is not None:
+                        schedule(batch)
+
+                for batch in state.retry_batches():
+                    schedule(batch)
+
+                ready_chunks = state.pop_ready()
+                if ready_chunks:
+                    for chunk in ready_chunks:
+                        yield chunk.addresses, chunk.results  # type: ignore[misc]  # All results are known.
+                        state.chunk_done(chunk)
+                    continue
+
+                if state.is_done:
+                    return
+
+                timeout = state.timeout()
+                if not state.in_flight:
+                    # Only retries are left, waiting for their backoff.
+                    await asyncio.sleep(timeout or 0.0)
+                    continue
+
+                done, _ = await asyncio.wait(state.in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        latency, response = task.result()
+                    except Exception as error:
+                        if not self.client._is_retryable_error(error) or not state.fail(task):
+                            raise
+                        continue
+                    state.complete(task, response, latency=latency)
+        finally:
+            # The consumer stopped early (or a request failed), don't leave orphaned requests running.
+            for task in state.in_flight:
+                task.cancel()
+
+
+class AsyncEndpointResource(AsyncAPIResource):
+    """A resource whose `fetch()` sends addresses to a single bulk endpoint."""
+
+    # The endpoint, and the most addresses it accepts per request.
+    path: str
+    max_addresses_per_request: int
+
+    async def fetch_raw(
+        self,
+        addresses: Union[Iterable[T], AsyncIterable[T]],
+        *,
+        body: Optional[Mapping[str, object]] = None,
+        max_addresses_per_request: Optional[int] = None,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Fetch the results of addresses as returned by the API, without parsing them into models.
+
+        See `EndpointResource.fetch_raw()`. `addresses` may also be an async iterable.
+        """
+        async for _, result_dicts in self._fetch_chunks(
+            self.path,
+            addresses,
+            body=body or {},
+            max_addresses_per_request=max_addresses_per_request or self.max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            yield self._raw_results(result_dicts)
+
+    def _raw_results(self, result_dicts: List[dict]) -> List[dict]:
+        """Returns the result dicts of `fetch_raw()`, overridden by the resources whose models change them."""
+        return result_dicts
+
+
+class _FetchState(Generic[T, F]):
+    """
+    The scheduling decisions of `_fetch_chunks`, shared by the thread pool and asyncio resources, which only differ in
+    how they pull the input, submit a batch's request and wait for responses.
+
+    Each round of the fetch loop:
+
+    1. While `wants_chunk()`, pull the next chunk of `planner` and submit the batch `add_chunk()` returns for it, if
+       any; call `end_of_input()` once the input is exhausted.
+    2. Submit the batches of `retry_batches()`.
+    3. Yield the chunks of `pop_ready()`, calling `chunk_done()` for each once the consumer asks for the next one,
+       and start the next round if there were any.
+    4. Stop if `is_done`. Otherwise wait up to `timeout()` seconds for a request of `in_flight` to complete and
+       hand its response to `complete()`, or just sleep for that long if nothing is in flight. A request that failed
+       with an error the client deems retryable goes to `fail()` instead, and its error is raised if that returns
+       false.
+
+    Submitted requests are registered with `submitted()`.
+    """
+
+    def __init__(
+        self,
+        client: "Union[OpenExchangeClient, AsyncOpenExchangeClient]",
+        path: str,
+        *,
+        body: Mapping[str, object],
+        max_addresses_per_request: int,
+        max_chunks_in_flight: Optional[int],
+        ordered: bool,
+        deduplicate: bool,
+        adaptive_batching: bool,
+        max_retries: int,
+        journal: Optional[FetchJournal],
+    ) -> None:
+        if max_chunks_in_flight is None:
+            max_chunks_in_flight = client.max_concurrent_requests * CHUNKS_IN_FLIGHT_PER_CONCURRENT_REQUEST
+        if journal is not None:
+            journal.begin(path, body)
+
+        self.path = path
+        self.max_chunks_in_flight = max_chunks_in_flight
+        self.max_concurrent_requests = client.max_concurrent_requests
+        self.ordered = ordered
+        self.journal = journal
+        self.instrumentation = client.instrumentation
+        self.planner: ChunkPlanner[T] = ChunkPlanner(
+            path,
+            params=body,
+            max_addresses_per_request=max_addresses_per_request,
+            cache=client.cache,
+            deduplicate=deduplicate,
+            batch_size=AdaptiveBatchSize(max_addresses_per_request) if adaptive_batching else None,
+            max_retries=max_retries,
+            completed=journal.completed if journal is not None else (),
+        )
+        # Chunks that have been submitted but not yet yielded, in submission order.
+        self.window: "collections.OrderedDict[Chunk[T], None]" = collections.OrderedDict()
+        self.in_flight: Dict[F, Batch[T]] = {}
+        self._is_exhausted = False
+
+    @property
+    def is_done(self) -> bool:
+        """Whether every chunk of the input has been yielded."""
+        return self._is_exhausted and not self.window
+
+    def wants_chunk(self) -> bool:
+        return not self._is_exhausted and len(self.window) < self.max_chunks_in_flight
+
+    def end_of_input(self) -> None:
+        self._is_exhausted = True
+
+    def add_chunk(self, chunk: Chunk[T]) -> Optional[Batch[T]]:
+        """Add a chunk to the window. Returns the batch of its requested addresses to submit, if it has any."""
+        self.window[chunk] = None
+        if self.instrumentation is not None:
+            self.instrumentation.on_chunk(
+                self.path, num_addresses=len(chunk.addresses), num_requested=len(chunk.request_positions)
+            )
+        return self.planner.first_batch(chunk)
+
+    def submitted(self, future: F, batch: Batch[T]) -> None:
+        self.in_flight[future] = batch
+
+    def retry_batches(self) -> Iterator[Batch[T]]:
+        """Yields the batches of addresses to retry that are due."""
+        if self._is_blocked:
+            # Nothing can be returned or submitted until the first chunk's retries complete, so waiting out their
+            # backoff would only hold up the fetch; the time it took to fill the window stands in for it.
+            self.planner.retry_now(next(iter(self.window)))
+        flush = self._flush
+        retry_batch = self.planner.retry_batch(flush=flush)
+        while retry_batch is not None:
+            if self.instrumentation is not None:
+                self.instrumentation.on_address_retries(self.path, len(retry_batch.entries))
+            yield retry_batch
+            retry_batch = self.planner.retry_batch(flush=flush)
+
+    def pop_ready(self) -> List[Chunk[T]]:
+        """
+        Remove and return the chunks of the window that can be yielded: the ready chunks at the start of the window
+        or, if not `ordered`, all ready chunks.
+        """
+        ready_chunks: List[Chunk[T]] = []
+        for chunk in self.window:
+            if chunk.is_ready:
+                ready_chunks.append(chunk)
+            elif self.ordered:
+                break
+        for chunk in ready_chunks:
+            del self.window[chunk]
+        return ready_chunks
+
+    def chunk_done(self, chunk: Chunk[T]) -> None:
+        """Record that the consumer is done with a yielded chunk."""
+        if self.journal is not None:
+            self.journal.record(chunk.start, chunk.start + len(chunk.addresses))
+
+    def timeout(self) -> Optional[float]:
+        """Returns the number of seconds until the next batch of addresses to retry is due, if one will be."""
+        retry_at = self.planner.next_retry_at(flush=self._flush)
+        if retry_at is None:
+            return None
+        return max(0.0, retry_at - time.monotonic())
+
+    def complete(self, future: F, response: dict, *, latency: float) -> None:
+        """Merge the response of a completed request, which took `latency` seconds, into its chunks."""
+        batch = self.in_flight.pop(future)
+        self.planner.complete(batch, response, latency=latency)
+        if self.instrumentation is not None:
+            self.instrumentation.on_results(self.path, api_code_counts(response["results"]))
+
+    def fail(self, future: F) -> bool:
+        """
+        Queue the addresses of a request that failed as a whole to be retried, see `ChunkPlanner.fail()`. Returns false
+        if they have no retries left.
+        """
+        return self.planner.fail(self.in_flight.pop(future))
+
+    @property
+    def _flush(self) -> bool:
+        # Retries fill up a request with the failures of other chunks, unless the fetch would wait for them: when no
+        # more failures can come, when chunks waiting for retries fill the window so that fewer requests of new chunks
+        # are in flight than the client could send, or when the next chunk to return waits for a retry.
+        num_in_flight = sum(1 for batch in self.in_flight.values() if not batch.is_retry)
+        if num_in_flight == 0:
+            return True
+        if len(self.window) >= self.max_chunks_in_flight and num_in_flight < self.max_concurrent_requests:
+            return True
+        return self.ordered and bool(self.window) and next(iter(self.window)).num_retrying > 0
+
+    @property
+    def _is_blocked(self) -> bool:
+        """Whether the window is full and, if `ordered`, its first chunk waits for retries."""
+        if not self.ordered or len(self.window) < self.max_chunks_in_flight:
+            return False
+        return next(iter(self.window)).num_retrying > 0
+
+
+def _timed_parse(
+    instrumentation: Optional[Instrumentation], path: str, parse: Callable[[List[dict]], R], result_dicts: List[dict]
+) -> R:
+    if instrumentation is None:
+        return parse(result_dicts)
+    start = time.perf_counter()
+    parsed = parse(result_dicts)
+    instrumentation.on_parse(path, num_results=len(result_dicts), duration=time.perf_counter() - start)
+    return parsed
+
+
+def _planned_chunks(planner: ChunkPlanner[T], addresses: Iterable[T]) -> Iterator[Chunk[T]]:
+    for address in addresses:
+        chunk = planner.add(address)
+        if chunk is not None:
+            yield chunk
+
+    chunk = planner.flush()
+    if chunk is not None:
+        yield chunk
+
+
+async def _aplanned_chunks(
+    planner: ChunkPlanner[T], addresses: Union[Iterable[T], AsyncIterable[T]]
+) -> AsyncIterator[Chunk[T]]:
+    """Like `_planned_chunks`, but also accepts async iterables."""
+    if not isinstance(addresses, AsyncIterable):
+        for chunk in _planned_chunks(planner, addresses):
+            yield chunk
+        return
+
+    async for address in addresses:
+        full_chunk = planner.add(address)
+        if full_chunk is not None:
+            yield full_chunk
+
+    last_chunk = planner.flush()
+    if last_chunk is not None:
+        yield last_chunk
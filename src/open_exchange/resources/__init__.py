@@ -1,6 +1,7 @@
 # 1st Party Libraries
-from open_exchange.resources.data.data import Data
+from open_exchange.resources.data.data import AsyncData, Data
 
 __all__ = [
+    "AsyncData",
     "Data",
 ]
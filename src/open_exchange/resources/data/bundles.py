@@ -0,0 +1,343 @@
+# Standard Library
+import collections
+import functools
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+# 1st Party Libraries
+from open_exchange.contants import DEFAULT_MAX_ADDRESS_RETRIES
+from open_exchange.parsing import parse_rental_comps_results, parse_results
+from open_exchange.resource import APIResource, AsyncAPIResource, AsyncEndpointResource, EndpointResource
+from open_exchange.types.data import (
+    property_details_response,
+    property_values_response,
+    rent_estimates_response,
+    rental_comps_fetch_params,
+    rental_comps_response,
+)
+from open_exchange.types.models import BaseModel
+
+if TYPE_CHECKING:
+    # 1st Party Libraries
+    from open_exchange.resources.data.data import AsyncData, Data
+
+T = TypeVar("T")
+
+BUNDLE_ENDPOINTS = ("property_details", "property_values", "rent_estimates", "rental_comps")
+
+
+class PropertyBundle(NamedTuple):
+    """The results of each endpoint fetched by `Bundles.fetch()` for one address."""
+
+    address: Mapping[str, object]
+    """The address, as sent to the API."""
+
+    token: Optional[str]
+    """The user-supplied token of the address."""
+
+    property_details: Optional[property_details_response.Result] = None
+    """The property details result, or `None` if the endpoint wasn't included."""
+
+    property_values: Optional[property_values_response.Result] = None
+    """The property values result, or `None` if the endpoint wasn't included."""
+
+    rent_estimates: Optional[rent_estimates_response.Result] = None
+    """The rent estimates result, or `None` if the endpoint wasn't included."""
+
+    rental_comps: Optional[rental_comps_response.Result] = None
+    """The rental comps result, or `None` if the endpoint wasn't included."""
+
+
+class Bundles(APIResource):
+    def fetch(
+        self,
+        addresses: Iterable[Mapping[str, object]],
+        *,
+        include: Sequence[str] = BUNDLE_ENDPOINTS,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        max_addresses_per_request: Optional[Mapping[str, int]] = None,
+        max_chunks_in_flight: Optional[int] = None,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+    ) -> Iterator[PropertyBundle]:
+        """
+        Fetch the results of several endpoints for addresses, joined into one bundle per address
+
+        The input is read once. Each endpoint chunks it with its own request size, and the requests of all endpoints
+        share the client's concurrency limits, so their work overlaps. Bundles are returned in the order of
+        `addresses`, as soon as every endpoint has returned the address's result.
+
+        Args:
+          addresses: An iterable of address objects, each specifying a property location.
+
+          include: The endpoints to fetch: any of `"property_details"`, `"property_values"`, `"rent_estimates"`
+              and `"rental_comps"`. Defaults to all of them.
+
+          filters, num_comps: The rental comps request parameters, see `RentalComps.fetch()`.
+
+          max_addresses_per_request: An _optional_ mapping of endpoint (e.g. `"rental_comps"`) to the maximum
+              number of addresses to include in each of its requests. Defaults to each endpoint's maximum.
+
+          max_chunks_in_flight: The maximum number of requests submitted per endpoint whose results have not been
+              returned yet. Defaults to twice the client's concurrency limit.
+
+          deduplicate: Whether to request each property only once per endpoint when `addresses` contains it more
+              than once (ignoring case, whitespace and tokens). Every duplicate still gets its own bundle.
+
+          adaptive_batching: Whether to adapt the number of addresses per request of each endpoint to the latency
+              and error rate of its requests, between 1 and its `max_addresses_per_request`.
+
+          max_retries: The maximum number of times to retry an address whose result failed with a retryable error
+              (e.g. a 503 `api_code`).
+
+        Returns:
+            An iterator of bundles, one per address.
+        """
+        endpoints = _endpoints(self.client.data, include, max_addresses_per_request)
+        inputs = itertools.tee(addresses, len(endpoints))
+        lanes = [
+            self._lane(
+                endpoint,
+                lane_input,
+                body=_body(name, filters, num_comps),
+                max_chunks_in_flight=max_chunks_in_flight,
+                deduplicate=deduplicate,
+                adaptive_batching=adaptive_batching,
+                max_retries=max_retries,
+            )
+            for (name, endpoint), lane_input in zip(endpoints, inputs)
+        ]
+        pending: List[Deque[Tuple[Mapping[str, object], object]]] = [collections.deque() for _ in lanes]
+        try:
+            while True:
+                yield from _join(endpoints, pending)
+                # Advance an endpoint that the next bundle is waiting for. The others are ahead, their requests
+                # in flight.
+                index = next(index for index, lane_pending in enumerate(pending) if not lane_pending)
+                chunk = next(lanes[index], None)
+                if chunk is None:
+                    # Every endpoint reads the same input, so they all run out of it at the same address.
+                    return
+                pending[index].extend(zip(*chunk))
+        finally:
+            # Cancel the requests of the other endpoints rather than leaving them to the garbage collector.
+            for lane in lanes:
+                lane.close()
+
+    def _lane(
+        self,
+        endpoint: "_Endpoint",
+        addresses: Iterable[Mapping[str, object]],
+        *,
+        body: Mapping[str, object],
+        max_chunks_in_flight: Optional[int],
+        deduplicate: bool,
+        adaptive_batching: bool,
+        max_retries: int,
+    ) -> Generator[Tuple[List[Mapping[str, object]], Sequence[object]], None, None]:
+        parse = _parser(endpoint, validate=self.client.validate_responses)
+        for chunk_addresses, result_dicts in self._fetch_chunks(
+            endpoint.path,
+            addresses,
+            body=body,
+            max_addresses_per_request=endpoint.max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+        ):
+            yield chunk_addresses, self._parse(endpoint.path, parse, result_dicts)
+
+
+class AsyncBundles(AsyncAPIResource):
+    async def fetch(
+        self,
+        addresses: Union[Iterable[Mapping[str, object]], AsyncIterable[Mapping[str, object]]],
+        *,
+        include: Sequence[str] = BUNDLE_ENDPOINTS,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        max_addresses_per_request: Optional[Mapping[str, int]] = None,
+        max_chunks_in_flight: Optional[int] = None,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+    ) -> AsyncIterator[PropertyBundle]:
+        """
+        Fetch the results of several endpoints for addresses, joined into one bundle per address
+
+        See `Bundles.fetch()`. `addresses` may also be an async iterable.
+        """
+        endpoints = _endpoints(self.client.data, include, max_addresses_per_request)
+        if isinstance(addresses, AsyncIterable):
+            inputs: Sequence[Union[Iterable[Mapping[str, object]], AsyncIterable[Mapping[str, object]]]] = _atee(
+                addresses, len(endpoints)
+            )
+        else:
+            inputs = itertools.tee(addresses, len(endpoints))
+        lanes = [
+            self._lane(
+                endpoint,
+                lane_input,
+                body=_body(name, filters, num_comps),
+                max_chunks_in_flight=max_chunks_in_flight,
+                deduplicate=deduplicate,
+                adaptive_batching=adaptive_batching,
+                max_retries=max_retries,
+            )
+            for (name, endpoint), lane_input in zip(endpoints, inputs)
+        ]
+        pending: List[Deque[Tuple[Mapping[str, object], object]]] = [collections.deque() for _ in lanes]
+        try:
+            while True:
+                for bundle in _join(endpoints, pending):
+                    yield bundle
+                # Advance an endpoint that the next bundle is waiting for. The others are ahead, their requests
+                # in flight.
+                index = next(index for index, lane_pending in enumerate(pending) if not lane_pending)
+                try:
+                    chunk = await lanes[index].__anext__()
+                except StopAsyncIteration:
+                    # Every endpoint reads the same input, so they all run out of it at the same address.
+                    return
+                pending[index].extend(zip(*chunk))
+        finally:
+            # Cancel the requests of the other endpoints rather than leaving them to the garbage collector.
+            for lane in lanes:
+                await lane.aclose()
+
+    async def _lane(
+        self,
+        endpoint: "_Endpoint",
+        addresses: Union[Iterable[Mapping[str, object]], AsyncIterable[Mapping[str, object]]],
+        *,
+        body: Mapping[str, object],
+        max_chunks_in_flight: Optional[int],
+        deduplicate: bool,
+        adaptive_batching: bool,
+        max_retries: int,
+    ) -> AsyncGenerator[Tuple[List[Mapping[str, object]], Sequence[object]], None]:
+        parse = _parser(endpoint, validate=self.client.validate_responses)
+        async for chunk_addresses, result_dicts in self._fetch_chunks(
+            endpoint.path,
+            addresses,
+            body=body,
+            max_addresses_per_request=endpoint.max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+        ):
+            yield chunk_addresses, self._parse(endpoint.path, parse, result_dicts)
+
+
+class _Endpoint(NamedTuple):
+    path: str
+    max_addresses_per_request: int
+    result_model: Type[BaseModel]
+
+
+_RESULT_MODELS: Dict[str, Type[BaseModel]] = {
+    "property_details": property_details_response.Result,
+    "property_values": property_values_response.Result,
+    "rent_estimates": rent_estimates_response.Result,
+    "rental_comps": rental_comps_response.Result,
+}
+
+
+def _parser(endpoint: _Endpoint, *, validate: bool) -> Callable[[List[dict]], Sequence[object]]:
+    if endpoint.result_model is rental_comps_response.Result:
+        # Rental comps results also get their `api_code`, as in `RentalComps.fetch()`.
+        return functools.partial(parse_rental_comps_results, validate=validate)
+    return functools.partial(parse_results, endpoint.result_model, validate=validate)
+
+
+def _endpoints(
+    data: "Union[Data, AsyncData]", include: Sequence[str], max_addresses_per_request: Optional[Mapping[str, int]]
+) -> List[Tuple[str, _Endpoint]]:
+    """Returns the included endpoints, with the path and request size of the resource of `data` of each."""
+    if isinstance(include, str):
+        raise TypeError(f"include must be a sequence of endpoint names, not a string: use include=[{include!r}]")
+    unknown = [name for name in include if name not in _RESULT_MODELS]
+    if unknown:
+        raise ValueError(f"Unknown endpoints {unknown}, expected any of {list(BUNDLE_ENDPOINTS)}")
+    if not include:
+        raise ValueError("include at least one endpoint")
+    max_addresses_per_request = max_addresses_per_request or {}
+    unknown = [name for name in max_addresses_per_request if name not in include]
+    if unknown:
+        raise ValueError(f"max_addresses_per_request has endpoints that aren't included: {unknown}")
+    endpoints = []
+    for name in dict.fromkeys(include):
+        resource: Union[EndpointResource, AsyncEndpointResource] = getattr(data, name)
+        endpoint = _Endpoint(
+            resource.path,
+            max_addresses_per_request.get(name, resource.max_addresses_per_request),
+            _RESULT_MODELS[name],
+        )
+        endpoints.append((name, endpoint))
+    return endpoints
+
+
+def _body(
+    name: str, filters: Optional[rental_comps_fetch_params.Filters], num_comps: Optional[int]
+) -> Mapping[str, object]:
+    if name == "rental_comps":
+        return {"filters": filters, "num_comps": num_comps}
+    return {}
+
+
+def _join(
+    endpoints: Sequence[Tuple[str, _Endpoint]], pending: Sequence[Deque[Tuple[Mapping[str, object], object]]]
+) -> Iterator[PropertyBundle]:
+    """Yields the bundles of the addresses whose results have been returned by every endpoint."""
+    names = [name for name, _ in endpoints]
+    for _ in range(min(len(lane_pending) for lane_pending in pending)):
+        results: Dict[str, object] = {}
+        for name, lane_pending in zip(names, pending):
+            address, results[name] = lane_pending.popleft()
+        token = address.get("token")
+        yield PropertyBundle._make(
+            [address, token if isinstance(token, str) else None, *(results.get(name) for name in BUNDLE_ENDPOINTS)]
+        )
+
+
+def _atee(iterable: AsyncIterable[T], n: int) -> List[AsyncIterator[T]]:
+    """Like `itertools.tee()`, for an async iterable. The iterators must not be advanced concurrently."""
+    iterator = iterable.__aiter__()
+    buffers: List[Deque[T]] = [collections.deque() for _ in range(n)]
+
+    async def read(buffer: Deque[T]) -> AsyncIterator[T]:
+        while True:
+            if not buffer:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+                for other in buffers:
+                    other.append(item)
+            yield buffer.popleft()
+
+    return [read(buffer) for buffer in buffers]
@@ -1,25 +1,91 @@
+# Standard Library
+from typing import TYPE_CHECKING
+
 # 1st Party Libraries
 from open_exchange.compat import cached_property
-from open_exchange.resource import APIResource
-from open_exchange.resources.data.property_details import PropertyDetails
-from open_exchange.resources.data.property_values import PropertyValues
-from open_exchange.resources.data.rent_estimates import RentEstimates
-from open_exchange.resources.data.rental_comps import RentalComps
+from open_exchange.resource import APIResource, AsyncAPIResource
+
+if TYPE_CHECKING:
+    # 1st Party Libraries
+    from open_exchange.resources.data.bundles import AsyncBundles, Bundles
+    from open_exchange.resources.data.property_details import AsyncPropertyDetails, PropertyDetails
+    from open_exchange.resources.data.property_values import AsyncPropertyValues, PropertyValues
+    from open_exchange.resources.data.rent_estimates import AsyncRentEstimates, RentEstimates
+    from open_exchange.resources.data.rental_comps import AsyncRentalComps, RentalComps
+
+# Each resource is imported on first use, with its response models, so that a program only pays for the resources it
+# uses.
 
 
 class Data(APIResource):
     @cached_property
-    def property_details(self) -> PropertyDetails:
+    def bundles(self) -> "Bundles":
+        # 1st Party Libraries
+        from open_exchange.resources.data.bundles import Bundles
+
+        return Bundles(client=self.client)
+
+    @cached_property
+    def property_details(self) -> "PropertyDetails":
+        # 1st Party Libraries
+        from open_exchange.resources.data.property_details import PropertyDetails
+
         return PropertyDetails(client=self.client)
 
     @cached_property
-    def property_values(self) -> PropertyValues:
+    def property_values(self) -> "PropertyValues":
+        # 1st Party Libraries
+        from open_exchange.resources.data.property_values import PropertyValues
+
         return PropertyValues(client=self.client)
 
     @cached_property
-    def rent_estimates(self) -> RentEstimates:
+    def rent_estimates(self) -> "RentEstimates":
+        # 1st Party Libraries
+        from open_exchange.resources.data.rent_estimates import RentEstimates
+
         return RentEstimates(client=self.client)
 
     @cached_property
-    def rental_comps(self) -> RentalComps:
+    def rental_comps(self) -> "RentalComps":
+        # 1st Party Libraries
+        from open_exchange.resources.data.rental_comps import RentalComps
+
         return RentalComps(client=self.client)
+
+
+class AsyncData(AsyncAPIResource):
+    @cached_property
+    def bundles(self) -> "AsyncBundles":
+        # 1st Party Libraries
+        from open_exchange.resources.data.bundles import AsyncBundles
+
+        return AsyncBundles(client=self.client)
+
+    @cached_property
+    def property_details(self) -> "AsyncPropertyDetails":
+        # 1st Party Libraries
+        from open_exchange.resources.data.property_details import AsyncPropertyDetails
+
+        return AsyncPropertyDetails(client=self.client)
+
+    @cached_property
+    def property_values(self) -> "AsyncPropertyValues":
+        # 1st Party Libraries
+        from open_exchange.resources.data.property_values import AsyncPropertyValues
+
+        return AsyncPropertyValues(client=self.client)
+
+    @cached_property
+    def rent_estimates(self) -> "AsyncRentEstimates":
+        # 1st Party Libraries
+        from open_exchange.resources.data.rent_estimates import AsyncRentEstimates
+
+        return AsyncRentEstimates(client=self.client)
+
+    @cached_property
+    def rental_comps(self) -> "AsyncRentalComps":
+        # 1st Party Libraries
+        from open_exchange.resources.data.rental_comps import AsyncRentalComps
+
+        return AsyncRentalComps(client=self.client)
@@ -1,30 +1,30 @@
 # Standard Library
-import concurrent.futures
-from typing import TYPE_CHECKING, Iterable
-
-# Third-Party Libraries
-import more_itertools
+import functools
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, Union
 
 # 1st Party Libraries
-from open_exchange.contants import MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST, MAX_CONCURRENT_REQUESTS
-from open_exchange.resource import APIResource
+from open_exchange.contants import DEFAULT_MAX_ADDRESS_RETRIES, MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST
+from open_exchange.journal import FetchJournal
+from open_exchange.parsing import parse_results
+from open_exchange.resource import AsyncEndpointResource, EndpointResource
 from open_exchange.types.data import rent_estimates_fetch_params, rent_estimates_response
 
-if TYPE_CHECKING:
-    # 1st Party Libraries
-    from open_exchange.client import OpenExchangeClient
-
 
-class RentEstimates(APIResource):
-    def __init__(self, client: "OpenExchangeClient") -> None:
-        super().__init__(client)
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+class RentEstimates(EndpointResource):
+    path = "/data/rent-estimates"
+    max_addresses_per_request = MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST
 
     def fetch(
         self,
         addresses: Iterable[rent_estimates_fetch_params.Address],
         *,
         max_addresses_per_request: int = MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
     ) -> Iterable[rent_estimates_response.Result]:
         """
         Fetch rent estimates for addresses
@@ -34,24 +34,72 @@ class RentEstimates(APIResource):
 
           max_addresses_per_request: The maximum number of addresses to include in each request.
 
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
         Returns:
           An iterable of rent estimates results.
         """
-        futures_and_chunk_addresses_tuples = [
-            (
-                self._executor.submit(
-                    self.request,
-                    method="POST",
-                    path="/data/rent-estimates",
-                    body={
-                        "addresses": chunk_addresses,
-                    },
-                ),
-                chunk_addresses,
-            )
-            for chunk_addresses in more_itertools.chunked(addresses, n=max_addresses_per_request)
-        ]
-
-        for future, chunk_addresses in futures_and_chunk_addresses_tuples:
-            for result_dict in future.result()["results"]:
-                yield rent_estimates_response.Result.parse_obj(result_dict)
+        parse = functools.partial(
+            parse_results, rent_estimates_response.Result, validate=self.client.validate_responses
+        )
+        for result_dicts in self.fetch_raw(
+            addresses,
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            yield from self._parse(self.path, parse, result_dicts)
+
+
+class AsyncRentEstimates(AsyncEndpointResource):
+    path = "/data/rent-estimates"
+    max_addresses_per_request = MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST
+
+    async def fetch(
+        self,
+        addresses: Union[
+            Iterable[rent_estimates_fetch_params.Address], AsyncIterable[rent_estimates_fetch_params.Address]
+        ],
+        *,
+        max_addresses_per_request: int = MAX_ADDRESSES_PER_RENT_ESTIMATES_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> AsyncIterator[rent_estimates_response.Result]:
+        """
+        Fetch rent estimates for addresses
+
+        Args:
+          addresses: An iterable or async iterable of address objects, each specifying a property location.
+
+          max_addresses_per_request: The maximum number of addresses to include in each request.
+
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+        Returns:
+          An async iterator of rent estimates results.
+        """
+        parse = functools.partial(
+            parse_results, rent_estimates_response.Result, validate=self.client.validate_responses
+        )
+        async for result_dicts in self.fetch_raw(
+            addresses,
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            for result in self._parse(self.path, parse, result_dicts):
+                yield result
@@ -1,29 +1,40 @@
 # Standard Library
-import concurrent.futures
-from http import HTTPStatus
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+import array
+import functools
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
 
 # Third-Party Libraries
-import more_itertools
+import pydantic
 
 # 1st Party Libraries
+from open_exchange import columnar
+from open_exchange.addresses import address_key
 from open_exchange.contants import (
-    DEFAULT_RETRYABLE_STATUS_CODES,
+    DEFAULT_MAX_ADDRESS_RETRIES,
     MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
-    MAX_CONCURRENT_REQUESTS,
 )
-from open_exchange.resource import APIResource
+from open_exchange.journal import FetchJournal
+from open_exchange.parsing import PYDANTIC_V2, parse_rental_comps_results, parse_results
+from open_exchange.resource import AsyncEndpointResource, EndpointResource
+from open_exchange.results import result_dict_api_code
 from open_exchange.types.data import rental_comps_fetch_params, rental_comps_response
 
-if TYPE_CHECKING:
-    # 1st Party Libraries
-    from open_exchange.client import OpenExchangeClient
-
 
-class RentalComps(APIResource):
-    def __init__(self, client: "OpenExchangeClient") -> None:
-        super().__init__(client)
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+class RentalComps(EndpointResource):
+    path = "/data/rental-comps"
+    max_addresses_per_request = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST
 
     def fetch(
         self,
@@ -32,6 +43,13 @@ class RentalComps(APIResource):
         filters: Optional[rental_comps_fetch_params.Filters] = None,
         num_comps: Optional[int] = 10,
         max_addresses_per_request: int = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+        comp_property_interner: Optional["CompPropertyInterner"] = None,
     ) -> Iterable[rental_comps_response.Result]:
         """
         Fetch rental comps for addresses
@@ -49,90 +67,632 @@ class RentalComps(APIResource):
 
           max_addresses_per_request: The maximum number of addresses to include in each request.
 
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+          comp_property_interner: An _optional_ `CompPropertyInterner` that shares one immutable instance of the
+              property details of each comp property between all the comps that have it, e.g. across the
+              overlapping comps of a dense neighborhood. Pass the same interner to several fetches to share
+              instances across them.
+
         Returns:
             An iterator of rental comps results.
         """
-        futures_and_chunk_addresses_tuples = [
-            (
-                self._executor.submit(
-                    self.request,
-                    method="POST",
-                    path="/data/rental-comps",
-                    body={
-                        "addresses": chunk_addresses,
-                        "filters": filters,
-                        "num_comps": num_comps,
-                    },
-                ),
-                chunk_addresses,
-            )
-            for chunk_addresses in more_itertools.chunked(addresses, n=max_addresses_per_request)
-        ]
-
-        for future, chunk_addresses in futures_and_chunk_addresses_tuples:
-            results = _results_from_response(future.result())
-
-            # Retry any failed addresses from the chunk.
-            if any(result.api_code in DEFAULT_RETRYABLE_STATUS_CODES for result in results):
-                retry_addresses: List[rental_comps_fetch_params.Address] = []
-                retry_indices: List[int] = []
-                for idx, (result, address) in enumerate(zip(results, chunk_addresses)):
-                    if result.api_code not in DEFAULT_RETRYABLE_STATUS_CODES:
-                        continue
-                    retry_addresses.append(address)
-                    retry_indices.append(idx)
-                retry_results = _results_from_response(
-                    self.request(
-                        method="POST",
-                        path="/data/rental-comps",
-                        body={
-                            "addresses": retry_addresses,
-                            "filters": filters,
-                            "num_comps": num_comps,
-                        },
-                    )
-                )
-                for idx, result in zip(retry_indices, retry_results):
-                    results[idx] = result  # Replace the failed result with the retry result.
+        parse = functools.partial(
+            parse_rental_comps_results if comp_property_interner is None else comp_property_interner.parse_results,
+            validate=self.client.validate_responses,
+        )
+        for result_dicts in self.fetch_raw(
+            addresses,
+            body=_request_body(filters, num_comps),
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            yield from self._parse(self.path, parse, result_dicts)
+
+    def stream(
+        self,
+        addresses: Sequence[rental_comps_fetch_params.Address],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+    ) -> Iterator[rental_comps_response.Result]:
+        """
+        Fetch rental comps for up to `MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST` addresses in a single request, returning
+        each result as soon as it has been received
+
+        The response is decoded as it is read off the connection, so the first results can be used while the rest
+        download, and the response body is never held in memory whole. Decoding it this way takes more CPU time than
+        decoding it at once. Unlike `fetch()`, addresses are sent as they are: duplicates are requested again, and
+        addresses whose result failed are not retried.
+
+        Args:
+          addresses: A sequence of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+        Returns:
+            An iterator of rental comps results, in the order of `addresses`.
+        """
+        _check_num_addresses(addresses)
+        parse = functools.partial(parse_rental_comps_results, validate=self.client.validate_responses)
+        yield from self._stream_results(
+            self.path,
+            {**_request_body(filters, num_comps), "addresses": list(addresses)},
+            parse,
+        )
+
+    def fetch_columnar(
+        self,
+        addresses: Iterable[rental_comps_fetch_params.Address],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        format: str = "arrow",
+        max_addresses_per_request: int = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> "RentalCompsColumns":
+        """
+        Fetch rental comps for addresses into columns, without creating a model object per comp
+
+        Args:
+          addresses: An array of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+          format: The format of the columns: `"arrow"` for a `pyarrow.Table` or `"numpy"` for a dict of NumPy arrays
+              keyed by column name. Fields of nested objects are flattened into columns named after their path, e.g.
+              `"property_details.latitude"`.
+
+          max_addresses_per_request: The maximum number of addresses to include in each request.
+
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+              A `journal` records the addresses whose rows are in the table, which is lost if the fetch is
+              interrupted.
+
+        Returns:
+          A table of results, with one row per address, and a table of comps, with one row per comp.
+        """
+        columnar.check_format(format)
+        results = columnar.TableBuilder(_RESULT_COLUMNS, extra_columns=_RESULT_EXTRA_COLUMNS)
+        comps = columnar.TableBuilder(_COMP_COLUMNS, extra_columns=_COMP_EXTRA_COLUMNS)
+        extend = functools.partial(_extend_columns, results, comps)
+        for result_dicts in self.fetch_raw(
+            addresses,
+            body=_request_body(filters, num_comps),
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            self._parse(self.path, extend, result_dicts)
+        return RentalCompsColumns(results.build(format), comps.build(format))
+
+    def fetch_compact(
+        self,
+        addresses: Iterable[rental_comps_fetch_params.Address],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        store: Optional["RentalCompsStore"] = None,
+        max_addresses_per_request: int = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> "RentalCompsStore":
+        """
+        Fetch rental comps for addresses into a compact in-memory store, without creating a model object per comp
+
+        Args:
+          addresses: An array of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+          store: A store to append the results to, e.g. one filled by earlier fetches. Defaults to a new store.
 
-            yield from results
+          max_addresses_per_request: The maximum number of addresses to include in each request.
+
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+              A `journal` records the addresses whose results are in the store, so an interrupted fetch resumes
+              into the same `store`.
 
+        Returns:
+          The store, with one result per address.
+        """
+        if store is None:
+            store = RentalCompsStore()
+        for result_dicts in self.fetch_raw(
+            addresses,
+            body=_request_body(filters, num_comps),
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            self._parse(self.path, store.extend, result_dicts)
+        return store
 
-def _results_from_response(response: dict) -> List[rental_comps_response.Result]:
-    result_dicts: List[Dict] = response["results"]
+    def _raw_results(self, result_dicts: List[dict]) -> List[dict]:
+        return _with_api_codes(result_dicts)
 
-    results: List[rental_comps_response.Result] = []
-    for result_dict in result_dicts:
-        result = rental_comps_response.Result.parse_obj(result_dict)
-        result.api_code = _result_api_code(result)
-        results.append(result)
 
-    return results
+class AsyncRentalComps(AsyncEndpointResource):
+    path = "/data/rental-comps"
+    max_addresses_per_request = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST
 
+    async def fetch(
+        self,
+        addresses: Union[Iterable[rental_comps_fetch_params.Address], AsyncIterable[rental_comps_fetch_params.Address]],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        max_addresses_per_request: int = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+        comp_property_interner: Optional["CompPropertyInterner"] = None,
+    ) -> AsyncIterator[rental_comps_response.Result]:
+        """
+        Fetch rental comps for addresses
+
+        Args:
+          addresses: An iterable or async iterable of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+          max_addresses_per_request: The maximum number of addresses to include in each request.
 
-def _result_api_code(result: rental_comps_response.Result) -> int:
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+          comp_property_interner: See `RentalComps.fetch()`.
+
+        Returns:
+            An async iterator of rental comps results.
+        """
+        parse = functools.partial(
+            parse_rental_comps_results if comp_property_interner is None else comp_property_interner.parse_results,
+            validate=self.client.validate_responses,
+        )
+        async for result_dicts in self.fetch_raw(
+            addresses,
+            body=_request_body(filters, num_comps),
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            for result in self._parse(self.path, parse, result_dicts):
+                yield result
+
+    async def stream(
+        self,
+        addresses: Sequence[rental_comps_fetch_params.Address],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+    ) -> AsyncIterator[rental_comps_response.Result]:
+        """
+        Fetch rental comps for up to `MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST` addresses in a single request, returning
+        each result as soon as it has been received
+
+        The response is decoded as it is read off the connection, so the first results can be used while the rest
+        download, and the response body is never held in memory whole. Decoding it this way takes more CPU time than
+        decoding it at once. Unlike `fetch()`, addresses are sent as they are: duplicates are requested again, and
+        addresses whose result failed are not retried. The request holds on to one of the client's concurrency slots
+        until all of its results have been consumed.
+
+        Args:
+          addresses: A sequence of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+        Returns:
+            An async iterator of rental comps results, in the order of `addresses`.
+        """
+        _check_num_addresses(addresses)
+        parse = functools.partial(parse_rental_comps_results, validate=self.client.validate_responses)
+        async for result in self._stream_results(
+            self.path,
+            {**_request_body(filters, num_comps), "addresses": list(addresses)},
+            parse,
+        ):
+            yield result
+
+    async def fetch_columnar(
+        self,
+        addresses: Union[Iterable[rental_comps_fetch_params.Address], AsyncIterable[rental_comps_fetch_params.Address]],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        format: str = "arrow",
+        max_addresses_per_request: int = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> "RentalCompsColumns":
+        """
+        Fetch rental comps for addresses into columns, without creating a model object per comp
+
+        Args:
+          addresses: An iterable or async iterable of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+          format: The format of the columns: `"arrow"` for a `pyarrow.Table` or `"numpy"` for a dict of NumPy arrays
+              keyed by column name. Fields of nested objects are flattened into columns named after their path, e.g.
+              `"property_details.latitude"`.
+
+          max_addresses_per_request: The maximum number of addresses to include in each request.
+
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+              A `journal` records the addresses whose rows are in the table, which is lost if the fetch is
+              interrupted.
+
+        Returns:
+          A table of results, with one row per address, and a table of comps, with one row per comp.
+        """
+        columnar.check_format(format)
+        results = columnar.TableBuilder(_RESULT_COLUMNS, extra_columns=_RESULT_EXTRA_COLUMNS)
+        comps = columnar.TableBuilder(_COMP_COLUMNS, extra_columns=_COMP_EXTRA_COLUMNS)
+        extend = functools.partial(_extend_columns, results, comps)
+        async for result_dicts in self.fetch_raw(
+            addresses,
+            body=_request_body(filters, num_comps),
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            self._parse(self.path, extend, result_dicts)
+        return RentalCompsColumns(results.build(format), comps.build(format))
+
+    async def fetch_compact(
+        self,
+        addresses: Union[Iterable[rental_comps_fetch_params.Address], AsyncIterable[rental_comps_fetch_params.Address]],
+        *,
+        filters: Optional[rental_comps_fetch_params.Filters] = None,
+        num_comps: Optional[int] = 10,
+        store: Optional["RentalCompsStore"] = None,
+        max_addresses_per_request: int = MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST,
+        max_chunks_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        journal: Optional[FetchJournal] = None,
+    ) -> "RentalCompsStore":
+        """
+        Fetch rental comps for addresses into a compact in-memory store, without creating a model object per comp
+
+        Args:
+          addresses: An iterable or async iterable of address objects, each specifying a property location.
+
+          filters, num_comps: See `RentalComps.fetch()`.
+
+          store: A store to append the results to, e.g. one filled by earlier fetches. Defaults to a new store.
+
+          max_addresses_per_request: The maximum number of addresses to include in each request.
+
+          max_chunks_in_flight, ordered, deduplicate, adaptive_batching, max_retries, journal: How the addresses are
+              requested, see `open_exchange.resource.EndpointResource.fetch_raw()`.
+
+              A `journal` records the addresses whose results are in the store, so an interrupted fetch resumes
+              into the same `store`.
+
+        Returns:
+          The store, with one result per address.
+        """
+        if store is None:
+            store = RentalCompsStore()
+        async for result_dicts in self.fetch_raw(
+            addresses,
+            body=_request_body(filters, num_comps),
+            max_addresses_per_request=max_addresses_per_request,
+            max_chunks_in_flight=max_chunks_in_flight,
+            ordered=ordered,
+            deduplicate=deduplicate,
+            adaptive_batching=adaptive_batching,
+            max_retries=max_retries,
+            journal=journal,
+        ):
+            self._parse(self.path, store.extend, result_dicts)
+        return store
+
+    def _raw_results(self, result_dicts: List[dict]) -> List[dict]:
+        return _with_api_codes(result_dicts)
+
+
+class RentalCompsColumns(NamedTuple):
+    """Rental comps results as columns, see `RentalComps.fetch_columnar()`."""
+
+    results: columnar.Table
+    """
+    One row per address, in the order of the input (unless fetched with `ordered=False`), with the fields of its
+    result other than the comps.
     """
-    Returns the API code for the given result.
 
-    TODO: This logic will be moved to the API server in the future.
+    comps: columnar.Table
+    """One row per comp: the `result_index` (row in `results`) and `token` of its address, and the comp's fields."""
+
+
+class InternedCompPropertyDetails(rental_comps_response.ResultRentalCompPropertyDetails):
+    """The property details of a comp, shared by every comp of the property (see `CompPropertyInterner`)."""
+
+    # Immutable, since a change would show in every comp that shares the instance.
+    if PYDANTIC_V2:
+        model_config = pydantic.ConfigDict(frozen=True)
+    else:
+
+        class Config:
+            frozen = True
+
+
+class CompPropertyInterner:
     """
-    if isinstance(result.api_code, int):
-        return result.api_code
+    Parses the property details of each comp property once per fetch session, and shares the resulting immutable
+    `InternedCompPropertyDetails` between all the comps of that property. Properties are identified by their `slug`,
+    or by their address if they have none, and the comps of a property are expected to have the same details: those
+    of its first comp are kept.
+
+    In a dense neighborhood, the same property is a comp of many subjects. Parsing its details once, rather than once
+    per subject, saves memory and parsing time in proportion to the overlap. The interner keeps the details of every
+    property it has seen for as long as it is kept.
+    """
+
+    def __init__(self) -> None:
+        self._properties: Dict[Hashable, InternedCompPropertyDetails] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of distinct properties interned."""
+        return len(self._properties)
+
+    def parse_results(self, result_dicts: List[dict], *, validate: bool = True) -> List[rental_comps_response.Result]:
+        """Returns rental comps results, with the comps of each property sharing its interned details."""
+        properties = self._properties
+        # The details of the properties not seen before, and the key of each comp's property (None for comps whose
+        # details are parsed with them, e.g. because they have none).
+        new_property_dicts: Dict[Hashable, dict] = {}
+        comp_keys: List[Optional[Hashable]] = []
+        # The results without the interned details, which aren't parsed again. The API's dicts are left as they are,
+        # since they may be shared, e.g. with a cache.
+        unparsed_result_dicts: List[dict] = []
+        for result_dict in result_dicts:
+            comp_dicts = result_dict.get("rental_comps")
+            if not isinstance(comp_dicts, list):
+                unparsed_result_dicts.append(result_dict)
+                continue
+            unparsed_comp_dicts = []
+            for comp_dict in comp_dicts:
+                key = _comp_property_key(comp_dict)
+                comp_keys.append(key)
+                if key is None:
+                    unparsed_comp_dicts.append(comp_dict)
+                    continue
+                if key not in properties and key not in new_property_dicts:
+                    new_property_dicts[key] = comp_dict["property_details"]
+                unparsed_comp_dicts.append(
+                    {name: value for name, value in comp_dict.items() if name != "property_details"}
+                )
+            unparsed_result_dicts.append({**result_dict, "rental_comps": unparsed_comp_dicts})
+
+        new_properties = parse_results(
+            InternedCompPropertyDetails, list(new_property_dicts.values()), validate=validate
+        )
+        for key, details in zip(new_property_dicts, new_properties):
+            # Keep the instance of a fetch that interned the property meanwhile, in another thread.
+            properties.setdefault(key, details)
+
+        results = parse_rental_comps_results(unparsed_result_dicts, validate=validate)
+        keys = iter(comp_keys)
+        for result in results:
+            for comp in result.rental_comps:
+                key = next(keys)
+                if key is not None:
+                    comp.property_details = properties[key]
+        return results
+
+
+class RentalCompsStore:
+    """
+    Rental comps results in compact columns, e.g. to keep the comps of a whole market in memory. See
+    `RentalComps.fetch_compact()`.
+
+    Numbers, booleans and dates are stored in typed arrays, and categorical strings (such as `listing_status`,
+    `structure_type`, `ownership_profile` and `city`) are dictionary-encoded, so a comp takes a few hundred bytes
+    instead of the several kilobytes of its models. Results and comps are read through views, which have the fields of
+    the models but decode each value only when it is accessed:
+
+    ```python
+    for result in store:
+        for comp in result.rental_comps:
+            print(comp.close_price, comp.property_details.bedrooms_total)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.results = columnar.TableBuilder(_STORE_RESULT_COLUMNS, extra_columns=_RESULT_EXTRA_COLUMNS)
+        self.comps = columnar.TableBuilder(_STORE_COMP_COLUMNS, extra_columns=_COMP_EXTRA_COLUMNS)
+        # The comps of the result at index `i` are the rows `comp_offsets[i]` to `comp_offsets[i + 1]` of `comps`.
+        self.comp_offsets = array.array("q", [0])
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> "RentalCompsResultView":
+        """Returns a view of the result at `index`."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"result index {index} out of range for a store of {len(self)} results")
+        return RentalCompsResultView(self, index)
+
+    def __iter__(self) -> Iterator["RentalCompsResultView"]:
+        for index in range(len(self)):
+            yield RentalCompsResultView(self, index)
+
+    @property
+    def num_comps(self) -> int:
+        return len(self.comps)
+
+    def iter_comps(self) -> Iterator["RentalCompView"]:
+        """Yields a view of every comp, in the order of their results."""
+        for index in range(len(self.comps)):
+            yield RentalCompView(self.comps, index)
+
+    def extend(self, result_dicts: List[dict]) -> None:
+        """Appends results, as returned by the API."""
+        _extend_columns(self.results, self.comps, result_dicts)
+        num_comps = self.comp_offsets[-1]
+        for result_dict in result_dicts:
+            num_comps += len(result_dict.get("rental_comps") or ())
+            self.comp_offsets.append(num_comps)
+
+    def to_columns(self, format: str = "arrow") -> "RentalCompsColumns":
+        """
+        Returns the results and comps as tables, as returned by `RentalComps.fetch_columnar()`. Categorical columns are
+        Arrow dictionary arrays, or NumPy arrays of objects.
+        """
+        columnar.check_format(format)
+        return RentalCompsColumns(self.results.build(format), self.comps.build(format))
+
+
+class RentalCompsResultView(columnar.RowView):
+    """A result of a `RentalCompsStore`, with the fields of `rental_comps_response.Result`."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: RentalCompsStore, index: int) -> None:
+        super().__init__(store.results, index)
+        self._store = store
+
+    @property
+    def rental_comps(self) -> List["RentalCompView"]:
+        """Views of the comps of the result."""
+        offsets = self._store.comp_offsets
+        comps = self._store.comps
+        return [RentalCompView(comps, index) for index in range(offsets[self._index], offsets[self._index + 1])]
+
+    def __dir__(self) -> List[str]:
+        return sorted({*super().__dir__(), "rental_comps"})
+
+    def to_dict(self) -> Dict[str, object]:
+        values = super().to_dict()
+        values["rental_comps"] = [comp.to_dict() for comp in self.rental_comps]
+        return values
+
+
+_RESULT_COLUMNS = [column for column in columnar.model_columns(rental_comps_response.Result) if column[0] != "api_code"]
+_RESULT_EXTRA_COLUMNS = [("api_code", columnar.INT)]
+_COMP_COLUMNS = columnar.model_columns(rental_comps_response.ResultRentalComp)
+_COMP_EXTRA_COLUMNS = [("result_index", columnar.INT), ("token", columnar.STR)]
+# The fields of a store with few distinct values, which are dictionary-encoded.
+_STORE_CATEGORIES = (
+    "listing_status",
+    "structure_type",
+    "ownership_profile",
+    "response_codes",
+    "city",
+    "state",
+    "postal_code",
+    "subdivision_name",
+)
+_STORE_RESULT_COLUMNS = [
+    column
+    for column in columnar.model_columns(rental_comps_response.Result, categories=_STORE_CATEGORIES)
+    if column[0] != "api_code"
+]
+_STORE_COMP_COLUMNS = columnar.model_columns(rental_comps_response.ResultRentalComp, categories=_STORE_CATEGORIES)
+
+
+class RentalCompView(columnar.RowView):
+    """
+    A comp of a `RentalCompsStore`, with the fields of `rental_comps_response.ResultRentalComp`. The columns that tie
+    the comp to its result (`result_index` and `token`) are left out, as in the model.
+    """
+
+    __slots__ = ()
+
+    hidden_columns = frozenset(name for name, _ in _COMP_EXTRA_COLUMNS)
+
+
+def _extend_columns(results: columnar.TableBuilder, comps: columnar.TableBuilder, result_dicts: List[dict]) -> None:
+    api_codes: List[object] = []
+    comp_dicts: List[dict] = []
+    comp_result_indices: List[object] = []
+    comp_tokens: List[object] = []
+    for result_index, result_dict in enumerate(result_dicts, len(results)):
+        api_codes.append(result_dict_api_code(result_dict))
+
+        result_comp_dicts = result_dict.get("rental_comps") or ()
+        comp_dicts.extend(result_comp_dicts)
+        comp_result_indices.extend([result_index] * len(result_comp_dicts))
+        comp_tokens.extend([result_dict.get("token")] * len(result_comp_dicts))
+
+    results.extend(result_dicts, api_codes)
+    comps.extend(comp_dicts, comp_result_indices, comp_tokens)
+
+
+def _comp_property_key(comp_dict: object) -> Optional[Hashable]:
+    details = comp_dict.get("property_details") if isinstance(comp_dict, dict) else None
+    if not isinstance(details, dict):
+        return None
+    slug = details.get("slug")
+    if isinstance(slug, str) and slug:
+        return ("slug", slug)
+    return ("address", address_key(details))
+
 
-    if not result.error_message:
-        return HTTPStatus.OK  # 200 status code
+def _request_body(filters: Optional[rental_comps_fetch_params.Filters], num_comps: Optional[int]) -> Dict[str, object]:
+    """Returns the parameters of a request besides its addresses."""
+    return {"filters": filters, "num_comps": num_comps}
 
-    if result.error_message == "No products found for address":
-        # No rental comps found for the address. This is not an error. Billing will not be charged.
-        return HTTPStatus.NO_CONTENT  # 204 status code
 
-    if result.error_message == "Could not generate similarity scores":
-        # Similarity score dependency is down. Retry later.
-        return HTTPStatus.SERVICE_UNAVAILABLE  # 503 status code
+def _check_num_addresses(addresses: Sequence[rental_comps_fetch_params.Address]) -> None:
+    if len(addresses) > MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST:
+        raise ValueError(
+            f"stream() sends a single request, of at most {MAX_ADDRESSES_PER_RENTAL_COMPS_REQUEST} addresses, got "
+            f"{len(addresses)}. Use fetch() for more addresses."
+        )
 
-    if "Cannot apply relative filtering on: " in result.error_message:
-        # Relative filtering is not supported for the given address.
-        return HTTPStatus.UNPROCESSABLE_ENTITY  # 422 status code
 
-    # An error occurred.
-    return HTTPStatus.INTERNAL_SERVER_ERROR  # 500 status code
+def _with_api_codes(result_dicts: List[dict]) -> List[dict]:
+    """Returns the result dicts with their `api_code` filled in, as in the models returned by `fetch()`."""
+    return [{**result_dict, "api_code": result_dict_api_code(result_dict)} for result_dict in result_dicts]
@@ -0,0 +1,49 @@
+# Standard Library
+from http import HTTPStatus
+from typing import Mapping, Optional
+
+# 1st Party Libraries
+from open_exchange.contants import DEFAULT_RETRYABLE_STATUS_CODES
+
+
+def result_api_code(api_code: Optional[int], error_message: Optional[str]) -> int:
+    """
+    Returns the API code for a result with the given `api_code` and `error_message` fields.
+
+    TODO: This logic will be moved to the API server in the future.
+    """
+    if isinstance(api_code, int):
+        return api_code
+
+    if not error_message:
+        return HTTPStatus.OK  # 200 status code
+
+    if error_message == "No products found for address":
+        # No rental comps found for the address. This is not an error. Billing will not be charged.
+        return HTTPStatus.NO_CONTENT  # 204 status code
+
+    if error_message == "Could not generate similarity scores":
+        # Similarity score dependency is down. Retry later.
+        return HTTPStatus.SERVICE_UNAVAILABLE  # 503 status code
+
+    if "Cannot apply relative filtering on: " in error_message:
+        # Relative filtering is not supported for the given address.
+        return HTTPStatus.UNPROCESSABLE_ENTITY  # 422 status code
+
+    # An error occurred.
+    return HTTPStatus.INTERNAL_SERVER_ERROR  # 500 status code
+
+
+def result_dict_api_code(result_dict: Mapping[str, object]) -> int:
+    """Returns the API code of a result as returned by the API, see `result_api_code()`."""
+    api_code = result_dict.get("api_code")
+    error_message = result_dict.get("error_message")
+    return result_api_code(
+        api_code if isinstance(api_code, int) else None,
+        error_message if isinstance(error_message, str) else None,
+    )
+
+
+def is_retryable_result(result_dict: Mapping[str, object]) -> bool:
+    """Whether a result (as returned by the API) failed with an error that may succeed if retried."""
+    return result_dict_api_code(result_dict) in DEFAULT_RETRYABLE_STATUS_CODES
@@ -0,0 +1,111 @@
+# Standard Library
+import collections
+import concurrent.futures
+import threading
+from typing import Callable, Deque, Dict, Mapping, Optional, Tuple
+
+_QueuedRequest = Tuple[concurrent.futures.Future, Callable[[], object]]
+
+
+class RequestScheduler:
+    """
+    Runs requests on a pool of worker threads shared by every resource of a client.
+
+    At most `max_concurrent_requests` requests run at once. Endpoints listed in `max_concurrent_requests_per_endpoint`
+    are additionally limited to their own number of concurrent requests; requests over an endpoint's limit wait in a
+    queue without occupying a worker thread.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int,
+        max_concurrent_requests_per_endpoint: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_concurrent_requests_per_endpoint: Dict[str, int] = dict(max_concurrent_requests_per_endpoint or {})
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_requests,
+            thread_name_prefix="open-exchange",
+        )
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = collections.Counter()
+        self._queued: Dict[str, Deque[_QueuedRequest]] = collections.defaultdict(collections.deque)
+        self._shutdown = False
+
+    def submit(self, endpoint: str, fn: Callable[[], object]) -> concurrent.futures.Future:
+        """Schedule `fn()` as a request to `endpoint` and return a future for its result."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot schedule new requests after the client has been closed")
+
+            limit = self.max_concurrent_requests_per_endpoint.get(endpoint)
+            if limit is not None and self._in_flight[endpoint] >= limit:
+                self._queued[endpoint].append((future, fn))
+                return future
+            self._in_flight[endpoint] += 1
+
+        self._start(endpoint, future, fn)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting requests and cancel the ones that have not started yet.
+
+        If `wait` is true, block until the requests that are already running have finished.
+        """
+        with self._lock:
+            self._shutdown = True
+            queued = [request for requests in self._queued.values() for request in requests]
+            self._queued.clear()
+
+        for future, _ in queued:
+            future.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _run(
+        self,
+        endpoint: str,
+        future: concurrent.futures.Future,
+        fn: Callable[[], object],
+    ) -> None:
+        try:
+            if self._shutdown:
+                future.cancel()
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        finally:
+            self._release(endpoint)
+
+    def _release(self, endpoint: str) -> None:
+        with self._lock:
+            queued = self._queued.get(endpoint)
+            if not queued:
+                self._in_flight[endpoint] -= 1
+                return
+            # Hand the endpoint's slot straight to the next queued request.
+            future, fn = queued.popleft()
+
+        self._start(endpoint, future, fn)
+
+    def _start(
+        self,
+        endpoint: str,
+        future: concurrent.futures.Future,
+        fn: Callable[[], object],
+    ) -> None:
+        try:
+            self._executor.submit(self._run, endpoint, future, fn)
+        except RuntimeError:
+            # The scheduler was shut down concurrently.
+            future.cancel()
@@ -0,0 +1,257 @@
+# Standard Library
+import functools
+import itertools
+import multiprocessing
+import multiprocessing.context
+import os
+import queue
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Third-Party Libraries
+import pydantic
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient, _resolve_api_key
+from open_exchange.contants import (
+    DEFAULT_MAX_ADDRESS_RETRIES,
+    DEFAULT_SHARD_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    SHARDS_IN_FLIGHT_PER_PROCESS,
+)
+from open_exchange.rate_limit import RateLimiter
+
+__all__ = [
+    "RESOURCES",
+    "ShardedRunner",
+]
+
+# The resources of `OpenExchangeClient.data` that can be fetched by a `ShardedRunner`.
+RESOURCES = ("property_details", "property_values", "rent_estimates", "rental_comps")
+
+_ShardOutcome = Union[List[pydantic.BaseModel], BaseException]
+
+
+class ShardedRunner:
+    """
+    Fetches results in a pool of worker processes, so that a single host can use all of its cores.
+
+    Parsing responses into models is CPU-bound and holds the GIL, so a single process tops out well before the network
+    or the API does. The runner splits the addresses into shards of `shard_size` addresses and hands them out to the
+    workers as they become free. Each worker has its own `OpenExchangeClient`, which fetches and parses its shards;
+    the results are merged back into a single stream.
+
+    The workers share one budget: the rate limits (and the backoff after 429 responses) are enforced by a
+    `RateLimiter` in shared memory, and `max_concurrent_requests` is split evenly among the workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        num_processes: Optional[int] = None,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrent_requests: Optional[int] = None,
+        max_requests_per_second: Optional[float] = None,
+        max_addresses_per_second: Optional[float] = None,
+        validate_responses: bool = True,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        """
+        Args:
+          num_processes: The number of worker processes. Defaults to the number of CPUs.
+
+          api_key: The Open Exchange API key. Defaults to the `OPEN_EXCHANGE_API_KEY` environment variable.
+
+          base_url: The base URL of the Open Exchange API.
+
+          max_concurrent_requests: The maximum number of requests in flight at once across all workers. Each worker
+              gets an equal share, and at least one. Defaults to `MAX_CONCURRENT_REQUESTS` per worker.
+
+          max_requests_per_second: An _optional_ limit on the number of requests sent per second across all workers.
+
+          max_addresses_per_second: An _optional_ limit on the number of addresses sent per second across all
+              workers.
+
+          validate_responses: Whether the workers validate the results returned by the API, see
+              `OpenExchangeClient`.
+
+          mp_context: The `multiprocessing` context used to start the workers. Defaults to the default context.
+
+        Raises:
+          OpenExchangeError: If no API key is given and `OPEN_EXCHANGE_API_KEY` isn't set.
+        """
+        # Checked here rather than in the workers, where the error would only show once a shard fails.
+        api_key = _resolve_api_key(api_key)
+        if num_processes is None:
+            num_processes = os.cpu_count() or 1
+        if num_processes < 1:
+            raise ValueError("num_processes must be at least 1")
+        if max_concurrent_requests is None:
+            max_concurrent_requests = num_processes * MAX_CONCURRENT_REQUESTS
+        if mp_context is None:
+            mp_context = multiprocessing.get_context()
+
+        self.num_processes = num_processes
+        self.max_concurrent_requests = max_concurrent_requests
+
+        rate_limiter = RateLimiter(
+            max_requests_per_second=max_requests_per_second,
+            max_addresses_per_second=max_addresses_per_second,
+            mp_context=mp_context,
+        )
+        client_options = {
+            "api_key": api_key,
+            "base_url": base_url,
+            "max_concurrent_requests": max(1, max_concurrent_requests // num_processes),
+            "validate_responses": validate_responses,
+            "rate_limiter": rate_limiter,
+        }
+        self._pool = mp_context.Pool(num_processes, initializer=_init_worker, initargs=(client_options,))
+
+    def fetch(
+        self,
+        resource: str,
+        addresses: Iterable[Mapping[str, object]],
+        *,
+        ordered: bool = True,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        max_shards_in_flight: Optional[int] = None,
+        max_addresses_per_request: Optional[int] = None,
+        deduplicate: bool = False,
+        adaptive_batching: bool = False,
+        max_retries: int = DEFAULT_MAX_ADDRESS_RETRIES,
+        **params: object,
+    ) -> Iterator[pydantic.BaseModel]:
+        """
+        Fetch results for addresses from a resource of the workers' clients.
+
+        Args:
+          resource: The name of the resource, one of `RESOURCES` (e.g. `"rental_comps"`).
+
+          addresses: An iterable of address objects. Addresses are read from it only as shards complete, so memory
+              use does not grow with the size of the input.
+
+          ordered: Whether to return results in the same order as `addresses`. If false, the results of each shard
+              are returned as soon as it completes.
+
+          shard_size: The number of addresses handed to a worker at a time. Each worker fetches a shard with the
+              concurrency of its client, so a shard should hold several requests' worth of addresses.
+
+          max_shards_in_flight: The maximum number of shards handed out whose results have not been returned yet.
+              Defaults to twice the number of workers.
+
+          max_addresses_per_request: The maximum number of addresses to include in each request. Defaults to the
+              resource's maximum.
+
+          deduplicate: Whether to request each property only once per shard, see the resource's `fetch()`.
+
+          adaptive_batching: Whether to adapt the number of addresses per request, see the resource's `fetch()`.
+
+          max_retries: The maximum number of times to retry an address whose result failed with a retryable error.
+
+          **params: The request parameters of the resource, e.g. `filters` and `num_comps` for rental comps.
+
+        Returns:
+          An iterator of the resource's results.
+        """
+        if resource not in RESOURCES:
+            raise ValueError(f"Unknown resource {resource!r}, expected one of {RESOURCES}")
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        if max_shards_in_flight is None:
+            max_shards_in_flight = self.num_processes * SHARDS_IN_FLIGHT_PER_PROCESS
+
+        options: Dict[str, object] = {
+            **params,
+            "ordered": ordered,
+            "deduplicate": deduplicate,
+            "adaptive_batching": adaptive_batching,
+            "max_retries": max_retries,
+        }
+        if max_addresses_per_request is not None:
+            options["max_addresses_per_request"] = max_addresses_per_request
+
+        # The outcome of each shard, by shard index. Filled by the pool's result thread.
+        outcomes: "queue.Queue[Tuple[int, _ShardOutcome]]" = queue.Queue()
+        shards = _shards(addresses, shard_size)
+        is_exhausted = False
+        num_submitted = 0
+        num_returned = 0
+        # Results of shards that completed before the shards submitted before them, if `ordered`.
+        completed: Dict[int, List[pydantic.BaseModel]] = {}
+
+        while True:
+            while not is_exhausted and num_submitted - num_returned < max_shards_in_flight:
+                shard = next(shards, None)
+                if shard is None:
+                    is_exhausted = True
+                    break
+                put = functools.partial(_put_outcome, outcomes, num_submitted)
+                self._pool.apply_async(_fetch_shard, (resource, shard, options), callback=put, error_callback=put)
+                num_submitted += 1
+
+            if num_returned == num_submitted:
+                return
+
+            index, outcome = outcomes.get()
+            if isinstance(outcome, BaseException):
+                raise outcome
+            if not ordered:
+                num_returned += 1
+                yield from outcome
+                continue
+
+            completed[index] = outcome
+            while num_returned in completed:
+                yield from completed.pop(num_returned)
+                num_returned += 1
+
+    def close(self) -> None:
+        """Wait for the shards handed out to finish and stop the workers."""
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        """Stop the workers immediately."""
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> "ShardedRunner":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _shards(addresses: Iterable[Mapping[str, object]], shard_size: int) -> Iterator[List[Mapping[str, object]]]:
+    iterator = iter(addresses)
+    while True:
+        shard = list(itertools.islice(iterator, shard_size))
+        if not shard:
+            return
+        yield shard
+
+
+def _put_outcome(outcomes: "queue.Queue[Tuple[int, _ShardOutcome]]", index: int, outcome: _ShardOutcome) -> None:
+    outcomes.put((index, outcome))
+
+
+# The options of a worker process's client, set when the worker starts, and the client, created with its first shard.
+# An error creating the client is raised by `_fetch_shard`, and so by `ShardedRunner.fetch()`: raised by the pool's
+# initializer, it would make the pool start new workers over and over while the fetch waits for its shards.
+_worker_client_options: Mapping[str, object] = {}
+_worker_client: Optional[OpenExchangeClient] = None
+
+
+def _init_worker(client_options: Mapping[str, object]) -> None:
+    global _worker_client_options
+    _worker_client_options = client_options
+
+
+def _fetch_shard(
+    resource: str, addresses: List[Mapping[str, object]], options: Mapping[str, object]
+) -> List[pydantic.BaseModel]:
+    global _worker_client
+    if _worker_client is None:
+        _worker_client = OpenExchangeClient(**_worker_client_options)  # type: ignore[arg-type]
+    return list(getattr(_worker_client.data, resource).fetch(addresses, **options))
@@ -0,0 +1,33 @@
+"""
+Tools for testing code that uses the SDK without the real API: a local stand-in server with injectable latency and
+failures, which can also record real traffic and replay it, and a load test that sweeps client settings against it.
+Run them with `python -m open_exchange.testing serve` and `python -m open_exchange.testing loadtest`.
+"""
+
+# 1st Party Libraries
+from open_exchange.testing.loadtest import LoadTestResult, run_load_test, sweep, synthetic_addresses
+from open_exchange.testing.server import (
+    FixedLatency,
+    LatencyDistribution,
+    LogNormalLatency,
+    RecordedLatency,
+    StandInServer,
+    UniformLatency,
+    parse_latency,
+    recorded_latencies,
+)
+
+__all__ = [
+    "FixedLatency",
+    "LatencyDistribution",
+    "LoadTestResult",
+    "LogNormalLatency",
+    "RecordedLatency",
+    "StandInServer",
+    "UniformLatency",
+    "parse_latency",
+    "recorded_latencies",
+    "run_load_test",
+    "sweep",
+    "synthetic_addresses",
+]
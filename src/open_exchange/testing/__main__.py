@@ -0,0 +1,7 @@
+# Standard Library
+import sys
+
+# 1st Party Libraries
+from open_exchange.testing.cli import main
+
+sys.exit(main())
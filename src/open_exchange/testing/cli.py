@@ -0,0 +1,302 @@
+# Standard Library
+import argparse
+import json
+import sys
+from typing import IO, Dict, List, Optional, Sequence
+
+# 1st Party Libraries
+from open_exchange.cli import INPUT_FORMATS, RESOURCES, _format_from_path, read_addresses
+from open_exchange.client import DEFAULT_BASE_URL
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.testing.loadtest import LoadTestResult, sweep, synthetic_addresses
+from open_exchange.testing.server import (
+    DEFAULT_ADDRESS_ERROR_MESSAGE,
+    DEFAULT_ERROR_STATUS_CODES,
+    LatencyDistribution,
+    StandInServer,
+    parse_latency,
+    recorded_latencies,
+)
+
+__all__ = [
+    "main",
+]
+
+DEFAULT_CONCURRENCY = (1, 2, 4, 8, 16)
+DEFAULT_NUM_ADDRESSES = 1_000
+
+_TABLE_COLUMNS = (
+    ("concurrency", 11),
+    ("per request", 11),
+    ("results/s", 10),
+    ("requests/s", 10),
+    ("p50", 8),
+    ("p95", 8),
+    ("p99", 8),
+    ("req err", 7),
+    ("addr err", 8),
+    ("retries", 7),
+    ("429s", 5),
+)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run a testing tool, e.g. a stand-in API server with injected latency and failures:
+
+        python -m open_exchange.testing serve --port 8080 --latency lognormal:0.2,0.5 --address-error-rate 0.05
+
+    or a sweep of client settings against it:
+
+        python -m open_exchange.testing loadtest rental-comps --concurrency 1,4,16 --latency lognormal:0.2,0.5
+
+    Returns the exit status.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except (OpenExchangeError, OSError, ValueError) as e:
+        print(f"open_exchange.testing: error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Run the stand-in server until interrupted, then print what it served."""
+    server = _stand_in(args)
+    print(f"Serving the Open Exchange API stand-in at {server.url}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        print(json.dumps(server.stats(), indent=2), file=sys.stderr)
+    return 0
+
+
+def loadtest(args: argparse.Namespace) -> int:
+    """
+    Fetch the same addresses with every combination of the concurrency and request sizes, and print the throughput,
+    latency and error rates of each. Without a base URL, the requests go to a local stand-in.
+    """
+    if args.input:
+        input_format = args.input_format or _format_from_path(args.input, INPUT_FORMATS, "--input-format")
+        addresses: List[Dict[str, object]] = list(read_addresses(args.input, input_format))
+    else:
+        addresses = synthetic_addresses(args.num_addresses)
+    request_sizes = args.addresses_per_request or _default_request_sizes(
+        RESOURCES[args.resource].max_addresses_per_request
+    )
+
+    server: Optional[StandInServer] = None
+    base_url = args.base_url
+    api_key = args.api_key
+    if base_url is None:
+        server = _stand_in(args).start()
+        base_url = server.url
+        if api_key is None:
+            api_key = "stand-in"
+    print(
+        f"Load testing {args.resource} at {base_url} with {len(addresses):,} addresses per run",
+        file=sys.stderr,
+        flush=True,
+    )
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else None
+    results: List[LoadTestResult] = []
+    try:
+        print(" ".join(f"{name:>{width}}" for name, width in _TABLE_COLUMNS), flush=True)
+        for result in sweep(
+            args.resource.replace("-", "_"),
+            addresses,
+            max_concurrent_requests=args.concurrency,
+            max_addresses_per_request=request_sizes,
+            base_url=base_url,
+            api_key=api_key,
+        ):
+            results.append(result)
+            print(_table_row(result), flush=True)
+            if result.error is not None:
+                print(f"  stopped early: {result.error}", flush=True)
+            if output is not None:
+                output.write(json.dumps(result.to_dict()) + "\n")
+                output.flush()
+    finally:
+        if output is not None:
+            output.close()
+        if server is not None:
+            server.close()
+
+    _print_best(results, args.max_error_rate, sys.stdout)
+    return 0
+
+
+def _default_request_sizes(max_addresses_per_request: int) -> List[int]:
+    return sorted({max(max_addresses_per_request // divisor, 1) for divisor in (4, 2, 1)})
+
+
+def _table_row(result: LoadTestResult) -> str:
+    values = (
+        str(result.max_concurrent_requests),
+        str(result.max_addresses_per_request),
+        f"{result.results_per_second:,.1f}",
+        f"{result.requests_per_second:,.1f}",
+        f"{result.latency_p50 * 1000:,.0f}ms",
+        f"{result.latency_p95 * 1000:,.0f}ms",
+        f"{result.latency_p99 * 1000:,.0f}ms",
+        f"{result.request_error_rate:.1%}",
+        f"{result.address_error_rate:.1%}",
+        str(result.retries + result.address_retries),
+        str(result.rate_limited_retries),
+    )
+    return " ".join(f"{value:>{width}}" for value, (_, width) in zip(values, _TABLE_COLUMNS))
+
+
+def _print_best(results: Sequence[LoadTestResult], max_error_rate: float, file: IO[str]) -> None:
+    candidates = [
+        result
+        for result in results
+        if result.error is None and max(result.request_error_rate, result.address_error_rate) <= max_error_rate
+    ]
+    if not candidates:
+        print(f"\nNo setting completed with error rates of at most {max_error_rate:.1%}.", file=file)
+        return
+    best = max(candidates, key=lambda result: result.results_per_second)
+    print(
+        f"\nHighest throughput with error rates of at most {max_error_rate:.1%}: {best.results_per_second:,.1f} "
+        f"results/s with max_concurrent_requests={best.max_concurrent_requests} and "
+        f"max_addresses_per_request={best.max_addresses_per_request} (p95 latency {best.latency_p95:.2f}s).",
+        file=file,
+    )
+
+
+def _stand_in(args: argparse.Namespace) -> StandInServer:
+    latency_per_endpoint: Dict[str, LatencyDistribution] = {}
+    if args.replay and args.replay_latency:
+        latency_per_endpoint.update(recorded_latencies(args.replay))
+    return StandInServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_per_endpoint=latency_per_endpoint,
+        latency_per_address=args.latency_per_address,
+        error_rate=args.error_rate,
+        error_status_codes=args.error_status_codes,
+        address_error_rate=args.address_error_rate,
+        address_error_message=args.address_error_message,
+        max_requests_per_second=args.max_requests_per_second,
+        rate_limited_rate=args.rate_limited_rate,
+        retry_after=args.retry_after,
+        record=args.record,
+        upstream=args.upstream if args.record else None,
+        replay=args.replay,
+        seed=args.seed,
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m open_exchange.testing", description="Testing tools.")
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    subparsers.required = True
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local stand-in for the API.",
+        description="Run a local stand-in for the API, with injected latency and failures, or record and replay "
+        "real traffic. Point a client at it with base_url=http://HOST:PORT.",
+    )
+    serve_parser.set_defaults(run=serve)
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Default: 127.0.0.1.")
+    serve_parser.add_argument("--port", type=int, default=8080, help="Default: 8080.")
+    _add_stand_in_arguments(serve_parser)
+
+    loadtest_parser = subparsers.add_parser(
+        "loadtest",
+        help="Sweep client settings and report their throughput, latency and error rates.",
+        description="Fetch the same addresses through a resource's fetch() with every combination of --concurrency "
+        "and --addresses-per-request, and report the throughput, p50/p95/p99 request latency and error rates of "
+        "each. Runs against a local stand-in configured by the stand-in options, unless --base-url is given.",
+    )
+    # The stand-in of a load test listens on a free local port.
+    loadtest_parser.set_defaults(run=loadtest, host="127.0.0.1", port=0)
+    loadtest_parser.add_argument("resource", choices=list(RESOURCES), help="The resource to fetch.")
+    loadtest_parser.add_argument(
+        "--concurrency",
+        type=_integers,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Comma-separated values of max_concurrent_requests. Default: {','.join(map(str, DEFAULT_CONCURRENCY))}.",
+    )
+    loadtest_parser.add_argument(
+        "--addresses-per-request",
+        type=_integers,
+        help="Comma-separated values of max_addresses_per_request. Default: a quarter, half and all of the "
+        "resource's maximum.",
+    )
+    loadtest_parser.add_argument(
+        "--num-addresses",
+        type=int,
+        default=DEFAULT_NUM_ADDRESSES,
+        help=f"The number of made-up addresses fetched in each run without --input. Default: {DEFAULT_NUM_ADDRESSES}.",
+    )
+    loadtest_parser.add_argument("--input", help="A CSV, JSON Lines or Parquet file of addresses to fetch in each run.")
+    loadtest_parser.add_argument("--input-format", choices=INPUT_FORMATS, help="Default: from the input's extension.")
+    loadtest_parser.add_argument("--base-url", help="The base URL of the API. Default: a local stand-in.")
+    loadtest_parser.add_argument("--api-key", help="Default: the OPEN_EXCHANGE_API_KEY environment variable.")
+    loadtest_parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.01,
+        help="The highest request and address error rates of the recommended setting. Default: 0.01.",
+    )
+    loadtest_parser.add_argument("-o", "--output", help="A JSON Lines file to write the result of each run to.")
+    _add_stand_in_arguments(loadtest_parser, prefix="stand-in ")
+    return parser
+
+
+def _add_stand_in_arguments(parser: argparse.ArgumentParser, *, prefix: str = "") -> None:
+    group = parser.add_argument_group(f"{prefix}latency")
+    group.add_argument(
+        "--latency",
+        type=parse_latency,
+        help="The latency of each request: SECONDS, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA. Default: none.",
+    )
+    group.add_argument("--latency-per-address", type=float, default=0.0, help="Seconds added per address of a request.")
+
+    group = parser.add_argument_group(f"{prefix}failures")
+    group.add_argument("--error-rate", type=float, default=0.0, help="The fraction of requests that fail with a 5xx.")
+    group.add_argument(
+        "--error-status-codes",
+        type=_integers,
+        default=DEFAULT_ERROR_STATUS_CODES,
+        help="Comma-separated status codes of failed requests. Default: 500,502,503,504.",
+    )
+    group.add_argument(
+        "--address-error-rate", type=float, default=0.0, help="The fraction of addresses whose result fails."
+    )
+    group.add_argument(
+        "--address-error-message",
+        default=DEFAULT_ADDRESS_ERROR_MESSAGE,
+        help=f"The error message of failed addresses. Default: {DEFAULT_ADDRESS_ERROR_MESSAGE!r}.",
+    )
+    group.add_argument(
+        "--max-requests-per-second", type=float, help="Respond with 429 to requests over this rate. Default: no limit."
+    )
+    group.add_argument(
+        "--rate-limited-rate", type=float, default=0.0, help="The fraction of requests rate limited regardless."
+    )
+    group.add_argument("--retry-after", type=float, default=1.0, help="The Retry-After of 429 responses. Default: 1.")
+    group.add_argument("--seed", type=int, help="The seed of the injected latencies and failures.")
+
+    group = parser.add_argument_group(f"{prefix}record and replay")
+    group.add_argument("--record", metavar="PATH", help="Forward requests to --upstream and record them to a file.")
+    group.add_argument("--upstream", default=DEFAULT_BASE_URL, help=f"Default: {DEFAULT_BASE_URL}.")
+    group.add_argument("--replay", metavar="PATH", help="Serve the results recorded in a file.")
+    group.add_argument(
+        "--replay-latency", action="store_true", help="Replay with the recorded latencies instead of at full speed."
+    )
+
+
+def _integers(value: str) -> Sequence[int]:
+    return tuple(int(item) for item in value.split(","))
@@ -0,0 +1,235 @@
+# Standard Library
+import collections
+import itertools
+import math
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence
+
+# Third-Party Libraries
+import requests
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.instrumentation import Instrumentation, RequestEvent
+
+__all__ = [
+    "LoadTestResult",
+    "run_load_test",
+    "sweep",
+    "synthetic_addresses",
+]
+
+# The endpoint path of each resource of `client.data`.
+RESOURCE_PATHS = {
+    "property_details": "/data/property-details",
+    "property_values": "/data/property-values",
+    "rent_estimates": "/data/rent-estimates",
+    "rental_comps": "/data/rental-comps",
+}
+
+_SUCCESSFUL_API_CODES = (200, 204)
+
+_STREETS = ("Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Pine St", "Elm St")
+
+
+class LoadTestResult(NamedTuple):
+    """The outcome of fetching a set of addresses with one setting. Durations are in seconds."""
+
+    max_concurrent_requests: int
+    max_addresses_per_request: int
+    # The number of input addresses, and of results returned before the fetch completed or failed.
+    num_addresses: int
+    num_results: int
+    # From the start of the fetch to its last result.
+    duration: float
+    # Requests sent, and those whose final response (after transport retries) was not 200 OK.
+    num_requests: int
+    num_failed_requests: int
+    # The latency percentiles of the requests, including transport retries but not rate limit waits.
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    # Results received (including those of retried addresses), and those whose `api_code` was not 200 or 204.
+    num_address_results: int
+    num_failed_address_results: int
+    # Requests retried after a connection error or retryable status code, or after a 429, and addresses retried.
+    retries: int
+    rate_limited_retries: int
+    address_retries: int
+    # Why the fetch stopped before returning every result, e.g. a request that failed after its retries.
+    error: Optional[str] = None
+
+    @property
+    def results_per_second(self) -> float:
+        return self.num_results / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.num_requests / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def request_error_rate(self) -> float:
+        return self.num_failed_requests / self.num_requests if self.num_requests else 0.0
+
+    @property
+    def address_error_rate(self) -> float:
+        return self.num_failed_address_results / self.num_address_results if self.num_address_results else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """Returns the fields and rates of the result, e.g. to write it as JSON."""
+        result: Dict[str, object] = self._asdict()
+        result["results_per_second"] = self.results_per_second
+        result["requests_per_second"] = self.requests_per_second
+        result["request_error_rate"] = self.request_error_rate
+        result["address_error_rate"] = self.address_error_rate
+        return result
+
+
+def run_load_test(
+    resource: str,
+    addresses: Sequence[Mapping[str, object]],
+    *,
+    max_concurrent_requests: int,
+    max_addresses_per_request: int,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    **fetch_options: object,
+) -> LoadTestResult:
+    """
+    Fetches `addresses` from `resource` (e.g. `"rental_comps"`) with a new client and returns what it took.
+
+    Each run starts from a cold client (new connections and rate limits), and addresses are not deduplicated, so that
+    every address is requested. A request that fails after its retries stops the run, and is reported in `error`.
+
+    Args:
+      resource: The name of the resource, as an attribute of `client.data`.
+
+      addresses: The addresses to fetch.
+
+      max_concurrent_requests: The client's concurrency limit.
+
+      max_addresses_per_request: The maximum number of addresses per request.
+
+      base_url: The base URL of the API, e.g. of a local `StandInServer`.
+
+      api_key: Defaults to the `OPEN_EXCHANGE_API_KEY` environment variable.
+
+      **fetch_options: Other arguments of the resource's `fetch()`, e.g. `num_comps`.
+    """
+    if resource not in RESOURCE_PATHS:
+        raise ValueError(f"Unknown resource {resource!r}, expected one of {', '.join(RESOURCE_PATHS)}")
+    recorder = _Recorder()
+    num_results = 0
+    error: Optional[str] = None
+    with OpenExchangeClient(
+        api_key=api_key, base_url=base_url, max_concurrent_requests=max_concurrent_requests, instrumentation=recorder
+    ) as client:
+        fetch = getattr(client.data, resource).fetch
+        started_at = time.perf_counter()
+        try:
+            for _ in fetch(
+                addresses, max_addresses_per_request=max_addresses_per_request, deduplicate=False, **fetch_options
+            ):
+                num_results += 1
+        except (OpenExchangeError, requests.RequestException) as e:
+            error = str(e) or type(e).__name__
+        duration = time.perf_counter() - started_at
+
+    with recorder.lock:
+        latencies = sorted(recorder.latencies)
+        return LoadTestResult(
+            max_concurrent_requests=max_concurrent_requests,
+            max_addresses_per_request=max_addresses_per_request,
+            num_addresses=len(addresses),
+            num_results=num_results,
+            duration=duration,
+            num_requests=len(latencies),
+            num_failed_requests=sum(count for status, count in recorder.status_codes.items() if status != 200),
+            latency_p50=_percentile(latencies, 0.5),
+            latency_p95=_percentile(latencies, 0.95),
+            latency_p99=_percentile(latencies, 0.99),
+            num_address_results=sum(recorder.api_codes.values()),
+            num_failed_address_results=sum(
+                count for api_code, count in recorder.api_codes.items() if api_code not in _SUCCESSFUL_API_CODES
+            ),
+            retries=recorder.retries,
+            rate_limited_retries=recorder.rate_limited_retries,
+            address_retries=recorder.address_retries,
+            error=error,
+        )
+
+
+def sweep(
+    resource: str,
+    addresses: Sequence[Mapping[str, object]],
+    *,
+    max_concurrent_requests: Iterable[int],
+    max_addresses_per_request: Iterable[int],
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    **fetch_options: object,
+) -> Iterator[LoadTestResult]:
+    """
+    Runs `run_load_test()` with every combination of `max_concurrent_requests` and `max_addresses_per_request`, and
+    yields their results as they complete.
+    """
+    for concurrency, request_size in itertools.product(list(max_concurrent_requests), list(max_addresses_per_request)):
+        yield run_load_test(
+            resource,
+            addresses,
+            max_concurrent_requests=concurrency,
+            max_addresses_per_request=request_size,
+            base_url=base_url,
+            api_key=api_key,
+            **fetch_options,
+        )
+
+
+def synthetic_addresses(num_addresses: int) -> List[Dict[str, object]]:
+    """Returns distinct, made-up addresses with tokens, to load test with when no input is at hand."""
+    return [
+        {
+            "street": f"{index // len(_STREETS) + 1} {_STREETS[index % len(_STREETS)]}",
+            "city": "Omaha",
+            "state": "NE",
+            "postal_code": "68107",
+            "token": f"load-test-{index}",
+        }
+        for index in range(num_addresses)
+    ]
+
+
+class _Recorder(Instrumentation):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.status_codes: Dict[int, int] = collections.Counter()
+        self.api_codes: Dict[int, int] = collections.Counter()
+        self.retries = 0
+        self.rate_limited_retries = 0
+        self.address_retries = 0
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self.lock:
+            self.latencies.append(event.latency)
+            self.status_codes[event.status_code] += 1
+            self.retries += event.retries
+            self.rate_limited_retries += event.rate_limited_retries
+
+    def on_address_retries(self, endpoint: str, num_addresses: int) -> None:
+        with self.lock:
+            self.address_retries += num_addresses
+
+    def on_results(self, endpoint: str, api_codes: Mapping[int, int]) -> None:
+        with self.lock:
+            for api_code, count in api_codes.items():
+                self.api_codes[api_code] += count
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    # The nearest-rank percentile.
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(math.ceil(fraction * len(sorted_values)) - 1, 0)]
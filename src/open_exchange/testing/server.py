@@ -0,0 +1,559 @@
+# Standard Library
+import abc
+import collections
+import email.message
+import http.server
+import json
+import logging
+import math
+import random
+import socket
+import socketserver
+import sys
+import threading
+import time
+from types import TracebackType
+from typing import IO, Deque, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union, cast
+
+# Third-Party Libraries
+import requests
+
+# 1st Party Libraries
+from open_exchange.addresses import address_key
+from open_exchange.cache import cache_key
+
+__all__ = [
+    "ENDPOINTS",
+    "FixedLatency",
+    "LatencyDistribution",
+    "LogNormalLatency",
+    "RecordedLatency",
+    "StandInServer",
+    "UniformLatency",
+    "parse_latency",
+    "recorded_latencies",
+]
+
+logger = logging.getLogger(__name__)
+
+ENDPOINTS = ("/data/property-details", "/data/property-values", "/data/rent-estimates", "/data/rental-comps")
+
+# The `error_message` of failed addresses: the similarity score dependency of rental comps is down, which is retryable.
+DEFAULT_ADDRESS_ERROR_MESSAGE = "Could not generate similarity scores"
+# The `error_message` of addresses that a replayed recording has no result for.
+NO_RECORDED_RESULT_ERROR_MESSAGE = "No recorded result for address"
+
+DEFAULT_ERROR_STATUS_CODES = (500, 502, 503, 504)
+DEFAULT_NUM_COMPS = 10
+
+# The request headers forwarded to the upstream API when recording.
+_FORWARDED_HEADERS = ("AUTHORIZATION", "X-PYTHON-VERSION", "X-SDK-VERSION", "Content-Type")
+
+_Response = Tuple[int, Dict[str, str], bytes]
+
+
+class LatencyDistribution(abc.ABC):
+    """The distribution of the stand-in's response latencies."""
+
+    @abc.abstractmethod
+    def sample(self, rng: random.Random) -> float:
+        """Returns a latency, in seconds."""
+
+
+class FixedLatency(LatencyDistribution):
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def sample(self, rng: random.Random) -> float:
+        return self.seconds
+
+
+class UniformLatency(LatencyDistribution):
+    def __init__(self, low: float, high: float) -> None:
+        self.low = low
+        self.high = high
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.low, self.high)
+
+
+class LogNormalLatency(LatencyDistribution):
+    """Latencies with a long tail, like those of most web services: half of them are below `median`."""
+
+    def __init__(self, median: float, sigma: float) -> None:
+        self.median = median
+        self.sigma = sigma
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.lognormvariate(math.log(self.median), self.sigma)
+
+
+class RecordedLatency(LatencyDistribution):
+    """Latencies drawn from those of recorded requests, see `recorded_latencies()`."""
+
+    def __init__(self, samples: Sequence[float]) -> None:
+        if not samples:
+            raise ValueError("RecordedLatency needs at least one sample")
+        self.samples = samples
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.choice(self.samples)
+
+
+def parse_latency(spec: str) -> LatencyDistribution:
+    """
+    Returns the latency distribution described by `spec`: a number of seconds (e.g. `"0.1"`), `"uniform:LOW,HIGH"` or
+    `"lognormal:MEDIAN,SIGMA"`.
+    """
+    kind, _, arguments = spec.partition(":")
+    try:
+        if not arguments:
+            return FixedLatency(float(kind))
+        values = [float(value) for value in arguments.split(",")]
+        if kind == "uniform" and len(values) == 2:
+            return UniformLatency(*values)
+        if kind == "lognormal" and len(values) == 2:
+            return LogNormalLatency(*values)
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid latency {spec!r}, expected SECONDS, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA")
+
+
+def recorded_latencies(path: str) -> Dict[str, RecordedLatency]:
+    """Returns the latency distribution of each endpoint in a recording made by `StandInServer(record=...)`."""
+    latencies: Dict[str, List[float]] = collections.defaultdict(list)
+    for record in _read_recording(path):
+        latencies[record["endpoint"]].append(record["latency"])
+    return {endpoint: RecordedLatency(samples) for endpoint, samples in latencies.items()}
+
+
+class StandInServer:
+    """
+    A local stand-in for the Open Exchange API, for load testing the client's concurrency and retries offline.
+
+    It serves the data endpoints (`ENDPOINTS`) with synthetic results: the same address always gets the same result.
+    Latency, failed requests (5xx), failed addresses (an `error_message`) and rate limiting (429) can be injected.
+    Point a client at it with `base_url=server.url`:
+
+    ```python
+    with StandInServer(latency=LogNormalLatency(0.2, 0.5), address_error_rate=0.05) as server:
+        client = OpenExchangeClient(api_key="stand-in", base_url=server.url)
+        results = list(client.data.rental_comps.fetch(addresses))
+        print(server.stats())
+    ```
+
+    It can also record real traffic: with `record` and `upstream`, requests are forwarded to the API and each request
+    with its response is appended to the `record` file. Replaying it (`replay=` the file) returns the recorded result
+    of each address, matched like cache entries (by endpoint, request parameters and normalized address), so it
+    doesn't matter how the addresses are grouped into requests. Recordings are replayed as fast as possible unless a
+    latency is given, e.g. the recorded ones from `recorded_latencies()`. Injected failures apply to replays as well.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[LatencyDistribution] = None,
+        latency_per_endpoint: Optional[Mapping[str, LatencyDistribution]] = None,
+        latency_per_address: float = 0.0,
+        error_rate: float = 0.0,
+        error_status_codes: Sequence[int] = DEFAULT_ERROR_STATUS_CODES,
+        address_error_rate: float = 0.0,
+        address_error_message: str = DEFAULT_ADDRESS_ERROR_MESSAGE,
+        max_requests_per_second: Optional[float] = None,
+        rate_limited_rate: float = 0.0,
+        retry_after: float = 1.0,
+        record: Optional[str] = None,
+        upstream: Optional[str] = None,
+        replay: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+          host: The host to listen on.
+
+          port: The port to listen on. Defaults to a free port, see `url`.
+
+          latency: The distribution of the time taken to respond to a request. Defaults to no latency.
+
+          latency_per_endpoint: An _optional_ mapping of endpoint path (e.g. `"/data/rental-comps"`) to the latency of
+              that endpoint's requests, overriding `latency`.
+
+          latency_per_address: The seconds added to the latency of a request for each of its addresses.
+
+          error_rate: The fraction of requests that fail with one of `error_status_codes`.
+
+          address_error_rate: The fraction of addresses whose result fails with `address_error_message`. The default
+              message is retryable, see `open_exchange.results.result_api_code`.
+
+          max_requests_per_second: The number of requests per second accepted before responding with `429 Too Many
+              Requests`, over a sliding window of one second.
+
+          rate_limited_rate: The fraction of requests that are rate limited regardless of the request rate.
+
+          retry_after: The `Retry-After` of 429 responses, in seconds.
+
+          record: The path of a file to append recorded requests and responses to. Requires `upstream`; nothing is
+              injected while recording.
+
+          upstream: The base URL of the API to forward requests to when recording, e.g.
+              `open_exchange.client.DEFAULT_BASE_URL`. The client's API key is forwarded with them.
+
+          replay: The path of a recording to replay.
+
+          seed: The seed of the injected latencies and failures, to make them reproducible.
+        """
+        if record is not None and upstream is None:
+            raise ValueError("Recording requires an upstream API")
+        if record is not None and replay is not None:
+            raise ValueError("Can't record and replay at the same time")
+
+        self.latency = latency
+        self.latency_per_endpoint: Dict[str, LatencyDistribution] = dict(latency_per_endpoint or {})
+        self.latency_per_address = latency_per_address
+        self.error_rate = error_rate
+        self.error_status_codes = error_status_codes
+        self.address_error_rate = address_error_rate
+        self.address_error_message = address_error_message
+        self.max_requests_per_second = max_requests_per_second
+        self.rate_limited_rate = rate_limited_rate
+        self.retry_after = retry_after
+        self.upstream = upstream
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        # The times of the requests accepted in the last second, if `max_requests_per_second`.
+        self._accepted: Deque[float] = collections.deque()
+        self._stats: Dict[str, Dict[str, int]] = collections.defaultdict(collections.Counter)
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+        self._record_file: Optional[IO[str]] = open(record, "a", encoding="utf-8") if record is not None else None
+        self._upstream_session = requests.Session() if upstream is not None else None
+        self._recorded_results: Optional[Dict[str, dict]] = None
+        if replay is not None:
+            self._recorded_results = {}
+            for record_dict in _read_recording(replay):
+                if record_dict["status"] != 200:
+                    continue
+                for address, result_dict in zip(record_dict["addresses"], record_dict["results"]):
+                    key = cache_key(record_dict["endpoint"], address, record_dict["params"])
+                    self._recorded_results[key] = result_dict
+
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.stand_in = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the stand-in, to pass to a client as `base_url`."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "StandInServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="open-exchange-stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on this thread, until `close()` is called from another one."""
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        """Stop serving requests and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        if self._record_file is not None:
+            self._record_file.close()
+        if self._upstream_session is not None:
+            self._upstream_session.close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Returns what the stand-in has served so far: the number of `requests`, `addresses`, `responses` by status code
+        and `failed_addresses` of each endpoint, and the maximum number of requests handled at once
+        (`max_concurrent_requests`).
+        """
+        with self._lock:
+            return {
+                "endpoints": {endpoint: dict(stats) for endpoint, stats in self._stats.items()},
+                "max_concurrent_requests": self._max_in_flight,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._max_in_flight = self._in_flight
+
+    def _handle(self, path: str, body: bytes, headers: email.message.Message) -> _Response:
+        """Returns the status code, headers and body of the response to a POST request."""
+        endpoint = next((endpoint for endpoint in ENDPOINTS if path.split("?")[0].endswith(endpoint)), None)
+        if endpoint is None:
+            return _json_response(404, {"detail": "Not found"})
+        try:
+            request = json.loads(body)
+            addresses = request["addresses"]
+            if not isinstance(addresses, list):
+                raise TypeError
+        except (ValueError, TypeError, KeyError):
+            return _json_response(400, {"detail": "Expected a JSON object with a list of addresses"})
+        params = {key: value for key, value in request.items() if key != "addresses"}
+
+        with self._lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            # Each request gets its own generator, so that concurrent requests don't share one.
+            rng = random.Random(self._rng.random())
+        try:
+            if self._upstream_session is not None:
+                status, response_headers, response_body = self._forward(endpoint, params, addresses, body, headers)
+            else:
+                status, response_headers, response_body = self._respond(endpoint, params, addresses, rng)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats["requests"] += 1
+            stats["addresses"] += len(addresses)
+            stats[str(status)] += 1
+        return status, response_headers, response_body
+
+    def _respond(
+        self, endpoint: str, params: Mapping[str, object], addresses: List[dict], rng: random.Random
+    ) -> _Response:
+        if rng.random() < self.rate_limited_rate or self._is_over_rate_limit():
+            return _json_response(429, {"detail": "Too many requests"}, {"Retry-After": f"{self.retry_after:g}"})
+
+        latency = self.latency_per_endpoint.get(endpoint, self.latency)
+        delay = (latency.sample(rng) if latency is not None else 0.0) + self.latency_per_address * len(addresses)
+        if delay > 0:
+            time.sleep(delay)
+
+        if rng.random() < self.error_rate:
+            status = rng.choice(self.error_status_codes)
+            return _json_response(status, {"detail": "Injected error"})
+
+        results = []
+        num_failed = 0
+        for address in addresses:
+            if rng.random() < self.address_error_rate:
+                results.append(_failed_result(endpoint, address, self.address_error_message))
+                num_failed += 1
+            elif self._recorded_results is not None:
+                recorded = self._recorded_results.get(cache_key(endpoint, address, params))
+                if recorded is None:
+                    results.append(_failed_result(endpoint, address, NO_RECORDED_RESULT_ERROR_MESSAGE))
+                    num_failed += 1
+                else:
+                    results.append({**recorded, "token": address.get("token")})
+            else:
+                results.append(_synthetic_result(endpoint, address, params))
+        if num_failed:
+            with self._lock:
+                self._stats[endpoint]["failed_addresses"] += num_failed
+        return _json_response(200, {"results": results})
+
+    def _is_over_rate_limit(self) -> bool:
+        if self.max_requests_per_second is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._accepted and self._accepted[0] <= now - 1.0:
+                self._accepted.popleft()
+            if len(self._accepted) >= self.max_requests_per_second:
+                return True
+            self._accepted.append(now)
+            return False
+
+    def _forward(
+        self,
+        endpoint: str,
+        params: Mapping[str, object],
+        addresses: List[dict],
+        body: bytes,
+        headers: email.message.Message,
+    ) -> _Response:
+        assert self._upstream_session is not None and self._record_file is not None
+        start = time.monotonic()
+        response = self._upstream_session.post(
+            f"{self.upstream}{endpoint}",
+            data=body,
+            headers={name: str(headers[name]) for name in _FORWARDED_HEADERS if name in headers},
+        )
+        latency = time.monotonic() - start
+
+        record_dict = {
+            "endpoint": endpoint,
+            "params": params,
+            "addresses": addresses,
+            "status": response.status_code,
+            "latency": latency,
+        }
+        if response.status_code == 200:
+            record_dict["results"] = response.json()["results"]
+        line = json.dumps(record_dict, separators=(",", ":"))
+        with self._lock:
+            self._record_file.write(f"{line}\n")
+            self._record_file.flush()
+
+        response_headers = {"Content-Type": response.headers.get("Content-Type", "application/json")}
+        if "Retry-After" in response.headers:
+            response_headers["Retry-After"] = response.headers["Retry-After"]
+        return response.status_code, response_headers, response.content
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    stand_in: StandInServer
+
+    def handle_error(
+        self, request: Union[socket.socket, Tuple[bytes, socket.socket]], client_address: Tuple[str, int]
+    ) -> None:
+        # Clients that time out close their connection before the response is written, which isn't an error.
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            logger.debug("Client %s disconnected", client_address)
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    # Keep connections alive, like the API.
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        stand_in = cast(_HTTPServer, self.server).stand_in
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status, headers, response_body = stand_in._handle(self.path, body, self.headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def _json_response(status: int, body: object, headers: Optional[Dict[str, str]] = None) -> _Response:
+    return status, {"Content-Type": "application/json", **(headers or {})}, json.dumps(body).encode()
+
+
+def _read_recording(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def _failed_result(endpoint: str, address: Mapping[str, object], error_message: str) -> dict:
+    result_dict: Dict[str, object] = {"token": address.get("token"), "error_message": error_message}
+    if endpoint == "/data/rental-comps":
+        result_dict["rental_comps"] = []
+    return result_dict
+
+
+def _synthetic_result(endpoint: str, address: Mapping[str, object], params: Mapping[str, object]) -> dict:
+    """Returns a plausible result for the address, the same each time it is requested."""
+    rng = random.Random(address_key(address))
+    token = address.get("token")
+    if endpoint == "/data/property-details":
+        return {"token": token, "property_details": _property_details(address, rng)}
+    if endpoint == "/data/property-values":
+        value = rng.randrange(80_000, 900_000)
+        return {
+            "token": token,
+            "property_value": {"value": value, "value_low": value * 9 // 10, "value_high": value * 11 // 10},
+        }
+    if endpoint == "/data/rent-estimates":
+        rent = rng.randrange(800, 4_000)
+        return {
+            "token": token,
+            "rent_estimate": {
+                "estimated_rent": rent,
+                "estimated_rent_low": rent * 9 // 10,
+                "estimated_rent_high": rent * 11 // 10,
+            },
+        }
+
+    num_comps = params.get("num_comps")
+    if not isinstance(num_comps, int):
+        num_comps = DEFAULT_NUM_COMPS
+    subject = _property_details(address, rng)
+    return {
+        "token": token,
+        "api_code": 200,
+        "has_errors": False,
+        "subject_property_details": subject,
+        "rental_comps": [_rental_comp(subject, index, rng) for index in range(num_comps)],
+    }
+
+
+_STREETS = ("Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Pine St", "Elm St", "Lake View Rd")
+_STRUCTURE_TYPES = ("SINGLE_FAMILY", "TOWNHOUSE", "CONDO")
+_LISTING_STATUSES = ("active", "removed", "closed")
+
+
+def _property_details(address: Mapping[str, object], rng: random.Random) -> dict:
+    living_area_sqft = rng.randrange(700, 4_500)
+    street = str(address.get("street") or f"{rng.randrange(1, 20_000)} {rng.choice(_STREETS)}")
+    city = str(address.get("city") or "")
+    state = str(address.get("state") or "")
+    return {
+        "street": street,
+        "city": city,
+        "state": state,
+        "postal_code": str(address.get("postal_code") or ""),
+        "unit": address.get("unit"),
+        "slug": f"{street}-{city}-{state}".lower().replace(" ", "-"),
+        "bathrooms_full": rng.randrange(1, 5),
+        "bathrooms_half": rng.randrange(0, 3),
+        "bedrooms_total": rng.randrange(1, 7),
+        "garage_spaces": rng.randrange(0, 4),
+        "has_private_pool": rng.random() < 0.15,
+        "is_in_hoa": rng.random() < 0.3,
+        "latitude": round(rng.uniform(25.0, 48.0), 6),
+        "longitude": round(rng.uniform(-122.0, -71.0), 6),
+        "living_area_sqft": living_area_sqft,
+        "above_grade_sqft": living_area_sqft,
+        "lot_size_sqft": rng.randrange(1_500, 40_000),
+        "structure_type": rng.choice(_STRUCTURE_TYPES),
+        "year_built": rng.randrange(1900, 2024),
+    }
+
+
+def _rental_comp(subject: Mapping[str, object], index: int, rng: random.Random) -> dict:
+    close_price = rng.randrange(800, 4_000)
+    comp_address = {
+        "street": f"{rng.randrange(1, 20_000)} {rng.choice(_STREETS)}",
+        "city": subject["city"],
+        "state": subject["state"],
+        "postal_code": subject["postal_code"],
+    }
+    return {
+        "close_price": close_price,
+        "close_price_date": f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+        "distance_miles": round(0.1 + 0.15 * index + rng.random() * 0.1, 3),
+        "dom": rng.randrange(3, 90),
+        "initial_list_price": close_price + rng.randrange(0, 300),
+        "last_list_price": close_price + rng.randrange(0, 100),
+        "listing_status": rng.choice(_LISTING_STATUSES),
+        "property_details": _property_details(comp_address, rng),
+        "similarity_score": round(rng.uniform(0.5, 1.0), 4),
+    }
@@ -0,0 +1,53 @@
+# Standard Library
+from typing import Callable, Iterator, List
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.testing.server import StandInServer
+
+API_KEY = "stand-in"
+
+
+@pytest.fixture
+def stand_in_server() -> Iterator[Callable[..., StandInServer]]:
+    """Returns a function that starts a stand-in API with the given options, closed at the end of the test."""
+    servers: List[StandInServer] = []
+
+    def start(**options: object) -> StandInServer:
+        server = StandInServer(seed=0, **options)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def server(stand_in_server: Callable[..., StandInServer]) -> StandInServer:
+    """A stand-in API without latency or errors."""
+    return stand_in_server()
+
+
+@pytest.fixture
+def client_for() -> Iterator[Callable[..., OpenExchangeClient]]:
+    """Returns a function that creates a client of a stand-in API with the given options, closed after the test."""
+    clients: List[OpenExchangeClient] = []
+
+    def create(server: StandInServer, **options: object) -> OpenExchangeClient:
+        client = OpenExchangeClient(api_key=API_KEY, base_url=server.url, **options)
+        clients.append(client)
+        return client
+
+    yield create
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(server: StandInServer, client_for: Callable[..., OpenExchangeClient]) -> OpenExchangeClient:
+    return client_for(server)
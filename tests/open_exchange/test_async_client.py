@@ -0,0 +1,139 @@
+# Standard Library
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, List, TypeVar
+
+# Third-Party Libraries
+import httpx
+import pytest
+
+# 1st Party Libraries
+from open_exchange.client import AsyncOpenExchangeClient, OpenExchangeClient
+from open_exchange.instrumentation import Instrumentation
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import FixedLatency, StandInServer, UniformLatency
+
+API_KEY = "stand-in"
+
+T = TypeVar("T")
+
+
+async def _collect(results: AsyncIterator[T]) -> List[T]:
+    return [result async for result in results]
+
+
+def _fetch(
+    server: StandInServer, fetch: Callable[[AsyncOpenExchangeClient], AsyncIterator[T]], **options: Any
+) -> List[T]:
+    """Returns the results of `fetch` with an async client of `server`, created and closed in a new event loop."""
+
+    async def run() -> List[T]:
+        async with AsyncOpenExchangeClient(api_key=API_KEY, base_url=server.url, **options) as client:
+            return await _collect(fetch(client))
+
+    return asyncio.run(run())
+
+
+class _AddressRetries(Instrumentation):
+    def __init__(self) -> None:
+        self.num_retried = 0
+
+    def on_address_retries(self, endpoint: str, num_addresses: int) -> None:
+        self.num_retried += num_addresses
+
+
+def _endpoint_stats(server: StandInServer, endpoint: str) -> Dict[str, int]:
+    return server.stats()["endpoints"].get(endpoint, {})
+
+
+def test_fetch_returns_a_result_per_address_in_order(server: StandInServer) -> None:
+    addresses = synthetic_addresses(25)
+
+    results = _fetch(server, lambda client: client.data.property_values.fetch(addresses, max_addresses_per_request=10))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert all(result.property_value is not None for result in results)
+    assert _endpoint_stats(server, "/data/property-values")["requests"] == 3
+
+
+def test_unordered_fetch_returns_every_result(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(latency=UniformLatency(0.0, 0.05))
+    addresses = synthetic_addresses(60)
+
+    results = _fetch(
+        server,
+        lambda client: client.data.property_values.fetch(addresses, max_addresses_per_request=5, ordered=False),
+    )
+
+    assert sorted(result.token or "" for result in results) == sorted(str(address["token"]) for address in addresses)
+
+
+def test_fetch_returns_the_results_of_the_sync_client(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(8)
+
+    results = _fetch(server, lambda client: client.data.rental_comps.fetch(addresses, num_comps=3))
+
+    assert results == list(client.data.rental_comps.fetch(addresses, num_comps=3))
+
+
+def test_failed_addresses_are_retried(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(address_error_rate=0.2)
+    addresses = synthetic_addresses(50)
+
+    results = _fetch(server, lambda client: client.data.property_values.fetch(addresses, max_addresses_per_request=10))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    stats = _endpoint_stats(server, "/data/property-values")
+    assert stats["failed_addresses"] > 0
+    assert stats["addresses"] == 50 + stats["failed_addresses"]
+
+
+def test_failed_requests_are_retried(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(error_rate=0.3, error_status_codes=[503])
+    addresses = synthetic_addresses(20)
+
+    results = _fetch(server, lambda client: client.data.rent_estimates.fetch(addresses, max_addresses_per_request=2))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    stats = _endpoint_stats(server, "/data/rent-estimates")
+    assert stats["503"] > 0
+    assert stats["200"] == 10
+
+
+def test_max_concurrent_requests_is_respected(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(latency=FixedLatency(0.1))
+
+    results = _fetch(
+        server,
+        lambda client: client.data.property_values.fetch(synthetic_addresses(24), max_addresses_per_request=2),
+        max_concurrent_requests=3,
+    )
+
+    assert len(results) == 24
+    max_concurrent_requests = server.stats()["max_concurrent_requests"]
+    assert max_concurrent_requests <= 3
+    # Requests of 100ms leave ample time to start the first 3 before any of them completes.
+    assert max_concurrent_requests >= 3
+
+
+def test_stream_returns_the_results_of_fetch(server: StandInServer) -> None:
+    addresses = synthetic_addresses(5)
+
+    streamed = _fetch(server, lambda client: client.data.rental_comps.stream(addresses, num_comps=4))
+
+    assert streamed == _fetch(server, lambda client: client.data.rental_comps.fetch(addresses, num_comps=4))
+
+
+def test_requests_that_time_out_are_retried_until_out_of_retries(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(latency=FixedLatency(0.3))
+    addresses = synthetic_addresses(3)
+    instrumentation = _AddressRetries()
+
+    with pytest.raises(httpx.ReadTimeout):
+        _fetch(
+            server,
+            lambda client: client.data.property_values.fetch(addresses, max_retries=1),
+            timeout=0.05,
+            instrumentation=instrumentation,
+        )
+
+    assert instrumentation.num_retried == 3
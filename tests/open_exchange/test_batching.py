@@ -0,0 +1,81 @@
+# Standard Library
+from typing import Callable, List
+
+# 1st Party Libraries
+from open_exchange.batching import AdaptiveBatchSize
+from open_exchange.client import OpenExchangeClient
+from open_exchange.instrumentation import Instrumentation, RequestEvent
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+
+class _RequestSizes(Instrumentation):
+    def __init__(self) -> None:
+        self.sizes: List[int] = []
+
+    def on_request(self, event: RequestEvent) -> None:
+        if event.status_code == 200:
+            self.sizes.append(event.num_addresses)
+
+
+def test_healthy_requests_grow_the_batch_size_up_to_the_maximum() -> None:
+    batch_size = AdaptiveBatchSize(10, minimum=2)
+    batch_size.size = 8
+
+    for _ in range(3):
+        batch_size.record(batch_size.generation, num_addresses=8, latency=0.1, num_failed=0)
+
+    assert batch_size.size == 10
+
+
+def test_slow_requests_and_failures_shrink_the_batch_size_down_to_the_minimum() -> None:
+    batch_size = AdaptiveBatchSize(10, minimum=2, target_latency=1.0, max_failure_rate=0.1)
+
+    batch_size.record(0, num_addresses=10, latency=1.5, num_failed=0)
+    assert batch_size.size == 5
+    batch_size.record(1, num_addresses=5, latency=0.1, num_failed=1)
+    assert batch_size.size == 2
+    # A request that failed as a whole.
+    batch_size.record(2, num_addresses=2, latency=None, num_failed=2)
+    assert batch_size.size == 2
+
+
+def test_requests_sized_before_the_last_decrease_do_not_shrink_the_batch_size_again() -> None:
+    batch_size = AdaptiveBatchSize(16)
+
+    for _ in range(3):
+        batch_size.record(0, num_addresses=16, latency=None, num_failed=16)
+
+    assert batch_size.size == 8
+    assert batch_size.generation == 1
+
+
+def test_failed_requests_shrink_the_batch_size(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    # With the transport's retries, about 1 in 8 requests fails as a whole.
+    server = stand_in_server(error_rate=0.5, error_status_codes=[503])
+    instrumentation = _RequestSizes()
+    client = client_for(server, instrumentation=instrumentation)
+    addresses = synthetic_addresses(300)
+
+    results = list(client.data.rental_comps.fetch(addresses, adaptive_batching=True, max_retries=5))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert all(result.error_message is None for result in results)
+    assert min(instrumentation.sizes) < 10
+    assert sum(instrumentation.sizes) == 300
+
+
+def test_address_failures_shrink_the_batch_size(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(address_error_rate=0.3)
+    instrumentation = _RequestSizes()
+    client = client_for(server, instrumentation=instrumentation)
+
+    results = list(client.data.property_values.fetch(synthetic_addresses(200), adaptive_batching=True))
+
+    assert len(results) == 200
+    assert instrumentation.sizes[0] == 50
+    assert min(instrumentation.sizes) < 50
@@ -0,0 +1,58 @@
+# Standard Library
+from typing import Callable
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import FixedLatency, StandInServer
+
+
+def test_bundles_join_the_results_of_each_endpoint_by_address(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    # The endpoints return at different times, and request different numbers of addresses at once.
+    server = stand_in_server(
+        latency_per_endpoint={"/data/property-values": FixedLatency(0.05), "/data/rental-comps": FixedLatency(0.01)}
+    )
+    client = client_for(server)
+    addresses = synthetic_addresses(30)
+
+    bundles = list(
+        client.data.bundles.fetch(
+            addresses,
+            include=["property_values", "rental_comps"],
+            num_comps=2,
+            max_addresses_per_request={"property_values": 7, "rental_comps": 4},
+        )
+    )
+
+    assert [bundle.token for bundle in bundles] == [address["token"] for address in addresses]
+    values = list(client.data.property_values.fetch(addresses))
+    comps = list(client.data.rental_comps.fetch(addresses, num_comps=2))
+    for bundle, address, value, comp in zip(bundles, addresses, values, comps):
+        assert bundle.address == address
+        assert bundle.property_values == value
+        assert bundle.rental_comps == comp
+        assert bundle.property_details is None
+        assert bundle.rent_estimates is None
+
+
+def test_bundles_of_duplicate_addresses(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(4)
+    duplicates = [{**address, "token": f"{address['token']}-again"} for address in addresses]
+
+    bundles = list(client.data.bundles.fetch(addresses + duplicates, include=["rent_estimates"], deduplicate=True))
+
+    assert [bundle.token for bundle in bundles] == [address["token"] for address in addresses + duplicates]
+    assert [bundle.rent_estimates.token for bundle in bundles] == [bundle.token for bundle in bundles]
+    assert server.stats()["endpoints"]["/data/rent-estimates"]["addresses"] == 4
+
+
+def test_bundles_request_each_endpoint_up_to_its_maximum(server: StandInServer, client: OpenExchangeClient) -> None:
+    bundles = list(client.data.bundles.fetch(synthetic_addresses(100), include=["property_values", "rental_comps"]))
+
+    assert len(bundles) == 100
+    endpoints = server.stats()["endpoints"]
+    # 50 and 10 addresses per request.
+    assert endpoints["/data/property-values"]["requests"] == 2
+    assert endpoints["/data/rental-comps"]["requests"] == 10
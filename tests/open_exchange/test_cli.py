@@ -0,0 +1,83 @@
+# Standard Library
+import csv
+import json
+import pathlib
+from typing import Dict, List
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.cli import ADDRESS_FIELDS, main
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+API_KEY = "stand-in"
+
+
+def _write_csv(path: pathlib.Path, records: List[Dict[str, object]]) -> str:
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, ADDRESS_FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    return str(path)
+
+
+def _main(server: StandInServer, *args: str) -> int:
+    return main([*args, "--base-url", server.url, "--api-key", API_KEY, "--quiet"])
+
+
+def test_results_are_written_as_json_lines_in_input_order(server: StandInServer, tmp_path: pathlib.Path) -> None:
+    addresses = synthetic_addresses(25)
+    input_path = _write_csv(tmp_path / "addresses.csv", addresses)
+    output_path = tmp_path / "values.jsonl"
+
+    assert (
+        _main(server, "property-values", input_path, "-o", str(output_path), "--max-addresses-per-request", "10") == 0
+    )
+
+    results = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [result["token"] for result in results] == [address["token"] for address in addresses]
+    assert all(result["property_value"]["value"] > 0 for result in results)
+    assert server.stats()["endpoints"]["/data/property-values"]["requests"] == 3
+
+
+def test_rental_comps_are_written_as_csv_rows_per_comp(server: StandInServer, tmp_path: pathlib.Path) -> None:
+    addresses = synthetic_addresses(5)
+    input_path = _write_csv(tmp_path / "addresses.csv", addresses)
+    output_path = tmp_path / "comps.csv"
+
+    assert _main(server, "rental-comps", input_path, "-o", str(output_path), "--num-comps", "2") == 0
+
+    with open(output_path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["token"] for row in rows] == [address["token"] for address in addresses for _ in range(2)]
+    assert all(int(row["rental_comps.close_price"]) > 0 for row in rows)
+    assert all(row["rental_comps.property_details.street"] for row in rows)
+
+
+def test_a_run_with_a_completed_journal_appends_nothing(server: StandInServer, tmp_path: pathlib.Path) -> None:
+    input_path = _write_csv(tmp_path / "addresses.csv", synthetic_addresses(12))
+    output_path = tmp_path / "estimates.csv"
+    args = ["rent-estimates", input_path, "-o", str(output_path), "--journal", str(tmp_path / "journal")]
+
+    assert _main(server, *args) == 0
+    output = output_path.read_text()
+    server.reset_stats()
+    assert _main(server, *args) == 0
+
+    assert output_path.read_text() == output
+    assert len(output.splitlines()) == 13
+    assert server.stats()["endpoints"] == {}
+
+
+def test_invalid_input_exits_with_an_error(
+    server: StandInServer, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture
+) -> None:
+    addresses = synthetic_addresses(3)
+    del addresses[1]["city"]
+    input_path = _write_csv(tmp_path / "addresses.csv", addresses)
+
+    assert _main(server, "property-values", input_path, "-o", str(tmp_path / "values.jsonl")) == 1
+
+    assert f"{input_path}:2: missing 'city'" in capsys.readouterr().err
@@ -0,0 +1,76 @@
+# Standard Library
+import datetime
+from typing import List, Type
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.codec import JSONArrayItemsDecoder, JSONCodec, MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+
+_DOCUMENT = (
+    b'{"request_id": "[{not an item}]", "meta": {"results": [0]}, "results": '
+    b'[{"token": "a", "nested": {"list": [1, 2]}}, {"token": "b \\" ] }"}, [3, {"four": 4}]], "count": 3}'
+)
+_ITEMS = [{"token": "a", "nested": {"list": [1, 2]}}, {"token": 'b " ] }'}, [3, {"four": 4}]]
+
+
+@pytest.fixture(params=[StdlibJSONCodec, OrjsonCodec, MsgspecCodec])
+def codec(request: pytest.FixtureRequest) -> JSONCodec:
+    codec_class: Type[JSONCodec] = request.param
+    try:
+        return codec_class()
+    except ImportError:
+        pytest.skip(f"{codec_class.__name__} is not installed")
+
+
+def test_codecs_round_trip_requests(codec: JSONCodec) -> None:
+    body = {
+        "addresses": [{"street": "1 Main St", "unit": None}],
+        "filters": {"min_close_date": datetime.date(2024, 1, 2)},
+    }
+
+    assert codec.decode(codec.encode(body)) == {
+        "addresses": [{"street": "1 Main St", "unit": None}],
+        "filters": {"min_close_date": "2024-01-02"},
+    }
+
+
+def test_codecs_encode_the_same_json(codec: JSONCodec) -> None:
+    body = {"addresses": [{"street": "1 Main St", "unit": None, "num_comps": 10, "score": 0.5}]}
+
+    assert codec.decode(codec.encode(body)) == StdlibJSONCodec().decode(StdlibJSONCodec().encode(body))
+
+
+def test_array_items_are_decoded_whole_however_the_document_is_split(codec: JSONCodec) -> None:
+    for chunk_size in (1, 7, len(_DOCUMENT)):
+        decoder = JSONArrayItemsDecoder("results", codec)
+
+        items: List[object] = []
+        for start in range(0, len(_DOCUMENT), chunk_size):
+            items.extend(decoder.feed(_DOCUMENT[start : start + chunk_size]))
+        decoder.close()
+
+        assert items == _ITEMS
+
+
+def test_array_items_of_an_empty_array() -> None:
+    decoder = JSONArrayItemsDecoder("results", StdlibJSONCodec())
+
+    assert decoder.feed(b'{"results": []}') == []
+    decoder.close()
+
+
+def test_a_document_without_the_array_raises() -> None:
+    decoder = JSONArrayItemsDecoder("results", StdlibJSONCodec())
+
+    with pytest.raises(ValueError, match="has no 'results' array"):
+        decoder.feed(b'{"detail": [{"msg": "field required"}]}')
+
+
+def test_a_document_that_ends_inside_the_array_raises_on_close() -> None:
+    decoder = JSONArrayItemsDecoder("results", StdlibJSONCodec())
+
+    assert decoder.feed(_DOCUMENT[: _DOCUMENT.index(b"[3")]) == _ITEMS[:2]
+    with pytest.raises(ValueError, match="ended before the end of its 'results' array"):
+        decoder.close()
@@ -0,0 +1,52 @@
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+
+@pytest.mark.parametrize("format", ["arrow", "numpy"])
+def test_property_values_columns_have_the_values_of_the_results(client: OpenExchangeClient, format: str) -> None:
+    pytest.importorskip("pyarrow" if format == "arrow" else "numpy")
+    addresses = synthetic_addresses(25)
+    results = list(client.data.property_values.fetch(addresses, max_addresses_per_request=10))
+
+    table = client.data.property_values.fetch_columnar(addresses, format=format, max_addresses_per_request=10)
+
+    columns = table.to_pydict() if format == "arrow" else {name: list(column) for name, column in table.items()}
+    assert columns["token"] == [result.token for result in results]
+    assert columns["error_message"] == [None] * 25
+    assert columns["property_value.value"] == [
+        result.property_value.value if result.property_value is not None else None for result in results
+    ]
+
+
+@pytest.mark.parametrize("format", ["arrow", "numpy"])
+def test_rental_comps_columns_have_a_row_per_comp(client: OpenExchangeClient, format: str) -> None:
+    pytest.importorskip("pyarrow" if format == "arrow" else "numpy")
+    addresses = synthetic_addresses(6)
+    results = list(client.data.rental_comps.fetch(addresses, num_comps=3))
+
+    columns = client.data.rental_comps.fetch_columnar(addresses, num_comps=3, format=format)
+
+    if format == "arrow":
+        result_columns, comp_columns = columns.results.to_pydict(), columns.comps.to_pydict()
+    else:
+        result_columns = {name: column.tolist() for name, column in columns.results.items()}
+        comp_columns = {name: column.tolist() for name, column in columns.comps.items()}
+    assert result_columns["token"] == [result.token for result in results]
+    assert "rental_comps" not in result_columns
+    comps = [(index, result.token, comp) for index, result in enumerate(results) for comp in result.rental_comps]
+    assert comp_columns["result_index"] == [index for index, _, _ in comps]
+    assert comp_columns["token"] == [token for _, token, _ in comps]
+    assert comp_columns["close_price"] == [comp.close_price for _, _, comp in comps]
+    assert comp_columns["close_price_date"] == [comp.close_price_date for _, _, comp in comps]
+
+
+def test_an_unknown_format_raises_before_any_request(server: StandInServer, client: OpenExchangeClient) -> None:
+    with pytest.raises(ValueError, match="Unknown columnar format 'pandas'"):
+        client.data.property_values.fetch_columnar(synthetic_addresses(3), format="pandas")
+
+    assert server.stats()["endpoints"] == {}
@@ -0,0 +1,342 @@
+# Standard Library
+import itertools
+import pathlib
+from typing import Callable, Dict, Optional, Tuple
+
+# Third-Party Libraries
+import pytest
+import requests
+
+# 1st Party Libraries
+from open_exchange.cache import MemoryCache
+from open_exchange.client import OpenExchangeClient
+from open_exchange.contants import (
+    ADDRESS_RETRY_BUDGET_MIN,
+    ADDRESS_RETRY_BUDGET_RATIO,
+    MAX_ADDRESSES_PER_PROPERTY_VALUES_REQUEST,
+)
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.instrumentation import Instrumentation
+from open_exchange.journal import FetchJournal
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import FixedLatency, StandInServer, UniformLatency
+
+PROPERTY_VALUES = "/data/property-values"
+
+
+def _endpoint_stats(server: StandInServer, endpoint: str = PROPERTY_VALUES) -> Dict[str, int]:
+    return server.stats()["endpoints"].get(endpoint, {})
+
+
+def test_fetch_returns_a_result_per_address_in_order(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(25)
+
+    results = list(client.data.property_values.fetch(addresses, max_addresses_per_request=10))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert all(result.property_value is not None for result in results)
+    assert _endpoint_stats(server)["requests"] == 3
+
+
+def test_unordered_fetch_returns_every_result(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(latency=UniformLatency(0.0, 0.05))
+    client = client_for(server)
+    addresses = synthetic_addresses(100)
+
+    ordered = list(client.data.property_values.fetch(addresses, max_addresses_per_request=5))
+    unordered = list(client.data.property_values.fetch(addresses, max_addresses_per_request=5, ordered=False))
+
+    assert [result.token for result in ordered] == [address["token"] for address in addresses]
+    assert sorted(result.token or "" for result in unordered) == sorted(str(address["token"]) for address in addresses)
+    # The stand-in's results are the same for an address each time.
+    by_token = {result.token: result for result in ordered}
+    assert all(result == by_token[result.token] for result in unordered)
+
+
+@pytest.mark.parametrize(
+    "resource, options",
+    [
+        ("property_details", {}),
+        ("property_values", {}),
+        ("rent_estimates", {}),
+        ("rental_comps", {"num_comps": 3}),
+    ],
+)
+def test_unvalidated_results_equal_the_validated_ones(
+    server: StandInServer,
+    client: OpenExchangeClient,
+    client_for: Callable[..., OpenExchangeClient],
+    resource: str,
+    options: Dict[str, object],
+) -> None:
+    unvalidated_client = client_for(server, validate_responses=False)
+    addresses = synthetic_addresses(10)
+
+    results = list(getattr(client.data, resource).fetch(addresses, **options))
+    unvalidated_results = list(getattr(unvalidated_client.data, resource).fetch(addresses, **options))
+
+    assert unvalidated_results == results
+    assert [type(result) for result in unvalidated_results] == [type(result) for result in results]
+
+
+def test_duplicates_are_sent_as_given_by_default(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(10)
+    duplicates = [{**address, "token": f"{address['token']}-again"} for address in addresses]
+
+    results = list(client.data.property_values.fetch(addresses + duplicates))
+
+    assert len(results) == 20
+    assert _endpoint_stats(server)["addresses"] == 20
+
+
+def test_deduplicate_requests_each_property_once(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(10)
+    # The same properties, spelled differently and with other tokens.
+    duplicates = [
+        {**address, "street": f"  {str(address['street']).upper()} ", "token": f"{address['token']}-again"}
+        for address in addresses
+    ]
+
+    results = list(client.data.property_values.fetch(addresses + duplicates, deduplicate=True))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses + duplicates]
+    for result, duplicate_result in zip(results[:10], results[10:]):
+        assert duplicate_result.property_value == result.property_value
+    assert _endpoint_stats(server)["addresses"] == 10
+
+
+def test_failed_addresses_are_retried(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(address_error_rate=0.2)
+    client = client_for(server)
+    addresses = synthetic_addresses(50)
+
+    results = list(client.data.property_values.fetch(addresses, max_addresses_per_request=10))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    stats = _endpoint_stats(server)
+    assert stats["failed_addresses"] > 0
+    assert stats["addresses"] == 50 + stats["failed_addresses"]
+    # A few addresses may fail on every attempt.
+    assert sum(result.error_message is None for result in results) >= 45
+
+
+def test_retries_stop_after_max_retries(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(address_error_rate=1.0)
+    client = client_for(server)
+    addresses = synthetic_addresses(3)
+
+    results = list(client.data.property_values.fetch(addresses, max_retries=2))
+
+    assert all(result.error_message is not None for result in results)
+    assert _endpoint_stats(server)["addresses"] == 3 * (1 + 2)
+
+
+def test_retries_are_capped_by_the_retry_budget(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(address_error_rate=1.0)
+    client = client_for(server)
+    addresses = synthetic_addresses(40)
+
+    results = list(client.data.property_values.fetch(addresses, max_addresses_per_request=10, max_retries=5))
+
+    assert len(results) == 40
+    assert all(result.error_message is not None for result in results)
+    max_retries = ADDRESS_RETRY_BUDGET_RATIO * 40 + ADDRESS_RETRY_BUDGET_MIN
+    assert 40 < _endpoint_stats(server)["addresses"] <= 40 + max_retries
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_a_low_error_rate_only_adds_requests_for_the_failed_addresses(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient], ordered: bool
+) -> None:
+    server = stand_in_server(latency=FixedLatency(0.02), address_error_rate=0.005)
+    client = client_for(server)
+    addresses = synthetic_addresses(6000)
+
+    results = list(client.data.property_values.fetch(addresses, ordered=ordered))
+
+    assert len(results) == len(addresses)
+    assert all(result.error_message is None for result in results)
+    # About 30 failed addresses, each retried on its own rather than with the rest of its chunk, and at most one extra
+    # request per retry rather than a wait for a full request.
+    stats = _endpoint_stats(server)
+    assert 0 < stats["failed_addresses"] < 60
+    assert stats["addresses"] == 6000 + stats["failed_addresses"]
+    assert stats["requests"] <= 6000 // MAX_ADDRESSES_PER_PROPERTY_VALUES_REQUEST + stats["failed_addresses"]
+
+
+def test_rate_limited_requests_are_retried_after_retry_after(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(rate_limited_rate=0.3, retry_after=0.01)
+    client = client_for(server)
+    addresses = synthetic_addresses(40)
+
+    results = list(client.data.property_values.fetch(addresses, max_addresses_per_request=4))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert all(result.error_message is None for result in results)
+    stats = _endpoint_stats(server)
+    assert stats["429"] > 0
+    assert stats["200"] == 10
+
+
+def test_cached_results_are_not_requested_again(
+    server: StandInServer, client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    client = client_for(server, cache=MemoryCache())
+    addresses = synthetic_addresses(20)
+
+    first = list(client.data.property_values.fetch(addresses[:15]))
+    server.reset_stats()
+    second = list(client.data.property_values.fetch(addresses))
+
+    assert second[:15] == first
+    assert [result.token for result in second] == [address["token"] for address in addresses]
+    assert _endpoint_stats(server)["addresses"] == 5
+
+
+def test_cache_hits_keep_the_tokens_of_the_request(
+    server: StandInServer, client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    client = client_for(server, cache=MemoryCache())
+    addresses = synthetic_addresses(5)
+    list(client.data.property_values.fetch(addresses))
+    server.reset_stats()
+
+    retokened = [{**address, "token": f"{address['token']}-cached"} for address in addresses]
+    results = list(client.data.property_values.fetch(retokened))
+
+    assert [result.token for result in results] == [address["token"] for address in retokened]
+    assert _endpoint_stats(server) == {}
+
+
+def test_journal_resumes_an_interrupted_fetch(
+    server: StandInServer, client: OpenExchangeClient, tmp_path: pathlib.Path
+) -> None:
+    addresses = synthetic_addresses(50)
+    path = str(tmp_path / "fetch.journal")
+
+    with FetchJournal(path) as journal:
+        results = client.data.property_values.fetch(addresses, max_addresses_per_request=10, journal=journal)
+        # Asking for the 11th result records that the first 10 have been returned.
+        returned = list(itertools.islice(results, 11))
+        results.close()
+        assert journal.num_completed == 10
+
+    with FetchJournal(path) as journal:
+        resumed = list(client.data.property_values.fetch(addresses, max_addresses_per_request=10, journal=journal))
+        assert journal.num_completed == 50
+
+    assert [result.token for result in returned] == [address["token"] for address in addresses[:11]]
+    assert [result.token for result in resumed] == [address["token"] for address in addresses[10:]]
+
+
+def test_journal_of_a_completed_fetch_skips_it(
+    server: StandInServer, client: OpenExchangeClient, tmp_path: pathlib.Path
+) -> None:
+    addresses = synthetic_addresses(30)
+    path = str(tmp_path / "fetch.journal")
+    with FetchJournal(path) as journal:
+        assert len(list(client.data.property_values.fetch(addresses, journal=journal))) == 30
+
+    server.reset_stats()
+    with FetchJournal(path) as journal:
+        assert list(client.data.property_values.fetch(addresses, journal=journal)) == []
+    assert _endpoint_stats(server) == {}
+
+
+def test_max_concurrent_requests_is_respected(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(latency=FixedLatency(0.1))
+    client = client_for(server, max_concurrent_requests=3)
+
+    results = list(client.data.property_values.fetch(synthetic_addresses(24), max_addresses_per_request=2))
+
+    assert len(results) == 24
+    max_concurrent_requests = server.stats()["max_concurrent_requests"]
+    assert max_concurrent_requests <= 3
+    # Requests of 100ms leave ample time to start the first 3 before any of them completes.
+    assert max_concurrent_requests >= 3
+
+
+def test_a_response_missing_results_raises(
+    server: StandInServer, client: OpenExchangeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    timed_request = client._timed_request
+
+    def drop_last_result(
+        method: str, path: str, body: Optional[dict] = None, *, submitted_at: Optional[float] = None
+    ) -> Tuple[float, dict]:
+        latency, response = timed_request(method, path, body, submitted_at=submitted_at)
+        return latency, {**response, "results": response["results"][:-1]}
+
+    monkeypatch.setattr(client, "_timed_request", drop_last_result)
+
+    with pytest.raises(OpenExchangeError, match="returned 9 results for a request of 10 addresses"):
+        list(client.data.property_values.fetch(synthetic_addresses(30), max_addresses_per_request=10))
+
+
+class _AddressRetries(Instrumentation):
+    def __init__(self) -> None:
+        self.num_retried = 0
+
+    def on_address_retries(self, endpoint: str, num_addresses: int) -> None:
+        self.num_retried += num_addresses
+
+
+def test_the_addresses_of_failed_requests_are_retried(
+    server: StandInServer, client: OpenExchangeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    timed_request = client._timed_request
+    num_failures = itertools.count()
+
+    def fail_twice(
+        method: str, path: str, body: Optional[dict] = None, *, submitted_at: Optional[float] = None
+    ) -> Tuple[float, dict]:
+        if next(num_failures) < 2:
+            raise requests.exceptions.RetryError("Max retries exceeded (too many 503 error responses)")
+        return timed_request(method, path, body, submitted_at=submitted_at)
+
+    monkeypatch.setattr(client, "_timed_request", fail_twice)
+    addresses = synthetic_addresses(30)
+
+    results = list(client.data.property_values.fetch(addresses, max_addresses_per_request=10))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert all(result.error_message is None for result in results)
+    assert _endpoint_stats(server)["addresses"] == 30
+
+
+def test_requests_that_time_out_are_retried_until_out_of_retries(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(latency=FixedLatency(0.3))
+    instrumentation = _AddressRetries()
+    client = client_for(server, timeout=0.05, instrumentation=instrumentation)
+
+    with pytest.raises(requests.ConnectionError, match="Read timed out"):
+        list(client.data.property_values.fetch(synthetic_addresses(3), max_retries=1))
+
+    assert instrumentation.num_retried == 3
+
+
+def test_requests_that_fail_with_a_non_retryable_status_code_raise(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(error_rate=1.0, error_status_codes=[500])
+    instrumentation = _AddressRetries()
+    client = client_for(server, instrumentation=instrumentation)
+
+    with pytest.raises(requests.HTTPError, match="500"):
+        list(client.data.property_values.fetch(synthetic_addresses(3)))
+
+    assert instrumentation.num_retried == 0
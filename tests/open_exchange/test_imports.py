@@ -0,0 +1,37 @@
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+from typing import List
+
+# 1st Party Libraries
+import open_exchange
+from open_exchange.testing.server import StandInServer
+
+_FETCH_PROPERTY_VALUES = """
+import json, sys
+import open_exchange
+
+client = open_exchange.OpenExchangeClient(api_key="stand-in", base_url=sys.argv[1])
+address = {"street": "1 Main St", "city": "Omaha", "state": "NE", "postal_code": "68107"}
+assert len(list(client.data.property_values.fetch([address]))) == 1
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _modules_after(code: str, *args: str) -> List[str]:
+    """Returns the modules that running `code` imports in a new interpreter."""
+    src = os.path.dirname(os.path.dirname(os.path.abspath(open_exchange.__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])))
+    process = subprocess.run([sys.executable, "-c", code, *args], env=env, check=True, stdout=subprocess.PIPE)
+    return json.loads(process.stdout)
+
+
+def test_fetching_property_values_does_not_import_the_other_resources(server: StandInServer) -> None:
+    modules = _modules_after(_FETCH_PROPERTY_VALUES, server.url)
+
+    assert "open_exchange.types.data.property_values_response" in modules
+    assert "open_exchange.types.data.rental_comps_response" not in modules
+    assert "open_exchange.resources.data.rental_comps" not in modules
+    assert "open_exchange.columnar" not in modules
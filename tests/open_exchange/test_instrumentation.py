@@ -0,0 +1,81 @@
+# Standard Library
+from typing import Callable
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.instrumentation import MetricsRegistry, PrometheusInstrumentation
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+RENTAL_COMPS = "/data/rental-comps"
+
+
+def test_metrics_registry_counts_requests_addresses_and_results(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(address_error_rate=0.2)
+    metrics = MetricsRegistry()
+    client = client_for(server, instrumentation=metrics)
+
+    results = list(client.data.rental_comps.fetch(synthetic_addresses(30), num_comps=2, max_addresses_per_request=10))
+
+    assert len(results) == 30
+    stats = server.stats()["endpoints"][RENTAL_COMPS]
+    snapshot = metrics.snapshot()[RENTAL_COMPS]
+    assert snapshot["requests"] == stats["requests"]
+    assert snapshot["status_codes"] == {200: stats["requests"]}
+    assert snapshot["addresses"] == 30
+    assert snapshot["addresses_requested"] == stats["addresses"]
+    assert snapshot["address_retries"] == stats["addresses"] - 30
+    assert snapshot["results_parsed"] == 30
+    api_codes = snapshot["api_codes"]
+    assert isinstance(api_codes, dict)
+    assert sum(api_codes.values()) == stats["addresses"]
+    assert api_codes[200] == sum(result.error_message is None for result in results)
+    latency = snapshot["latency"]
+    assert isinstance(latency, dict)
+    assert latency["count"] == stats["requests"]
+    assert 0 < latency["min"] <= latency["mean"] <= latency["max"]
+
+
+def test_metrics_registry_reset_clears_the_metrics(
+    server: StandInServer, client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    metrics = MetricsRegistry()
+    client = client_for(server, instrumentation=metrics)
+    list(client.data.property_values.fetch(synthetic_addresses(3)))
+
+    metrics.reset()
+
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_instrumentation_exports_the_metrics_of_each_endpoint(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    server = stand_in_server(address_error_rate=0.2)
+    client = client_for(server, instrumentation=PrometheusInstrumentation(namespace="test", registry=registry))
+
+    results = list(client.data.rental_comps.fetch(synthetic_addresses(30), num_comps=2, max_addresses_per_request=10))
+
+    stats = server.stats()["endpoints"][RENTAL_COMPS]
+    labels = {"endpoint": RENTAL_COMPS}
+
+    def sample(name: str, **extra_labels: str) -> float:
+        value = registry.get_sample_value(name, {**labels, **extra_labels})
+        assert value is not None, name
+        return float(value)
+
+    assert sample("test_requests_total", status_code="200") == stats["requests"]
+    assert sample("test_request_latency_seconds_count") == stats["requests"]
+    assert sample("test_retries_total", reason="address") == stats["addresses"] - 30
+    assert sample("test_results_total", api_code="200") == sum(result.error_message is None for result in results)
+    assert sample("test_chunk_addresses_sum") == 30
+    assert sample("test_response_bytes_total") > 0
+    exposition = prometheus_client.generate_latest(registry).decode()
+    assert f'test_requests_total{{endpoint="{RENTAL_COMPS}",status_code="200"}}' in exposition
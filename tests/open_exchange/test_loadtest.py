@@ -0,0 +1,108 @@
+# Standard Library
+import json
+import pathlib
+from typing import Callable
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.testing import cli
+from open_exchange.testing.loadtest import run_load_test, sweep, synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+API_KEY = "stand-in"
+
+
+def test_a_load_test_reports_what_the_fetch_took(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(address_error_rate=0.1)
+
+    result = run_load_test(
+        "property_values",
+        synthetic_addresses(40),
+        max_concurrent_requests=2,
+        max_addresses_per_request=10,
+        base_url=server.url,
+        api_key=API_KEY,
+    )
+
+    stats = server.stats()["endpoints"]["/data/property-values"]
+    assert result.error is None
+    assert (result.num_addresses, result.num_results) == (40, 40)
+    assert result.num_requests == stats["requests"]
+    assert result.num_failed_requests == 0
+    assert result.num_address_results == stats["addresses"]
+    assert result.num_failed_address_results == stats["failed_addresses"] > 0
+    assert result.address_retries == stats["addresses"] - 40
+    assert 0 < result.latency_p50 <= result.latency_p95 <= result.latency_p99
+    assert result.address_error_rate == pytest.approx(stats["failed_addresses"] / stats["addresses"])
+    assert result.to_dict()["results_per_second"] == result.results_per_second > 0
+
+
+def test_a_load_test_that_fails_reports_the_error(stand_in_server: Callable[..., StandInServer]) -> None:
+    server = stand_in_server(error_rate=1.0, error_status_codes=[500])
+
+    result = run_load_test(
+        "rent_estimates",
+        synthetic_addresses(10),
+        max_concurrent_requests=1,
+        max_addresses_per_request=5,
+        base_url=server.url,
+        api_key=API_KEY,
+    )
+
+    assert result.error is not None and "500" in result.error
+    assert result.num_results == 0
+    assert result.num_failed_requests == result.num_requests
+
+
+def test_an_unknown_resource_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown resource 'comps'"):
+        run_load_test("comps", [], max_concurrent_requests=1, max_addresses_per_request=1)
+
+
+def test_a_sweep_runs_every_combination_of_settings(server: StandInServer) -> None:
+    results = list(
+        sweep(
+            "rental_comps",
+            synthetic_addresses(12),
+            max_concurrent_requests=[1, 4],
+            max_addresses_per_request=[3, 12],
+            base_url=server.url,
+            api_key=API_KEY,
+            num_comps=2,
+        )
+    )
+
+    settings = [(result.max_concurrent_requests, result.max_addresses_per_request) for result in results]
+    assert settings == [(1, 3), (1, 12), (4, 3), (4, 12)]
+    assert [result.num_results for result in results] == [12] * 4
+    assert [result.num_requests for result in results] == [4, 1, 4, 1]
+
+
+def test_the_load_test_command_writes_a_result_per_setting(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture
+) -> None:
+    output_path = tmp_path / "results.jsonl"
+
+    status = cli.main(
+        [
+            "loadtest",
+            "property-values",
+            "--concurrency",
+            "1,2",
+            "--addresses-per-request",
+            "25",
+            "--num-addresses",
+            "50",
+            "--seed",
+            "0",
+            "-o",
+            str(output_path),
+        ]
+    )
+
+    assert status == 0
+    results = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [(result["max_concurrent_requests"], result["num_results"]) for result in results] == [(1, 50), (2, 50)]
+    assert "Highest throughput" in capsys.readouterr().out
@@ -0,0 +1,91 @@
+# Standard Library
+import email.utils
+import time
+from typing import Callable
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.instrumentation import MetricsRegistry
+from open_exchange.rate_limit import RateLimiter, parse_retry_after
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+
+def test_requests_are_spaced_evenly_at_the_maximum_rate() -> None:
+    limiter = RateLimiter(max_requests_per_second=20)
+
+    delays = [limiter.reserve(1) for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.05, 0.1, 0.15], abs=0.01)
+
+
+def test_addresses_are_limited_by_the_maximum_address_rate() -> None:
+    limiter = RateLimiter(max_addresses_per_second=100)
+
+    assert limiter.reserve(1) == 0.0
+    assert limiter.reserve(50) == pytest.approx(0.5, abs=0.01)
+
+
+def test_a_rate_limited_request_pauses_every_request_for_its_retry_after() -> None:
+    limiter = RateLimiter(max_requests_per_second=20)
+    assert limiter.reserve(1) == 0.0
+
+    limiter.record_rate_limited(time.monotonic(), retry_after=0.5)
+
+    assert limiter.reserve(1) == pytest.approx(0.5, abs=0.01)
+
+
+def test_a_rate_limited_request_halves_the_request_rate() -> None:
+    limiter = RateLimiter(max_requests_per_second=20)
+
+    limiter.record_rate_limited(time.monotonic(), retry_after=0.0)
+
+    assert [limiter.reserve(1) for _ in range(2)] == pytest.approx([0.1, 0.2], abs=0.01)
+
+
+def test_requests_sent_before_the_last_decrease_do_not_lower_the_rate_again() -> None:
+    limiter = RateLimiter(max_requests_per_second=20)
+    sent_at = time.monotonic()
+
+    limiter.record_rate_limited(sent_at, retry_after=0.0)
+    limiter.record_rate_limited(sent_at, retry_after=0.0)
+
+    assert limiter.reserve(1) == pytest.approx(0.1, abs=0.01)
+
+
+def test_parse_retry_after_reads_delay_seconds() -> None:
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("0.5") == 0.5
+    assert parse_retry_after("-1") == 0.0
+
+
+def test_parse_retry_after_reads_http_dates() -> None:
+    in_30_seconds = email.utils.formatdate(time.time() + 30, usegmt=True)
+    a_minute_ago = email.utils.formatdate(time.time() - 60, usegmt=True)
+
+    assert parse_retry_after(in_30_seconds) == pytest.approx(30, abs=1.5)
+    assert parse_retry_after(a_minute_ago) == 0.0
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", "Someday, 32 Foo 2024"])
+def test_parse_retry_after_ignores_invalid_values(value: str) -> None:
+    assert parse_retry_after(value) is None
+
+
+def test_a_client_sends_requests_at_most_at_its_maximum_rate(
+    server: StandInServer, client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    metrics = MetricsRegistry()
+    client = client_for(server, max_requests_per_second=50, instrumentation=metrics)
+
+    started_at = time.perf_counter()
+    results = list(client.data.property_values.fetch(synthetic_addresses(20), max_addresses_per_request=2))
+    duration = time.perf_counter() - started_at
+
+    assert len(results) == 20
+    # The first request is sent at once, and the other 9 at intervals of 20ms.
+    assert duration >= 0.18
+    assert metrics.snapshot()["/data/property-values"]["rate_limit_wait"]["total"] > 0
@@ -1 +1,103 @@
-# TODO: Investigate using https://github.com/stoplightio/prism for mocking
+# Standard Library
+import pathlib
+from typing import Callable
+
+# Third-Party Libraries
+import pytest
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.journal import FetchJournal
+from open_exchange.resources.data.rental_comps import CompPropertyInterner, InternedCompPropertyDetails
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+
+def test_fetch_returns_the_requested_number_of_comps(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(12)
+
+    results = list(client.data.rental_comps.fetch(addresses, num_comps=3))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert all(len(result.rental_comps) == 3 for result in results)
+    assert all(result.api_code == 200 for result in results)
+
+
+def test_stream_returns_the_results_of_fetch(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(5)
+
+    streamed = client.data.rental_comps.stream(addresses, num_comps=4)
+    first = next(streamed)
+    rest = list(streamed)
+
+    assert [first, *rest] == list(client.data.rental_comps.fetch(addresses, num_comps=4))
+    assert server.stats()["endpoints"]["/data/rental-comps"]["requests"] == 2
+
+
+def test_interner_shares_the_details_of_a_comp_property(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(3)
+    interner = CompPropertyInterner()
+
+    first = list(client.data.rental_comps.fetch(addresses, num_comps=5, comp_property_interner=interner))
+    num_properties = len(interner)
+    # The stand-in returns the same comps for an address each time.
+    second = list(client.data.rental_comps.fetch(addresses, num_comps=5, comp_property_interner=interner))
+
+    assert num_properties == 3 * 5
+    assert len(interner) == num_properties
+    for first_result, second_result in zip(first, second):
+        for first_comp, second_comp in zip(first_result.rental_comps, second_result.rental_comps):
+            assert isinstance(first_comp.property_details, InternedCompPropertyDetails)
+            assert second_comp.property_details is first_comp.property_details
+    assert second == list(client.data.rental_comps.fetch(addresses, num_comps=5))
+
+
+def test_failed_results_have_no_comps(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(address_error_rate=1.0, address_error_message="Address not found")
+    client = client_for(server)
+
+    results = list(client.data.rental_comps.fetch(synthetic_addresses(2)))
+
+    assert [result.error_message for result in results] == ["Address not found", "Address not found"]
+    assert all(result.rental_comps == [] for result in results)
+    # Not a retryable error.
+    assert server.stats()["endpoints"]["/data/rental-comps"]["addresses"] == 2
+
+
+def test_fetch_compact_resumes_with_a_journal(
+    server: StandInServer, client: OpenExchangeClient, tmp_path: pathlib.Path
+) -> None:
+    addresses = synthetic_addresses(20)
+    path = str(tmp_path / "fetch.journal")
+    with FetchJournal(path) as journal:
+        store = client.data.rental_comps.fetch_compact(addresses[:12], num_comps=2, journal=journal)
+
+    with FetchJournal(path) as journal:
+        client.data.rental_comps.fetch_compact(addresses, num_comps=2, store=store, journal=journal)
+
+    assert [result.token for result in store] == [address["token"] for address in addresses]
+    assert server.stats()["endpoints"]["/data/rental-comps"]["addresses"] == 20
+
+
+def test_store_views_have_the_fields_of_the_models(server: StandInServer, client: OpenExchangeClient) -> None:
+    addresses = synthetic_addresses(6)
+
+    store = client.data.rental_comps.fetch_compact(addresses, num_comps=3)
+    results = list(client.data.rental_comps.fetch(addresses, num_comps=3))
+
+    assert len(store) == 6
+    assert store.num_comps == 18
+    for view, result in zip(store, results):
+        assert view.to_dict() == result.dict()
+        assert view.token == result.token
+        comp = view.rental_comps[0]
+        assert comp.close_price == result.rental_comps[0].close_price
+        assert comp.property_details.bedrooms_total == result.rental_comps[0].property_details.bedrooms_total
+        assert "token" not in dir(comp)
+        with pytest.raises(AttributeError):
+            comp.result_index
+    assert [comp.to_dict() for comp in store.iter_comps()] == [
+        comp.dict() for result in results for comp in result.rental_comps
+    ]
@@ -0,0 +1,71 @@
+# Standard Library
+import threading
+import time
+from typing import Callable, Dict, List
+
+# 1st Party Libraries
+from open_exchange.client import OpenExchangeClient
+from open_exchange.scheduler import RequestScheduler
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import FixedLatency, StandInServer
+
+
+class _ConcurrencyTracker:
+    """Requests that sleep for a while, recording the most that ran at once per endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._running: Dict[str, int] = {}
+        self.max_running: Dict[str, int] = {}
+
+    def request(self, endpoint: str) -> Callable[[], str]:
+        def run() -> str:
+            with self._lock:
+                self._running[endpoint] = self._running.get(endpoint, 0) + 1
+                self.max_running[endpoint] = max(self.max_running.get(endpoint, 0), self._running[endpoint])
+            time.sleep(0.05)
+            with self._lock:
+                self._running[endpoint] -= 1
+            return endpoint
+
+        return run
+
+
+def test_requests_over_an_endpoints_limit_wait_for_its_slots() -> None:
+    scheduler = RequestScheduler(4, {"/limited": 2})
+    tracker = _ConcurrencyTracker()
+    endpoints = ["/limited"] * 6 + ["/other"] * 2
+
+    futures = [scheduler.submit(endpoint, tracker.request(endpoint)) for endpoint in endpoints]
+    results: List[object] = [future.result() for future in futures]
+    scheduler.shutdown()
+
+    assert results == endpoints
+    # The queued requests of the limited endpoint leave the other 2 workers to the other endpoint.
+    assert tracker.max_running == {"/limited": 2, "/other": 2}
+
+
+def test_shutdown_cancels_queued_requests() -> None:
+    scheduler = RequestScheduler(2, {"/limited": 1})
+    tracker = _ConcurrencyTracker()
+
+    running = scheduler.submit("/limited", tracker.request("/limited"))
+    queued = scheduler.submit("/limited", tracker.request("/limited"))
+    scheduler.shutdown()
+
+    assert running.result() == "/limited"
+    assert queued.cancelled()
+
+
+def test_max_concurrent_requests_per_endpoint_limits_the_requests_of_a_client(
+    stand_in_server: Callable[..., StandInServer], client_for: Callable[..., OpenExchangeClient]
+) -> None:
+    server = stand_in_server(latency=FixedLatency(0.05))
+    client = client_for(
+        server, max_concurrent_requests=8, max_concurrent_requests_per_endpoint={"/data/rental-comps": 2}
+    )
+
+    results = list(client.data.rental_comps.fetch(synthetic_addresses(20), max_addresses_per_request=2))
+
+    assert len(results) == 20
+    assert server.stats()["max_concurrent_requests"] == 2
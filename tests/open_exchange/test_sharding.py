@@ -0,0 +1,35 @@
+# Third-Party Libraries
+import pytest
+import requests
+
+# 1st Party Libraries
+from open_exchange.exceptions import OpenExchangeError
+from open_exchange.sharding import ShardedRunner
+from open_exchange.testing.loadtest import synthetic_addresses
+from open_exchange.testing.server import StandInServer
+
+API_KEY = "stand-in"
+
+
+def test_sharded_fetch_returns_a_result_per_address_in_order(server: StandInServer) -> None:
+    addresses = synthetic_addresses(45)
+
+    with ShardedRunner(num_processes=2, api_key=API_KEY, base_url=server.url) as runner:
+        results = list(runner.fetch("property_values", addresses, shard_size=10, max_addresses_per_request=5))
+
+    assert [result.token for result in results] == [address["token"] for address in addresses]
+    assert server.stats()["endpoints"]["/data/property-values"]["addresses"] == 45
+
+
+def test_missing_api_key_is_raised_before_starting_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OPEN_EXCHANGE_API_KEY", raising=False)
+
+    with pytest.raises(OpenExchangeError, match="API key is required"):
+        ShardedRunner(num_processes=1)
+
+
+def test_worker_errors_are_raised_by_fetch() -> None:
+    # Nothing listens on the port.
+    with ShardedRunner(num_processes=1, api_key=API_KEY, base_url="http://127.0.0.1:9") as runner:
+        with pytest.raises(requests.ConnectionError):
+            list(runner.fetch("property_values", synthetic_addresses(3)))